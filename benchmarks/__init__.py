@@ -0,0 +1,15 @@
+"""Performance benchmarks of the content loaders, run against synthetic content trees.
+
+Timings depend on the machine, so a baseline is only comparable with results of the same machine:
+record it on the reference revision, then compare a change with it, both on the machine running the
+comparison (from the repository root)::
+
+    git switch main && python -m benchmarks --update-baseline
+    git switch my-change && python -m benchmarks
+
+Results are written to `.cache/benchmarks/results.json`, and the baseline to
+`.cache/benchmarks/baseline.json` (none is committed). A benchmark is reported as a regression,
+and the command exits with 1, when its median timing is more than 25% slower than in the baseline
+(and by more than a millisecond). The `Benchmarks` workflow does this for every pull request, on
+the same runner, at the 10 and 1k scales (all scales when run manually). See `python -m benchmarks --help` for the options (scales, repetitions...).
+"""
@@ -0,0 +1,180 @@
+"""Benchmarked operations of the content loaders.
+
+Each benchmark prepares its state with `setup` before every repetition (e.g. clearing the caches it
+must not hit), then only `run` is timed. Skills benchmarks read the corpus through the paths of
+`src.skills`, relative to the current directory: they run from the root of the corpus.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from streamlit import config
+
+from libs.cms.common.assets import asset_store
+from libs.cms.common.content_cache import clear_content_caches
+from libs.cms.common.front_matter import document_cache
+from libs.cms.data.datasource import YamlDocumentLoader
+from libs.cms.documents.datasource import MarkdownDocument, MarkdownLoader
+from libs.cms.documents.datasource.markdown_file import body_cache
+from src.business.table_query import Filter
+from src.skills import get_skill_index, get_skill_info, get_skills_query, load_skills_data
+
+from .corpus import Corpus
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    name: str
+    setup: Callable[[Corpus], Any]
+    run: Callable[[Any], object]
+    description: str = ""
+
+
+def reset_caches() -> None:
+    """Forget everything loaded from a previous corpus."""
+
+    clear_content_caches()
+    document_cache.clear()
+    body_cache.clear()
+
+
+def _cold_loader(corpus: Corpus) -> MarkdownLoader:
+    document_cache.clear()
+    return MarkdownLoader(corpus.root / corpus.illustrated_dir)
+
+
+def _warm_loader(corpus: Corpus) -> MarkdownLoader:
+    loader = MarkdownLoader(corpus.root / corpus.illustrated_dir)
+    loader.load_all()
+    return loader
+
+
+def _plain_documents(corpus: Corpus) -> list[MarkdownDocument]:
+    body_cache.clear()
+    return MarkdownLoader(corpus.root / corpus.plain_dir).load_all()
+
+
+def _illustrated_documents(corpus: Corpus) -> list[MarkdownDocument]:
+    # As in production, local images are published to the asset store rather than inlined
+    config.set_option("server.enableStaticServing", True)
+    asset_store.inline = False
+    body_cache.clear()
+    return MarkdownLoader(corpus.root / corpus.illustrated_dir).load_all()
+
+
+def _read_contents(documents: list[MarkdownDocument]) -> int:
+    return sum(len(doc.content) for doc in documents)
+
+
+def _cold_skills(corpus: Corpus) -> None:
+    load_skills_data.clear()
+    for sidecar in (corpus.root / corpus.skills_path).parent.glob(f".{corpus.skills_path.name}.*.arrow"):
+        sidecar.unlink()
+
+
+def _warm_skills(corpus: Corpus) -> None:
+    load_skills_data()
+    load_skills_data.clear()
+
+
+def _unindexed_skills(corpus: Corpus) -> None:
+    load_skills_data()
+    get_skill_index.clear()
+
+
+def _skill_lookups(corpus: Corpus) -> list[str]:
+    get_skill_index()
+    # Names as written in documents, in another case, and unknown ones
+    names = corpus.skill_names
+    return names + [name.upper() for name in names[::2]] + [f"Unknown {i}" for i in range(len(names) // 10 + 1)]
+
+
+def _lookup_skills(names: list[str]) -> int:
+    return sum(get_skill_info(name) is not None for name in names)
+
+
+def _filter_combinations(corpus: Corpus) -> list[list[Filter]]:
+    get_skills_query.clear()
+    get_skills_query()
+    # Filters of the Skills page: the defaults, then a few user selections
+    since = Filter("is_greater_or_equal", "last_used_year", 2017)
+    return [
+        [since],
+        [since, Filter("is_equal", "in_industrial_context", True)],
+        [since, Filter("is_equal", "category", "MLOps")],
+        [since, Filter("is_match_str", "name", "skill 1")],
+        [Filter("is_greater_or_equal", "last_used_year", 2022), Filter("is_equal", "category", "Languages")],
+        [since, Filter("is_match_str", "name", "SKILL 1")],
+    ]
+
+
+def _run_filters(combinations: list[list[Filter]]) -> int:
+    query = get_skills_query()
+    return sum(query.run(filters).height for filters in combinations)
+
+
+BENCHMARKS: tuple[Benchmark, ...] = (
+    Benchmark(
+        "markdown.load_all",
+        _cold_loader,
+        lambda loader: loader.load_all(),
+        "parse the front matters of a folder",
+    ),
+    Benchmark(
+        "markdown.load_all.warm",
+        _warm_loader,
+        lambda loader: loader.load_all(),
+        "list a folder whose front matters are cached",
+    ),
+    Benchmark(
+        "markdown.content",
+        _plain_documents,
+        _read_contents,
+        "read the bodies of a folder",
+    ),
+    Benchmark(
+        "markdown.content.images",
+        _illustrated_documents,
+        _read_contents,
+        "read the bodies of a folder, rewriting their local images to asset store URLs",
+    ),
+    Benchmark(
+        "yaml.load",
+        lambda corpus: YamlDocumentLoader(corpus.root / corpus.publications_path),
+        lambda loader: loader.load(),
+        "parse the publications file",
+    ),
+    Benchmark(
+        "skills.load_skills_data",
+        _cold_skills,
+        lambda _: load_skills_data(),
+        "load the skills table from its CSV file",
+    ),
+    Benchmark(
+        "skills.load_skills_data.warm",
+        _warm_skills,
+        lambda _: load_skills_data(),
+        "load the skills table from its Arrow sidecar",
+    ),
+    Benchmark(
+        "skills.skill_index",
+        _unindexed_skills,
+        lambda _: get_skill_index(),
+        "index the skills table by name",
+    ),
+    Benchmark(
+        "skills.get_skill_info",
+        _skill_lookups,
+        _lookup_skills,
+        "look up every skill by name",
+    ),
+    Benchmark(
+        "skills.filter",
+        _filter_combinations,
+        _run_filters,
+        "filter the skills table as the Skills page does, without memoised results",
+    ),
+)
@@ -0,0 +1,157 @@
+"""Synthetic content trees, laid out like `content/`, at any scale."""
+
+from __future__ import annotations
+
+import csv
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+from PIL import Image
+
+_WORDS = [
+    "pipeline",
+    "model",
+    "deployment",
+    "cluster",
+    "latency",
+    "throughput",
+    "feature",
+    "dataset",
+    "training",
+    "inference",
+    "monitoring",
+    "registry",
+    "container",
+    "workflow",
+    "service",
+    "gateway",
+    "storage",
+    "schema",
+    "migration",
+    "quality",
+    "review",
+    "platform",
+    "experiment",
+    "tracking",
+    "orchestration",
+    "retrieval",
+    "embedding",
+    "vector",
+    "index",
+    "cache",
+    "snapshot",
+    "release",
+]
+_CATEGORIES = ("Languages", "DevOps", "MLOps", "Data & AI", "Cloud", "Soft skills")
+_PUBLICATION_CATEGORIES = ("Medium article", "Talk", "Podcast")
+_IMAGE_COUNT = 8
+
+
+@dataclass(frozen=True, slots=True)
+class Corpus:
+    """Paths of a generated content tree, relative to its root (e.g. the current directory)."""
+
+    root: Path
+    documents: int
+    illustrated_dir: Path = Path("content/experiences")
+    plain_dir: Path = Path("content/notes")
+    publications_path: Path = Path("content/publications.yaml")
+    skills_path: Path = Path("content/skills.csv")
+    skill_categories_path: Path = Path("content/skill_categories.yaml")
+    images_dir: Path = Path("content/assets/images")
+
+    @property
+    def skill_names(self) -> list[str]:
+        return [_skill_name(i) for i in range(self.documents)]
+
+
+def generate_corpus(root: Path, documents: int, seed: int = 0) -> Corpus:
+    """Write a content tree of `documents` Markdown documents per folder, publications and skills.
+
+    - `content/experiences`: documents with a front matter, skills and images in their body
+    - `content/notes`: the same documents, without images
+    - `content/publications.yaml` and `content/skills.csv`: `documents` items and rows
+    """
+
+    rng = random.Random(seed)
+    corpus = Corpus(root=root, documents=documents)
+
+    images_dir = root / corpus.images_dir
+    images_dir.mkdir(parents=True, exist_ok=True)
+    image_names = [f"image-{i}.png" for i in range(_IMAGE_COUNT)]
+    for i, name in enumerate(image_names):
+        Image.new("RGB", (64, 32), (i * 30 % 256, 120, 200)).save(images_dir / name)
+
+    for folder, illustrated in ((corpus.illustrated_dir, True), (corpus.plain_dir, False)):
+        (root / folder).mkdir(parents=True, exist_ok=True)
+        for i in range(documents):
+            doc_rng = random.Random(f"{seed}-{i}")
+            images = [f"../assets/images/{doc_rng.choice(image_names)}" for _ in range(2)] if illustrated else []
+            (root / folder / f"document-{i:05d}.md").write_text(_document(doc_rng, i, documents, images))
+
+    _write_yaml(root / corpus.publications_path, {"items": [_publication(rng, i) for i in range(documents)]})
+    _write_yaml(
+        root / corpus.skill_categories_path,
+        {"categories": {category: {"icon": "📌", "description": category} for category in _CATEGORIES}},
+    )
+    with open(root / corpus.skills_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "level", "last_used_year", "in_industrial_context", "link", "highlighted", "category"])
+        for i in range(documents):
+            writer.writerow(
+                [
+                    _skill_name(i),
+                    rng.randint(1, 5),
+                    rng.randint(2015, 2026),
+                    rng.choice(("true", "false")),
+                    f"https://example.com/skills/{i}" if rng.random() < 0.5 else "",
+                    "true" if rng.random() < 0.05 else "",
+                    rng.choice(_CATEGORIES),
+                ]
+            )
+
+    return corpus
+
+
+def _document(rng: random.Random, i: int, documents: int, images: list[str]) -> str:
+    front_matter = {
+        "title": f"Document {i}: {_sentence(rng, 4)}",
+        "description": _sentence(rng, 30),
+        "image": "content/assets/images/image-0.png",
+        "weight": rng.randint(0, 100),
+        "highlighted": rng.random() < 0.1,
+        "period": {"from": f"20{rng.randint(10, 25)}-0{rng.randint(1, 9)}-01", "format": "%Y-%m-%d"},
+        "skills": [
+            {"name": _skill_name(rng.randrange(documents)), "details": _sentence(rng, 12)}
+            for _ in range(rng.randint(3, 8))
+        ],
+    }
+    paragraphs = [_sentence(rng, 80) for _ in range(6)]
+    for position, image in enumerate(images):
+        paragraphs.insert(2 * position + 1, f"![Illustration {position}]({image})")
+    return f"---\n{yaml.safe_dump(front_matter, sort_keys=False)}---\n\n# Details\n\n" + "\n\n".join(paragraphs) + "\n"
+
+
+def _publication(rng: random.Random, i: int) -> dict[str, str]:
+    return {
+        "title": f"Publication {i}: {_sentence(rng, 6)}",
+        "description": _sentence(rng, 25),
+        "category": rng.choice(_PUBLICATION_CATEGORIES),
+        "date": f"20{rng.randint(15, 25)}-{rng.randint(1, 12):02d}",
+        "link": f"https://example.com/publications/{i}",
+    }
+
+
+def _skill_name(i: int) -> str:
+    return f"Skill {i}"
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(_WORDS, k=words)).capitalize() + "."
+
+
+def _write_yaml(path: Path, data: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True))
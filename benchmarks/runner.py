@@ -0,0 +1,198 @@
+"""Run the benchmarks on synthetic corpora, write their results as JSON and compare them with a baseline."""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from contextlib import chdir
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cases import Benchmark
+    from .corpus import Corpus
+
+FORMAT_VERSION = 1
+"""bump it whenever the layout of the results changes"""
+
+DEFAULT_SCALES = (10, 1_000, 10_000)
+DEFAULT_BASELINE_PATH = Path(".cache/benchmarks/baseline.json")
+DEFAULT_OUTPUT_PATH = Path(".cache/benchmarks/results.json")
+
+
+@dataclass(frozen=True, slots=True)
+class Measure:
+    """Timings of a benchmark at a scale, in seconds."""
+
+    benchmark: str
+    scale: int
+    repeat: int
+    min: float
+    median: float
+    mean: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.benchmark}[{self.scale}]"
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def is_regression(self, tolerance: float, min_delta: float) -> bool:
+        """Slower than the baseline by more than `tolerance` (a fraction) and `min_delta` seconds."""
+        return self.current > self.baseline * (1 + tolerance) and self.current - self.baseline > min_delta
+
+
+def run_benchmarks(
+    scales: Iterable[int], repeat: int = 5, only: Sequence[str] = (), root: Path | None = None
+) -> list[Measure]:
+    """Time every benchmark (or the ones whose name starts with one of `only`) at every scale.
+
+    Corpora are generated in a temporary directory, or under `root` (kept, one folder per scale).
+    """
+
+    # Never use a snapshot of the real content: the synthetic corpora are read from their files
+    os.environ["CMS_SNAPSHOT_PATH"] = os.devnull
+
+    from .cases import BENCHMARKS, reset_caches
+    from .corpus import generate_corpus
+
+    benchmarks = [b for b in BENCHMARKS if not only or b.name.startswith(tuple(only))]
+    measures: list[Measure] = []
+
+    for scale in scales:
+        with tempfile.TemporaryDirectory(prefix="cms-benchmarks-") as tmp:
+            corpus_root = (root or Path(tmp)) / f"corpus-{scale}"
+            corpus = generate_corpus(corpus_root, scale)
+            reset_caches()
+
+            with chdir(corpus_root):
+                for benchmark in benchmarks:
+                    timings = _time(benchmark, corpus, repeat)
+                    measure = Measure(
+                        benchmark=benchmark.name,
+                        scale=scale,
+                        repeat=repeat,
+                        min=min(timings),
+                        median=statistics.median(timings),
+                        mean=statistics.fmean(timings),
+                    )
+                    print(f"{measure.key:<40} {_format_duration(measure.median):>10}", file=sys.stderr)
+                    measures.append(measure)
+            reset_caches()
+
+    return measures
+
+
+def _time(benchmark: Benchmark, corpus: Corpus, repeat: int) -> list[float]:
+    # A first, untimed, run warms up imports and lazily initialized state
+    benchmark.run(benchmark.setup(corpus))
+
+    timings = []
+    for _ in range(repeat):
+        state = benchmark.setup(corpus)
+        gc.collect()
+        start = time.perf_counter()
+        benchmark.run(state)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def to_json(measures: Iterable[Measure]) -> dict[str, Any]:
+    return {
+        "format": FORMAT_VERSION,
+        "created": dt.datetime.now(dt.UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {measure.key: asdict(measure) for measure in measures},
+    }
+
+
+def write_results(path: Path, measures: Iterable[Measure]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(to_json(measures), indent=2) + "\n")
+
+
+def read_results(path: Path) -> dict[str, float]:
+    """Median timings of a results file, by benchmark key."""
+
+    content = json.loads(path.read_text())
+    if content.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results format in {path}: {content.get('format')}")
+    return {key: result["median"] for key, result in content["results"].items()}
+
+
+def compare(baseline: Mapping[str, float], measures: Iterable[Measure]) -> list[Comparison]:
+    """Comparisons of the measures having a baseline."""
+    return [
+        Comparison(key=measure.key, baseline=baseline[measure.key], current=measure.median)
+        for measure in measures
+        if measure.key in baseline
+    ]
+
+
+def _format_duration(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the content loaders on synthetic corpora.")
+    parser.add_argument("--scale", type=int, action="append", help="documents per corpus (default: 10, 1k and 10k)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--only", action="append", default=[], help="run the benchmarks whose name starts with it")
+    parser.add_argument("-o", "--output", type=Path, default=DEFAULT_OUTPUT_PATH)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, as a fraction")
+    parser.add_argument("--min-delta", type=float, default=1e-3, help="slowdowns under it (in seconds) are noise")
+    parser.add_argument("--corpus-dir", type=Path, default=None, help="keep the generated corpora in this folder")
+    args = parser.parse_args(argv)
+
+    measures = run_benchmarks(args.scale or DEFAULT_SCALES, repeat=args.repeat, only=args.only, root=args.corpus_dir)
+    write_results(args.output, measures)
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        write_results(args.baseline, measures)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline found at {args.baseline}")
+        return 0
+
+    regressions = 0
+    for comparison in compare(read_results(args.baseline), measures):
+        regression = comparison.is_regression(args.tolerance, args.min_delta)
+        regressions += regression
+        print(
+            f"{comparison.key:<40} {_format_duration(comparison.baseline):>10} -> "
+            f"{_format_duration(comparison.current):>10} ({comparison.ratio:.2f}x){'  REGRESSION' if regression else ''}"
+        )
+
+    if regressions:
+        print(f"{regressions} regression(s) over {args.tolerance:.0%} compared to {args.baseline}")
+        return 1
+    return 0
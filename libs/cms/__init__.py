@@ -1,4 +1,18 @@
-from .common.files import get_file_data
+from .common.files import file_payload, get_file_data
+from .metrics import MetricsRegistry, metrics, start_metrics_server
 from .navigation import DEFAULT_SECTION, Router, SectionName
+from .warmup import Readiness, WarmUpReport, readiness
 
-__all__ = ["Router", "DEFAULT_SECTION", "SectionName", "get_file_data"]
+__all__ = [
+    "Router",
+    "DEFAULT_SECTION",
+    "MetricsRegistry",
+    "Readiness",
+    "SectionName",
+    "WarmUpReport",
+    "file_payload",
+    "get_file_data",
+    "metrics",
+    "readiness",
+    "start_metrics_server",
+]
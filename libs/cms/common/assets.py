@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import mimetypes
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+import streamlit as st
+
+_STATIC_DIR = Path("static")
+_STATIC_URL = "app/static"
+
+# Extensions served with their own content type by Streamlit static file serving,
+# other files are served as plain text and can't be referenced as images.
+_SERVABLE_SUFFIXES = (".jpg", ".jpeg", ".png", ".gif", ".webp")
+
+type _Stamp = tuple[int, int]
+
+
+def to_data_uri(path: Path) -> str:
+    mime, _ = mimetypes.guess_type(path.name)
+    mime = mime or "image/png"
+    encoded = base64.b64encode(path.read_bytes()).decode("ascii")
+    return f"data:{mime};base64,{encoded}"
+
+
+class AssetStore:
+    """Content-addressed store of local files, published through Streamlit static file serving.
+
+    Each file is copied once under a name derived from its content hash, so its URL never changes
+    as long as the content doesn't. URLs carry a `v` query argument, which makes the static file
+    handler send long-lived caching headers.
+
+    Files are inlined as data URIs instead when `inline` is set (opt-in, also enabled by the
+    `CMS_INLINE_ASSETS` environment variable), when static file serving is disabled or when the file
+    type can't be served as is.
+    """
+
+    def __init__(
+        self,
+        directory: Path = _STATIC_DIR / "assets",
+        url_prefix: str = f"{_STATIC_URL}/assets",
+        inline: bool | None = None,
+    ) -> None:
+        self._directory = directory
+        self._url_prefix = url_prefix
+        self.inline = inline if inline is not None else os.environ.get("CMS_INLINE_ASSETS", "") in ("1", "true")
+
+        self._digests: dict[Path, tuple[_Stamp, str]] = {}
+        self._lock = threading.Lock()
+
+    def url_for(self, path: Path) -> str:
+        if self.inline or path.suffix.lower() not in _SERVABLE_SUFFIXES or not _is_static_serving_enabled():
+            return to_data_uri(path)
+
+        digest = self.publish(path)
+        return f"{self._url_prefix}/{digest}{path.suffix.lower()}?v={digest}"
+
+    def publish(self, path: Path) -> str:
+        """Copy the file into the store if it isn't there yet and return its content digest."""
+
+        digest = self.digest(path)
+        target = self._directory / f"{digest}{path.suffix.lower()}"
+        if target.exists():
+            return digest
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp, open(path, "rb") as src:
+            shutil.copyfileobj(src, tmp)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, target)
+
+        return digest
+
+    def digest(self, path: Path) -> str:
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = self._digests.get(path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()[:20]
+
+        self.put_digest(path, stamp, digest)
+
+        return digest
+
+    def put_digest(self, path: Path, stamp: tuple[int, int], digest: str) -> None:
+        """Register a known digest, valid as long as the file has the given (mtime_ns, size)."""
+        with self._lock:
+            self._digests[path] = (stamp, digest)
+
+
+def _is_static_serving_enabled() -> bool:
+    return bool(st.get_option("server.enableStaticServing"))
+
+
+asset_store = AssetStore()
@@ -0,0 +1,94 @@
+"""Process-wide cache for content loaders, an alternative to `st.cache_data` for immutable content.
+
+`st.cache_data` pickles the result once and unpickles a fresh copy of it on every call. Content
+loaders decorated with `content_cache` instead compute their result once per process and return the
+same instance to every session and rerun:
+
+- dicts and lists are frozen into read-only mappings and tuples, so that callers can't alter the
+  shared instance;
+- polars frames are returned as clones, which share the underlying Arrow buffers without copying
+  them;
+- other results (e.g. frozen dataclasses) are returned as is.
+
+Cached results stay valid until they are explicitly invalidated, with the `clear` method of a
+decorated function or with `clear_content_caches` for every one of them.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable
+from types import MappingProxyType
+from typing import Any
+
+import polars as pl
+
+from ..metrics import metrics
+
+_clear_hooks: list[Callable[[], None]] = []
+
+
+class CachedFunction[**P, R]:
+    """Content loader whose results are cached for the whole process, see `content_cache`."""
+
+    def __init__(self, func: Callable[P, R], maxsize: int | None) -> None:
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._name = getattr(func, "__name__", type(func).__name__)
+        self._cached = functools.lru_cache(maxsize=maxsize)(self._load)
+        _clear_hooks.append(self.clear)
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        if metrics.enabled:
+            result = self._call_measured(*args, **kwargs)
+        else:
+            result = self._cached(*args, **kwargs)
+        return result.clone() if isinstance(result, pl.DataFrame) else result
+
+    def clear(self) -> None:
+        self._cached.cache_clear()
+
+    def _load(self, *args: Any, **kwargs: Any) -> Any:
+        with metrics.timer("cms_loader_seconds", loader=self._name):
+            return _freeze(self._func(*args, **kwargs))
+
+    def _call_measured(self, *args: Any, **kwargs: Any) -> Any:
+        before = self._cached.cache_info()
+        result = self._cached(*args, **kwargs)
+        after = self._cached.cache_info()
+
+        if after.hits > before.hits:
+            metrics.record_cache(self._name, "hit")
+        else:
+            metrics.record_cache(self._name, "miss")
+            if after.currsize == before.currsize == after.maxsize:
+                metrics.record_cache(self._name, "eviction")
+        return result
+
+
+def content_cache[**P, R](maxsize: int | None = 256) -> Callable[[Callable[P, R]], CachedFunction[P, R]]:
+    """Cache the results of a content loader for the whole process, by arguments (LRU of `maxsize`).
+
+    Loaders returning dicts or lists should be annotated with `Mapping` and `Sequence` types, as
+    they are frozen.
+    """
+
+    def decorator(func: Callable[P, R]) -> CachedFunction[P, R]:
+        return CachedFunction(func, maxsize)
+
+    return decorator
+
+
+def clear_content_caches() -> None:
+    """Invalidate the results of every content loader, e.g. after the content changed on disk."""
+
+    for clear in _clear_hooks:
+        clear()
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
@@ -0,0 +1,239 @@
+"""Fast loading of the simple YAML used by front matters and data files.
+
+`safe_load` first tries a restricted parser covering the subset those files use: block mappings
+and sequences, plain, single and double quoted scalars on one line, literal block scalars (`|`,
+`|-`) and full-line comments. Plain scalars are only resolved when there is no doubt about the
+type PyYAML would give them (strings, decimal integers, booleans and nulls).
+
+Anything else (flow collections, anchors, tags, folded scalars, multi-line plain scalars, escape
+sequences, floats, dates, ...) is handed over to PyYAML, with its C-accelerated loader when
+available, so the result is always the one of `yaml.safe_load`.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from typing import Any, NamedTuple
+
+import yaml
+
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_NULLS = frozenset({"", "~", "null", "Null", "NULL"})
+_BOOLS = {
+    **dict.fromkeys(("yes", "Yes", "YES", "true", "True", "TRUE", "on", "On", "ON"), True),
+    **dict.fromkeys(("no", "No", "NO", "false", "False", "FALSE", "off", "Off", "OFF"), False),
+}
+
+_INT = re.compile(r"[-+]?(?:0|[1-9][0-9]*)")
+# Dates need a day to be resolved as timestamps: a year and a month is a string
+_YEAR_MONTH = re.compile(r"[0-9]{4}-[0-9]{1,2}")
+_KEY = re.compile(r"([A-Za-z_](?:[A-Za-z0-9_ &'./()+-]*[A-Za-z0-9_&'./()+-])?):(?: |$)")
+_BLOCK_HEADERS = {"|": False, "|-": True}
+
+# Characters that start something else than a plain string (indicators, numbers, dates, ...)
+_PLAIN_START_EXCLUDED = frozenset("-?:,[]{}#&*!|>'\"%@`<=.+~0123456789")
+# Anything else than line feeds and printable characters, without byte order marks and Unicode
+# line or paragraph separators, which PyYAML handles specially
+_UNSUPPORTED_CHARS = re.compile("[^\n\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd\U00010000-\U0010ffff]")
+
+
+class UnsupportedYamlError(ValueError):
+    """The document uses YAML features outside of the subset handled by `load_simple`."""
+
+
+class _Line(NamedTuple):
+    number: int
+    indent: int
+    content: str
+
+
+def safe_load(text: str) -> Any:
+    """Same result as `yaml.safe_load(text)`, faster on the simple documents this site uses."""
+
+    try:
+        return load_simple(text)
+    except UnsupportedYamlError:
+        # libyaml accepts tabs in places where PyYAML rejects them
+        return yaml.load(text, Loader=yaml.SafeLoader if "\t" in text else _SafeLoader)
+
+
+def load_simple(text: str) -> Any:
+    """Parse a document of the supported YAML subset, raise `UnsupportedYamlError` for anything else."""
+
+    return _Parser(text).parse()
+
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        if _UNSUPPORTED_CHARS.search(text):
+            raise UnsupportedYamlError("unsupported characters")
+
+        self._raw_lines = text.split("\n")
+        self._lines: list[_Line] = []
+        for number, raw in enumerate(self._raw_lines):
+            content = raw.lstrip(" ")
+            if not content or content.startswith("#"):
+                continue
+            if raw.startswith(("---", "...")):
+                raise UnsupportedYamlError("document markers")
+            self._lines.append(_Line(number, len(raw) - len(content), content.rstrip(" ")))
+        self._pos = 0
+
+    def parse(self) -> Any:
+        if not self._lines:
+            return None
+
+        first = self._peek()
+        if first.indent != 0:
+            raise UnsupportedYamlError("indented document")
+        result = self._parse_block(first.indent)
+        if self._peek() is not None:
+            raise UnsupportedYamlError("unexpected content")
+        return result
+
+    def _peek(self) -> _Line | None:
+        return self._lines[self._pos] if self._pos < len(self._lines) else None
+
+    def _parse_block(self, indent: int) -> list[Any] | dict[str, Any]:
+        line = self._peek()
+        if line is not None and _is_sequence_item(line.content):
+            return self._parse_sequence(indent)
+        return self._parse_mapping(indent)
+
+    def _parse_mapping(self, indent: int) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+
+        while (line := self._peek()) is not None and line.indent == indent and not _is_sequence_item(line.content):
+            match = _KEY.match(line.content)
+            if match is None:
+                raise UnsupportedYamlError(f"unsupported mapping entry on line {line.number + 1}")
+            # Keys repeat across documents: share a single string object for each
+            key = sys.intern(match.group(1))
+            if key in _NULLS or key in _BOOLS:
+                raise UnsupportedYamlError(f"non-string key on line {line.number + 1}")
+            rest = line.content[match.end() :].lstrip(" ")
+            self._pos += 1
+
+            if not rest:
+                result[key] = self._parse_nested(indent)
+            elif rest in _BLOCK_HEADERS:
+                result[key] = self._parse_literal(line.number, indent, strip=_BLOCK_HEADERS[rest])
+            else:
+                result[key] = _scalar(rest)
+                self._ensure_no_continuation(indent)
+
+        self._ensure_no_continuation(indent)
+        return result
+
+    def _parse_nested(self, indent: int) -> Any:
+        line = self._peek()
+        if line is None or line.indent < indent:
+            return None
+        if line.indent > indent:
+            return self._parse_block(line.indent)
+        if _is_sequence_item(line.content):
+            # Sequences may be at the same indentation as their parent key
+            return self._parse_sequence(indent)
+        return None
+
+    def _parse_sequence(self, indent: int) -> list[Any]:
+        result: list[Any] = []
+
+        while (line := self._peek()) is not None and line.indent == indent and _is_sequence_item(line.content):
+            rest = line.content[1:]
+            item = rest.lstrip(" ")
+            if not item or _is_sequence_item(item) or item[0] in "|>":
+                raise UnsupportedYamlError(f"unsupported sequence item on line {line.number + 1}")
+
+            if _KEY.match(item):
+                # Compact mapping: continue parsing with the item as a line indented at its key
+                self._lines[self._pos] = _Line(line.number, indent + 1 + len(rest) - len(item), item)
+                result.append(self._parse_mapping(self._lines[self._pos].indent))
+            else:
+                self._pos += 1
+                result.append(_scalar(item))
+                self._ensure_no_continuation(indent)
+
+        self._ensure_no_continuation(indent)
+        return result
+
+    def _parse_literal(self, number: int, indent: int, strip: bool) -> str:
+        """Literal block scalar whose header ends the line `number` of a node indented by `indent`."""
+
+        lines: list[str] = []
+        block_indent: int | None = None
+        last_content = -1
+
+        end = number + 1
+        while end < len(self._raw_lines):
+            raw = self._raw_lines[end]
+            content = raw.lstrip(" ")
+            current_indent = len(raw) - len(content)
+            if content:
+                if current_indent <= indent:
+                    break
+                if block_indent is None:
+                    block_indent = current_indent
+                elif current_indent < block_indent:
+                    raise UnsupportedYamlError(f"badly indented block scalar on line {end + 1}")
+                lines.append(raw[block_indent:])
+                last_content = end
+            else:
+                lines.append("")
+            end += 1
+
+        if block_indent is None:
+            block_indent = indent + 1
+        for raw in self._raw_lines[number + 1 : end]:
+            if not raw.strip(" ") and len(raw) > block_indent:
+                raise UnsupportedYamlError("whitespace-only line in block scalar")
+
+        # Skip the lines of the block scalar in the structural lines
+        while (line := self._peek()) is not None and line.number < end:
+            self._pos += 1
+
+        if last_content < 0:
+            return ""
+        text = "\n".join(lines[: last_content - number])
+        if not strip and last_content < len(self._raw_lines) - 1:
+            text += "\n"
+        return text
+
+    def _ensure_no_continuation(self, indent: int) -> None:
+        line = self._peek()
+        if line is not None and line.indent > indent:
+            raise UnsupportedYamlError(f"unexpected indentation on line {line.number + 1}")
+
+
+def _is_sequence_item(content: str) -> bool:
+    return content == "-" or content.startswith("- ")
+
+
+def _scalar(value: str) -> Any:
+    first = value[0]
+
+    if first == '"':
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != '"' or '"' in inner or "\\" in inner:
+            raise UnsupportedYamlError("unsupported double quoted scalar")
+        return inner
+
+    if first == "'":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != "'" or "'" in inner.replace("''", ""):
+            raise UnsupportedYamlError("unsupported single quoted scalar")
+        return inner.replace("''", "'")
+
+    if value in _BOOLS:
+        return _BOOLS[value]
+    if value in _NULLS:
+        return None
+    if _INT.fullmatch(value):
+        return int(value)
+    if _YEAR_MONTH.fullmatch(value):
+        return value
+    if first in _PLAIN_START_EXCLUDED or ": " in value or " #" in value or value.endswith(":"):
+        raise UnsupportedYamlError(f"ambiguous plain scalar: {value!r}")
+    return value
@@ -1,9 +1,105 @@
+"""Contents of local files, e.g. offered for download.
+
+`file_payload` gives a callable reading a file: passed as the `data` of `st.download_button`, the
+file is only read when a download is requested, not on every rerun. Small contents are kept in a
+bounded LRU cache (see `FilePayloadCache`), so its memory stays flat however many files are offered.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
+from typing import NamedTuple
+
+from ..metrics import metrics
+
+
+class _Entry(NamedTuple):
+    stamp: tuple[int, int]
+    data: bytes
+
+
+class FilePayloadCache:
+    """Bounded LRU cache of file contents, within a budget of `max_bytes`.
+
+    Contents are reused while their file is unchanged (by mtime and size). Files bigger than
+    `max_entry_bytes` are read on demand and not cached: each download of such a file holds its
+    whole content in memory (Streamlit only sends bytes) until the download is served.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, max_entry_bytes: int = 1024 * 1024) -> None:
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self._entries: OrderedDict[Path, _Entry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached contents, in bytes."""
+        return self._size
+
+    def get(self, path: Path | str) -> bytes:
+        path = Path(path)
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
 
-import streamlit as st
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(path)
+                metrics.record_cache("file_payloads", "hit")
+                return entry.data
+
+        metrics.record_cache("file_payloads", "miss")
+
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) <= self._max_entry_bytes:
+            self._put(path, _Entry((stat.st_mtime_ns, len(data)), data))
+
+        return data
+
+    def payload(self, path: Path | str) -> Callable[[], bytes]:
+        """Callable returning the content of a file, read (or taken from the cache) when called.
+
+        Calls are counted as downloads in the payload metrics, unlike other reads (e.g. warm-ups).
+        """
+        return partial(self._download, Path(path))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _download(self, path: Path) -> bytes:
+        data = self.get(path)
+        metrics.record_payload("download", data)
+        return data
+
+    def _put(self, path: Path, entry: _Entry) -> None:
+        with self._lock:
+            if (previous := self._entries.pop(path, None)) is not None:
+                self._size -= len(previous.data)
+            self._entries[path] = entry
+            self._size += len(entry.data)
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.data)
+                metrics.record_cache("file_payloads", "eviction")
+
+
+file_payloads = FilePayloadCache()
 
 
-@st.cache_resource(show_spinner=True)
 def get_file_data(path: str | Path) -> bytes:
-    with open(path, "rb") as f:
-        return f.read()
+    """Content of a file, see `FilePayloadCache`."""
+    return file_payloads.get(path)
+
+
+def file_payload(path: str | Path) -> Callable[[], bytes]:
+    """Deferred content of a file, e.g. for the `data` of `st.download_button`."""
+    return file_payloads.payload(path)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from . import fast_yaml
+
+_DELIMITER = b"---"
+
+DEFAULT_MAX_HEADER_BYTES = 64 * 1024
+
+type _Stamp = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class ParsedDocument:
+    path: Path
+
+    metadata: dict[str, Any]
+    """metadata read from the front matter, empty when there is none"""
+
+    body_offset: int
+    """offset, in bytes, of the first line following the front matter block"""
+
+    has_front_matter: bool = False
+    """whether the file starts with a front matter delimiter"""
+
+    is_closed: bool = False
+    """whether the front matter block has a closing delimiter"""
+
+    body_loader: Callable[[], bytes] | None = field(default=None, compare=False, repr=False)
+    """returns the raw body bytes when they are stored elsewhere than in the file, e.g. in a snapshot"""
+
+    def read_body(self) -> str:
+        """Read the document body, from disk starting at the recorded offset, or from `body_loader`.
+
+        When the file doesn't start with a front matter, the text is returned as is.
+        Otherwise, leading whitespaces and the trailing line break are trimmed.
+        """
+
+        if self.body_loader is not None:
+            body = _decode(self.body_loader())
+        else:
+            with open(self.path, "rb") as f:
+                f.seek(self.body_offset)
+                body = _decode(f.read())
+
+        if not self.has_front_matter:
+            return body
+
+        body = body.lstrip()
+        return body.removesuffix("\n")
+
+
+def read_front_matter(path: Path, max_header_bytes: int = DEFAULT_MAX_HEADER_BYTES) -> ParsedDocument:
+    """Read the YAML front matter of a Markdown file without loading its body.
+
+    The file is read line by line up to the closing delimiter. A front matter that isn't closed
+    within `max_header_bytes` is handled like a missing closing delimiter.
+    """
+
+    with open(path, "rb") as f:
+        return _parse_header(path, f, max_header_bytes)
+
+
+def _parse_header(path: Path, f: BinaryIO, max_header_bytes: int) -> ParsedDocument:
+    if not f.readline(max_header_bytes).startswith(_DELIMITER):
+        return ParsedDocument(path=path, metadata={}, body_offset=0)
+
+    header_start = f.tell()
+    lines: list[bytes] = []
+    while (remaining := max_header_bytes - f.tell()) > 0:
+        line = f.readline(remaining)
+        if not line:
+            break
+
+        if line.strip() == _DELIMITER:
+            header = _decode(b"".join(lines)).removesuffix("\n")
+            metadata: dict[str, Any] = fast_yaml.safe_load(header) or {}
+            return ParsedDocument(
+                path=path,
+                metadata=metadata,
+                body_offset=f.tell(),
+                has_front_matter=True,
+                is_closed=True,
+            )
+
+        lines.append(line)
+
+    return ParsedDocument(path=path, metadata={}, body_offset=header_start, has_front_matter=True)
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+class ParsedDocumentCache:
+    """Process-wide cache of Markdown front matters, keyed by path, modification time and size.
+
+    Only the front matter of each file is read and parsed, once; the entry is reused until the file
+    changes on disk. Bodies are read lazily, from the recorded offset.
+    """
+
+    def __init__(self, max_header_bytes: int = DEFAULT_MAX_HEADER_BYTES) -> None:
+        self._max_header_bytes = max_header_bytes
+        self._entries: dict[Path, tuple[_Stamp, ParsedDocument]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> ParsedDocument:
+        if (parsed := self._get_fresh(path)) is not None:
+            return parsed
+
+        parsed, stamp = _load(path, self._max_header_bytes)
+        self.put(parsed, stamp)
+
+        return parsed
+
+    def get_many(self, paths: Sequence[Path], workers: int = 1, processes: bool = False) -> list[ParsedDocument]:
+        """Same as `get` for several files, returned in the same order as `paths`.
+
+        With more than one worker, files are read by a pool of `workers` threads, which overlaps the
+        I/O latency of slow (e.g. network) volumes. With `processes`, the files which aren't cached
+        yet are parsed by a pool of `workers` processes instead, to spread the parsing over cores.
+        """
+
+        if workers <= 1 or len(paths) <= 1:
+            return [self.get(path) for path in paths]
+
+        if not processes:
+            with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+                return list(executor.map(self.get, paths))
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            cached = list(executor.map(self._get_fresh, paths))
+
+        loaded: dict[Path, ParsedDocument] = {}
+        if stale := [path for path, parsed in zip(paths, cached, strict=True) if parsed is None]:
+            load = partial(_load, max_header_bytes=self._max_header_bytes)
+            with ProcessPoolExecutor(max_workers=min(workers, len(stale)), mp_context=_process_context()) as executor:
+                for parsed, stamp in executor.map(load, stale, chunksize=max(1, len(stale) // (workers * 4))):
+                    self.put(parsed, stamp)
+                    loaded[parsed.path] = parsed
+
+        return [parsed if parsed is not None else loaded[path] for path, parsed in zip(paths, cached, strict=True)]
+
+    def put(self, parsed: ParsedDocument, stamp: tuple[int, int]) -> None:
+        """Register an already parsed document, valid as long as the file has the given (mtime_ns, size)."""
+        with self._lock:
+            self._entries[parsed.path] = (stamp, parsed)
+
+    def discard(self, path: Path) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get_fresh(self, path: Path) -> ParsedDocument | None:
+        stat = path.stat()
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == (stat.st_mtime_ns, stat.st_size):
+            return entry[1]
+        return None
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    # Forking a multi-threaded process (e.g. the Streamlit server) may deadlock the children
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def _load(path: Path, max_header_bytes: int) -> tuple[ParsedDocument, _Stamp]:
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        parsed = _parse_header(path, f, max_header_bytes)
+    return parsed, (stat.st_mtime_ns, stat.st_size)
+
+
+document_cache = ParsedDocumentCache()
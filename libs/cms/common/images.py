@@ -0,0 +1,106 @@
+"""Resized variants of local images, sized for the width they are displayed at.
+
+Variants are generated on first use and cached on disk, by source content hash. They can also be
+generated ahead of time, at build time::
+
+    python -m libs.cms.common.images content/assets/images --width 50 --width 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+from PIL import Image, UnidentifiedImageError
+
+from .assets import asset_store
+
+_CACHE_DIR = Path(".cache/images")
+_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+
+
+class ImageVariants:
+    """Generate and cache resized, recompressed (WebP) variants of local images.
+
+    A variant for a display width of `width` CSS pixels is `width * density` pixels wide, so it stays
+    sharp on high density screens. Images already narrower than that are used as is.
+    """
+
+    def __init__(self, cache_dir: Path = _CACHE_DIR, density: int = 2, quality: int = 85) -> None:
+        self._cache_dir = cache_dir
+        self._density = density
+        self._quality = quality
+        self._resolved: dict[tuple[Path, str, int], Path] = {}
+
+    def get(self, path: Path, width: int) -> Path:
+        """Path to the variant of the image for the given display width, the original if there is none."""
+
+        if path.suffix.lower() not in _SUFFIXES:
+            return path
+
+        pixels = width * self._density
+        digest = asset_store.digest(path)
+        if (resolved := self._resolved.get((path, digest, pixels))) is not None:
+            return resolved
+
+        target = self._cache_dir / f"{digest}-w{pixels}.webp"
+        if target.exists():
+            resolved = target
+        else:
+            try:
+                resolved = self._generate(path, target, pixels)
+            except (OSError, UnidentifiedImageError):
+                return path
+
+        self._resolved[(path, digest, pixels)] = resolved
+        return resolved
+
+    def _generate(self, path: Path, target: Path, pixels: int) -> Path:
+        with Image.open(path) as image:
+            if image.width <= pixels:
+                return path
+
+            height = max(1, round(image.height * pixels / image.width))
+            image = image.convert("RGBA") if image.mode in ("P", "LA") else image
+            resized = image.resize((pixels, height), Image.Resampling.LANCZOS)
+
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp:
+            resized.save(tmp, format="WEBP", quality=self._quality, method=6)
+
+        if os.path.getsize(tmp_name) >= path.stat().st_size:
+            os.unlink(tmp_name)
+            return path
+
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, target)
+        return target
+
+
+image_variants = ImageVariants()
+
+
+def image_variant(path: Path | str, width: int) -> Path:
+    """Path to the image variant best suited to display `path` at `width` CSS pixels."""
+    return image_variants.get(Path(path), width)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate resized variants of the images of a folder.")
+    parser.add_argument("folder", type=Path)
+    parser.add_argument("--width", type=int, action="append", required=True, help="display width, in CSS pixels")
+    args = parser.parse_args(argv)
+
+    for path in sorted(args.folder.iterdir()):
+        for width in args.width:
+            variant = image_variant(path, width)
+            if variant != path:
+                print(f"{path} ({width}px) -> {variant}")
+
+
+if __name__ == "__main__":
+    main()
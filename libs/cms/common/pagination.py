@@ -0,0 +1,39 @@
+"""Incremental ("load more") display of long lists.
+
+Only the first items of a list are rendered; a button reveals the next page. The number of visible
+items is kept in the session state, under a key specific to the list.
+"""
+
+import streamlit as st
+
+
+def visible_count(key: str, page_size: int | None, total: int, min_count: int = 0) -> int:
+    """Number of items of the list to render, at least `min_count` (e.g. to keep an item visible)."""
+
+    if page_size is None:
+        return total
+
+    count = max(st.session_state.get(key, page_size), min_count)
+    st.session_state[key] = count
+    return min(count, total)
+
+
+def load_more_button(key: str, page_size: int | None, total: int) -> None:
+    """Button revealing the next page of the list, rendered only when some items are hidden."""
+
+    if page_size is None or (shown := min(st.session_state.get(key, page_size), total)) >= total:
+        return
+
+    with st.container(horizontal_alignment="center"):
+        st.button(
+            f"Load more ({total - shown} remaining)",
+            key=f"{key}_load_more",
+            type="tertiary",
+            icon=":material/expand_more:",
+            on_click=_show_more,
+            args=(key, page_size),
+        )
+
+
+def _show_more(key: str, page_size: int) -> None:
+    st.session_state[key] = st.session_state.get(key, page_size) + page_size
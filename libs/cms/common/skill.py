@@ -5,7 +5,7 @@ from dataclasses import dataclass
 SkillLevel = namedtuple("SkillLevel", ["level", "label",  "description", "examples"])
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Skill:
     name: str
     """skill's name acts as a unique identifier"""
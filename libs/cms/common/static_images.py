@@ -0,0 +1,149 @@
+"""Images displayed on every rerun (logos, icons, card images), loaded once per process.
+
+`static_image` prepares an image for its display width on first use, and hands out the same
+`StaticImage` afterwards: a rerun displaying it does no filesystem access at all, not even a `stat`.
+Images are expected not to change while the app is running; use `StaticImages.clear` (or restart)
+after replacing one.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import mimetypes
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image
+
+from ..metrics import metrics
+from .images import ImageVariants, image_variants
+
+# Images up to this size (e.g. icons) are referenced with a data URI, which Streamlit passes to the
+# browser as is. Bigger ones would weigh on every rerun that displays them, and the browser can't
+# cache them: they are handed out as bytes, served by the media file manager from a content-hashed URL.
+_INLINE_MAX_BYTES = 512
+
+
+@dataclass(frozen=True, slots=True)
+class StaticImage:
+    """Content of an image, and the reference to pass to `st.image`, `st.logo` or `st.set_page_config`.
+
+    - `path`: file the content was read from (the resized variant, or the original image)
+    - `data`: content handed out, in `mime_type`
+    - `digest`: content hash, stable as long as the content doesn't change
+    - `source`: data URI of the image, or its content if it is too big to be inlined. The content is
+      then a PNG (with transparency) or JPEG at most as wide as the display width, which Streamlit
+      serves as is, without decoding and re-encoding it on every rerun.
+    """
+
+    path: Path
+    data: bytes
+    mime_type: str
+    digest: str
+    source: str | bytes
+
+
+class StaticImages:
+    """Process-wide registry of the images displayed on every rerun, by source path and display width."""
+
+    def __init__(self, variants: ImageVariants | None = None, inline_max_bytes: int = _INLINE_MAX_BYTES) -> None:
+        self._variants = variants or image_variants
+        self._inline_max_bytes = inline_max_bytes
+        self._images: dict[tuple[Path, int | None], StaticImage] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def get(self, path: Path | str, width: int | None = None) -> StaticImage:
+        """Image to display at `width` CSS pixels (resized for it), or at its own size if `width` is None."""
+
+        image = self.load(path, width)
+        metrics.record_payload("image", image.source)
+        return image
+
+    def load(self, path: Path | str, width: int | None = None) -> StaticImage:
+        """Same as `get`, without counting the image in the payload metrics, e.g. to load it ahead of display."""
+
+        key = (Path(path), width)
+        if (image := self._images.get(key)) is None:
+            metrics.record_cache("static_images", "miss")
+            image = self._load(*key)
+            with self._lock:
+                image = self._images.setdefault(key, image)
+        else:
+            metrics.record_cache("static_images", "hit")
+
+        return image
+
+    def preload(self, images: Iterable[tuple[Path | str, int | None]]) -> None:
+        """Load images ahead of their first display, e.g. at startup, from (path, width) pairs."""
+
+        for path, width in images:
+            self.load(path, width)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+
+    def _load(self, path: Path, width: int | None) -> StaticImage:
+        source_path = self._variants.get(path, width) if width is not None else path
+        source: str | bytes
+        if source_path.stat().st_size <= self._inline_max_bytes:
+            data = source_path.read_bytes()
+            mime_type = mimetypes.guess_type(source_path.name)[0] or "image/png"
+            source = f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+        else:
+            source_path = path
+            data, mime_type = _servable(path.read_bytes(), width)
+            source = data
+
+        return StaticImage(
+            path=source_path,
+            data=data,
+            mime_type=mime_type,
+            digest=hashlib.sha256(data).hexdigest()[:20],
+            source=source,
+        )
+
+
+def _servable(data: bytes, width: int | None) -> tuple[bytes, str]:
+    """Image in the format and size Streamlit serves as is: PNG when it may have transparency (GIF
+    kept), JPEG otherwise, at most `width` pixels wide; with its MIME type."""
+
+    with Image.open(io.BytesIO(data)) as image:
+        if image.format == "GIF":
+            return data, "image/gif"
+
+        image_format = "PNG" if image.mode in ("RGBA", "LA", "P") else "JPEG"
+        if image.format == image_format and (width is None or image.width <= width):
+            return data, f"image/{image_format.lower()}"
+
+        if width is not None and image.width > width:
+            image = image.convert("RGBA") if image.mode in ("P", "LA") else image
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+
+        output = io.BytesIO()
+        if image_format == "PNG":
+            image.save(output, format="PNG", optimize=True)
+        else:
+            image.convert("RGB").save(output, format="JPEG", quality=90, optimize=True)
+        return output.getvalue(), f"image/{image_format.lower()}"
+
+
+static_images = StaticImages()
+
+
+def static_image(path: Path | str, width: int | None = None) -> StaticImage:
+    """Image to display on every rerun, see `StaticImages`."""
+    return static_images.get(path, width)
+
+
+def preload_static_image(path: Path | str, width: int | None = None) -> None:
+    """Load an image ahead of its first display (e.g. during the warm-up), see `StaticImages`."""
+    static_images.load(path, width)
@@ -2,7 +2,7 @@ import datetime as dt
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimePeriod:
     start: dt.datetime | None
     end: dt.datetime | None
@@ -1,3 +1,4 @@
+from .csv_file import CsvTableLoader
 from .yaml_file import Item, YamlDocumentLoader
 
-__all__ = ["YamlDocumentLoader", "Item"]
+__all__ = ["CsvTableLoader", "Item", "YamlDocumentLoader"]
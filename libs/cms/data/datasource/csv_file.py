@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+
+import polars as pl
+
+from ...snapshot import read_csv
+
+
+class CsvTableLoader:
+    """Load a CSV table (with a header), typed and sorted, through a columnar sidecar file.
+
+    The typed and sorted table is stored as an uncompressed Arrow IPC file next to the CSV, named
+    after a hash of the loading options and the modification time and size of the CSV, and
+    memory-mapped on the following loads: finding it takes a `stat`, whatever the size of the CSV.
+    The sidecar is regenerated when the CSV changes, and the stale one removed. When it can't be
+    written (e.g. read-only content folder), the CSV is read on every load.
+
+    The sidecar holds the result of this loader (cast and sorted), while the content snapshot holds
+    the raw table of the CSV (see `libs.cms.snapshot.read_csv`). The sidecar is built from the
+    snapshot table when it is up to date, so the CSV is parsed at most once, at build time.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        dtypes: Mapping[str, pl.DataType | type[pl.DataType]] | None = None,
+        sort_by: str | None = None,
+        descending: bool = False,
+    ) -> None:
+        self._path = Path(path)
+
+        if not self._path.exists():
+            raise ValueError(f"File not found: {self._path}")
+
+        self._dtypes = dict(dtypes or {})
+        self._sort_by = sort_by
+        self._descending = descending
+
+    def load(self) -> pl.DataFrame:
+        sidecar = self._sidecar_path()
+        if sidecar.exists():
+            return pl.read_ipc(sidecar, memory_map=True)
+
+        table = read_csv(self._path)
+        if self._dtypes:
+            table = table.cast(self._dtypes)
+        if self._sort_by:
+            table = table.sort(self._sort_by, descending=self._descending)
+
+        try:
+            self._write_sidecar(table, sidecar)
+        except OSError:
+            pass
+
+        return table
+
+    def _sidecar_path(self) -> Path:
+        stat = self._path.stat()
+        return self._path.with_name(f"{self._sidecar_prefix()}{stat.st_mtime_ns}-{stat.st_size}.arrow")
+
+    def _sidecar_prefix(self) -> str:
+        """Common name start of the sidecars of the file loaded with these options."""
+
+        options = repr(
+            (sorted((name, repr(dtype)) for name, dtype in self._dtypes.items()), self._sort_by, self._descending)
+        )
+        return f".{self._path.name}.{hashlib.sha256(options.encode()).hexdigest()[:8]}."
+
+    def _write_sidecar(self, table: pl.DataFrame, sidecar: Path) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=sidecar.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                table.write_ipc(tmp, compression="uncompressed")
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, sidecar)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+        for stale in sidecar.parent.glob(f"{self._sidecar_prefix()}*.arrow"):
+            if stale != sidecar:
+                stale.unlink(missing_ok=True)
@@ -1,13 +1,14 @@
 import datetime as dt
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
+from ...snapshot import read_yaml
 
 _DEFAULT_DATE_FMT = "%Y-%m"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Item:
     title: str
     link: str
@@ -24,7 +25,7 @@ class YamlDocumentLoader:
             raise ValueError(f"File not found: {self._path}")
 
     def load(self) -> list[Item]:
-        content: dict = yaml.safe_load(self._path.read_text())
+        content: dict = read_yaml(self._path)
         raw_items = []
         if isinstance(content, list):
             raw_items = content
@@ -41,7 +42,7 @@ class YamlDocumentLoader:
                     title=ri["title"],
                     link=ri["link"],
                     description=ri.get("description", ""),
-                    category=ri.get("category", ""),
+                    category=sys.intern(category) if (category := ri.get("category", "")) else category,
                     date=date,
                 )
             )
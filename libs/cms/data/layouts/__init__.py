@@ -1,3 +1,3 @@
-from .cards import cards_layout
+from .cards import cards_layout, cards_requirements
 
-__all__ = ["cards_layout"]
+__all__ = ["cards_layout", "cards_requirements"]
@@ -1,16 +1,27 @@
 import datetime as dt
+from collections.abc import Sequence
+from functools import partial
 from pathlib import Path
 
 import streamlit as st
 
+from ...common.content_cache import content_cache
+from ...common.pagination import load_more_button, visible_count
+from ...metrics import metrics
+from ...warmup import Requirement
 from ..datasource import Item, YamlDocumentLoader
 
 
-@st.cache_data
-def load_items(path: Path | str) -> list[Item]:
+@content_cache()
+def load_items(path: Path | str) -> Sequence[Item]:
     return YamlDocumentLoader(path).load()
 
 
+@content_cache()
+def load_sorted_items(path: Path | str) -> Sequence[Item]:
+    return sorted(load_items(path), key=lambda item: item.date or dt.datetime.min, reverse=True)
+
+
 def _render_card(item: Item) -> None:
     with st.container(border=True):
         st.subheader(item.title)
@@ -35,14 +46,28 @@ def _render_card(item: Item) -> None:
             st.link_button("View :material/open_in_new:", item.link, type="primary")
 
 
-def cards_layout(title: str, path: Path | str) -> None:
+@metrics.timed("cms_render_seconds", kind="layout", name="cards_layout")
+def cards_layout(title: str, path: Path | str, page_size: int | None = None) -> None:
+    """Cards of the items of a YAML file, most recent first.
+
+    With `page_size`, only the first `page_size` cards are rendered, followed by a "load more" button.
+    """
+
     st.title(title)
 
-    items = load_items(path)
+    items = load_sorted_items(path)
 
     if len(items) == 0:
         st.write("Nothing to show here... yet...")
         return
 
-    for item in sorted(items, key=lambda item: item.date or dt.datetime.min, reverse=True):
+    pagination_key = f"cards_layout_{path}"
+    for item in items[: visible_count(pagination_key, page_size, len(items))]:
         _render_card(item)
+
+    load_more_button(pagination_key, page_size, len(items))
+
+
+def cards_requirements(path: Path | str) -> tuple[Requirement, ...]:
+    """What `cards_layout` needs to render the items of a YAML file, see `libs.cms.warmup`."""
+    return (partial(load_sorted_items, path),)
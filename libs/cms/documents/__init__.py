@@ -1,3 +1,3 @@
-from .datasource import load_documents, load_highlighted_documents
+from .datasource import load_documents, load_documents_with_skill, load_highlighted_documents
 
-__all__ = ["load_documents", "load_highlighted_documents"]
+__all__ = ["load_documents", "load_documents_with_skill", "load_highlighted_documents"]
@@ -1,3 +1,20 @@
-from .markdown_file import MarkdownDocument, MarkdownLoader, load_documents, load_highlighted_documents
+from .directory_index import (
+    DirectoryIndex,
+    load_documents,
+    load_documents_with_skill,
+    load_highlighted_documents,
+    load_sorted_documents,
+)
+from .markdown_file import MarkdownDocument, MarkdownLoader
+from .skill_references import SkillReferences
 
-__all__ = ["MarkdownDocument", "MarkdownLoader", "load_documents", "load_highlighted_documents"]
+__all__ = [
+    "DirectoryIndex",
+    "MarkdownDocument",
+    "MarkdownLoader",
+    "SkillReferences",
+    "load_documents",
+    "load_documents_with_skill",
+    "load_highlighted_documents",
+    "load_sorted_documents",
+]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from operator import attrgetter
+from pathlib import Path
+
+import streamlit as st
+
+from ...common.front_matter import ParsedDocumentCache, document_cache
+from ...metrics import metrics
+from ...snapshot import load_snapshot
+from .markdown_file import MarkdownDocument
+from .skill_references import SkillReferences
+
+type _Stamp = tuple[int, int]
+
+
+class DirectoryIndex:
+    """Incrementally maintained list of the Markdown documents of a folder.
+
+    Each refresh stats the folder: only new or modified files (by mtime and size) are parsed again,
+    deleted files are dropped and every other document is kept as is. New and modified files are
+    parsed by `workers` threads (or processes, with `processes`), see `ParsedDocumentCache.get_many`.
+
+    The documents using each skill are indexed along the way, see `documents_with_skill`.
+    """
+
+    def __init__(
+        self,
+        dir_path: Path | str,
+        cache: ParsedDocumentCache | None = None,
+        refresh_interval: float = 1.0,
+        workers: int = 1,
+        processes: bool = False,
+    ) -> None:
+        if isinstance(dir_path, str):
+            dir_path = Path(dir_path)
+        if not dir_path.is_dir():
+            raise ValueError(f"Directory not found: {dir_path}")
+
+        self._dir_path = dir_path
+        self._cache = cache or document_cache
+        self._refresh_interval = refresh_interval
+        self._workers = workers
+        self._processes = processes
+
+        self._entries: dict[Path, tuple[_Stamp, MarkdownDocument]] = {}
+        self._documents: tuple[MarkdownDocument, ...] = ()
+        self._highlighted: tuple[MarkdownDocument, ...] = ()
+        self._orderings: dict[tuple[str, bool], tuple[MarkdownDocument, ...]] = {}
+        self._skill_references = SkillReferences()
+        self._version = 0
+        self._last_refresh: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """Incremented each time a refresh adds, updates or removes a document."""
+        return self._version
+
+    def documents(self) -> tuple[MarkdownDocument, ...]:
+        """Documents of the folder, sorted by path, refreshed at most once per `refresh_interval` seconds.
+
+        The same tuple is returned until the folder changes.
+        """
+
+        self._refresh_if_due()
+        return self._documents
+
+    def documents_by(self, attribute: str, reverse: bool = False) -> tuple[MarkdownDocument, ...]:
+        """Documents of the folder sorted by one of their attributes, then by path.
+
+        Each ordering is computed once and reused until the folder changes.
+        """
+
+        self._refresh_if_due()
+        documents = self._documents
+        ordering = self._orderings.get((attribute, reverse))
+        if ordering is None:
+            ordering = tuple(sorted(documents, key=attrgetter(attribute), reverse=reverse))
+            with self._lock:
+                if documents is self._documents:
+                    self._orderings[(attribute, reverse)] = ordering
+        return ordering
+
+    def highlighted_documents(self) -> tuple[MarkdownDocument, ...]:
+        """Highlighted documents of the folder, sorted by path, see `documents`."""
+
+        self._refresh_if_due()
+        return self._highlighted
+
+    def documents_with_skill(self, skill_name: str) -> tuple[MarkdownDocument, ...]:
+        """Documents of the folder using a skill (case-insensitive), sorted by path, see `documents`."""
+
+        self._refresh_if_due()
+        return self._skill_references.documents(skill_name)
+
+    def _refresh_if_due(self) -> None:
+        if self._last_refresh is None or time.monotonic() - self._last_refresh >= self._refresh_interval:
+            self.refresh()
+
+    def refresh(self) -> bool:
+        """Synchronize the index with the folder content and tell whether anything changed."""
+
+        with self._lock, metrics.timer("cms_loader_seconds", loader="DirectoryIndex.refresh"):
+            seen: set[Path] = set()
+            stale: list[tuple[Path, _Stamp]] = []
+
+            with os.scandir(self._dir_path) as it:
+                for entry in it:
+                    # Hidden files are editor swap files, macOS resource forks (`._*.md`)...
+                    if entry.name.startswith(".") or not entry.name.endswith(".md") or not entry.is_file():
+                        continue
+
+                    path = self._dir_path / entry.name
+                    seen.add(path)
+                    stat = entry.stat()
+                    stamp = (stat.st_mtime_ns, stat.st_size)
+
+                    current = self._entries.get(path)
+                    if current is None or current[0] != stamp:
+                        stale.append((path, stamp))
+
+            changed = bool(stale)
+            parsed_docs = self._cache.get_many(
+                [path for path, _ in stale], workers=self._workers, processes=self._processes
+            )
+            for (path, stamp), parsed in zip(stale, parsed_docs, strict=True):
+                if (previous := self._entries.get(path)) is not None:
+                    self._skill_references.remove(previous[1])
+                doc = MarkdownDocument.from_metadata(path, parsed.metadata, self._cache)
+                self._entries[path] = (stamp, doc)
+                self._skill_references.add(doc)
+
+            for path in self._entries.keys() - seen:
+                _, doc = self._entries.pop(path)
+                self._skill_references.remove(doc)
+                self._cache.discard(path)
+                changed = True
+
+            if changed:
+                self._documents = tuple(self._entries[path][1] for path in sorted(self._entries))
+                self._highlighted = tuple(doc for doc in self._documents if doc.highlighted)
+                self._orderings = {}
+                self._version += 1
+
+            self._last_refresh = time.monotonic()
+
+            return changed
+
+
+@st.cache_resource(show_spinner=False)
+def get_directory_index(dir_path: Path | str) -> DirectoryIndex:
+    """Shared index of a folder; `CMS_LOAD_WORKERS` sets the number of threads parsing its documents."""
+
+    load_snapshot()
+    return DirectoryIndex(dir_path, workers=int(os.environ.get("CMS_LOAD_WORKERS", "1")))
+
+
+def load_documents(dir_path: Path | str) -> tuple[MarkdownDocument, ...]:
+    return get_directory_index(dir_path).documents()
+
+
+def load_sorted_documents(dir_path: Path | str, attribute: str, reverse: bool = False) -> tuple[MarkdownDocument, ...]:
+    return get_directory_index(dir_path).documents_by(attribute, reverse=reverse)
+
+
+def load_highlighted_documents(dir_path: Path | str) -> tuple[MarkdownDocument, ...]:
+    return get_directory_index(dir_path).highlighted_documents()
+
+
+def load_documents_with_skill(dir_path: Path | str, skill_name: str) -> tuple[MarkdownDocument, ...]:
+    return get_directory_index(dir_path).documents_with_skill(skill_name)
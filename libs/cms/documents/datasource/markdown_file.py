@@ -1,44 +1,95 @@
 from __future__ import annotations
 
-import base64
 import datetime as dt
-import mimetypes
 import re
+import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import streamlit as st
-import yaml
-
 from ...common import Skill, TimePeriod
+from ...common.assets import asset_store
+from ...common.front_matter import ParsedDocumentCache, document_cache
+from ...metrics import metrics
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Download:
     path: Path
     title: str
 
 
-@dataclass
+class _BodyKey:
+    """Identity of a document in the body cache: it holds no reference to the document or its body."""
+
+    __slots__ = ()
+
+
+class BodyCache:
+    """Bounded LRU cache of rendered document bodies.
+
+    Documents only hold a key into this cache, so lists of documents don't keep every body they
+    ever displayed alive: at most `maxsize` bodies are kept, the least recently used are dropped and
+    read again from disk (or the snapshot) on their next use.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._bodies: OrderedDict[_BodyKey, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _BodyKey) -> str | None:
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+        metrics.record_cache("document_bodies", "hit" if body is not None else "miss")
+        return body
+
+    def put(self, key: _BodyKey, body: str) -> None:
+        with self._lock:
+            self._bodies[key] = body
+            self._bodies.move_to_end(key)
+            while len(self._bodies) > self._maxsize:
+                self._bodies.popitem(last=False)
+                metrics.record_cache("document_bodies", "eviction")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bodies.clear()
+
+
+body_cache = BodyCache()
+
+
+@dataclass(frozen=True, slots=True)
 class MarkdownDocument:
     path: Path
     title: str
     icon: str | None = None
     description: str | None = None
-    metadata: dict[str, str] = field(default_factory=dict)
+    metadata: dict[str, str] = field(default_factory=dict, hash=False)
     section: str | None = None
-    skills: list[Skill] = field(default_factory=list)
+    skills: tuple[Skill, ...] = ()
     weight: int = 0
     period: TimePeriod | None = None
     image_path: Path | None = None
     highlighted: bool = False
-    downloads: list[Download] = field(default_factory=list)
+    downloads: tuple[Download, ...] = ()
 
-    _content: str | None = None
+    _body_key: _BodyKey = field(default_factory=_BodyKey, init=False, repr=False, compare=False, hash=False)
+    _parsed_cache: ParsedDocumentCache = field(
+        default=document_cache, init=False, repr=False, compare=False, hash=False
+    )
 
     @classmethod
-    def from_metadata(cls, path: Path, doc_metadata: dict[str, Any]) -> MarkdownDocument:
+    def from_metadata(
+        cls, path: Path, doc_metadata: dict[str, Any], cache: ParsedDocumentCache | None = None
+    ) -> MarkdownDocument:
+        """Document of a front matter; its body is read through `cache` (the shared `document_cache` by default)."""
+
         skills: list[dict[str, str]] = doc_metadata.get("skills", [])
 
         tp = None
@@ -55,50 +106,58 @@ class MarkdownDocument:
             path=path,
             title=doc_metadata.get("title", path.stem.replace("-", " ").title()),
             metadata=doc_metadata.get("metadata", {}),
-            section=doc_metadata.get("section"),
-            icon=doc_metadata.get("icon"),
+            section=sys.intern(section) if (section := doc_metadata.get("section")) else section,
+            icon=sys.intern(icon) if (icon := doc_metadata.get("icon")) else icon,
             description=doc_metadata.get("description"),
-            skills=[Skill(name=s["name"], details=s.get("details")) for s in skills],
+            skills=tuple(Skill(name=sys.intern(s["name"]), details=s.get("details")) for s in skills),
             weight=int(doc_metadata.get("weight", 0)),
             period=tp,
             image_path=image_path,
             highlighted=doc_metadata.get("highlighted", False),
-            downloads=[Download(path=Path(d["path"]), title=d["title"]) for d in doc_metadata.get("downloads", [])],
+            downloads=tuple(
+                Download(path=Path(d["path"]), title=d["title"]) for d in doc_metadata.get("downloads", [])
+            ),
         )
+        if cache is not None:
+            object.__setattr__(doc, "_parsed_cache", cache)
 
         return doc
 
+    def read_body(self) -> str:
+        """Markdown body of the document as written, read from the cache the document was parsed from."""
+        return self._parsed_cache.get(self.path).read_body()
+
     @property
     def content(self) -> str:
-        if self._content is not None:
-            return self._content
+        """Body of the document, read on first use and kept in the shared `body_cache`.
 
-        content = self.path.read_text(encoding="utf-8")
-        if not content.startswith("---"):
-            self._content = content
-            return content
+        Local images are pointed to their published asset URL, see `read_body` for the body as written.
+        """
 
-        lines = content.splitlines()[1:]
+        if (content := body_cache.get(self._body_key)) is not None:
+            return content
 
-        body_start_idx = next((i for i, line in enumerate(lines) if line.strip() == "---"), None)
+        parsed = self._parsed_cache.get(self.path)
+        content = parsed.read_body()
+        if not parsed.has_front_matter:
+            body_cache.put(self._body_key, content)
+            return content
 
-        if body_start_idx is None:
-            content = "\n".join(lines).lstrip()
+        if not parsed.is_closed:
             return content
 
-        content = "\n".join(lines[body_start_idx + 1 :]).lstrip()
-        content = self._embed_local_images(content) if content else ""
+        content = self._rewrite_local_images(content) if content else ""
 
-        self._content = content
+        body_cache.put(self._body_key, content)
 
         return content
 
-    def _embed_local_images(self, md: str) -> str:
-        """Inline local image references as data URIs so Streamlit can render them."""
+    def _rewrite_local_images(self, md: str) -> str:
+        """Point local image references to their published asset URL so Streamlit can render them."""
 
         doc_dir = self.path.parent
 
-        def to_data_uri(url: str) -> str | None:
+        def to_asset_url(url: str) -> str | None:
             if re.match(r"^[a-zA-Z][a-zA-Z0-9+.-]*://", url) or url.startswith("data:"):
                 return None
 
@@ -106,24 +165,21 @@ class MarkdownDocument:
             if not img_path.exists() or not img_path.is_file():
                 return None
 
-            mime, _ = mimetypes.guess_type(img_path.name)
-            mime = mime or "image/png"
-            encoded = base64.b64encode(img_path.read_bytes()).decode("ascii")
-            return f"data:{mime};base64,{encoded}"
+            return asset_store.url_for(img_path)
 
         def markdown_repl(match: re.Match[str]) -> str:
             alt_text, url = match.group(1), match.group(2).strip()
-            data_uri = to_data_uri(url)
-            if not data_uri:
+            asset_url = to_asset_url(url)
+            if not asset_url:
                 return match.group(0)
-            return f"![{alt_text}]({data_uri})"
+            return f"![{alt_text}]({asset_url})"
 
         def html_repl(match: re.Match[str]) -> str:
             before, url, after = match.group(1), match.group(2).strip(), match.group(3)
-            data_uri = to_data_uri(url)
-            if not data_uri:
+            asset_url = to_asset_url(url)
+            if not asset_url:
                 return match.group(0)
-            return f'<img{before} src="{data_uri}"{after}>'
+            return f'<img{before} src="{asset_url}"{after}>'
 
         image_pattern = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
         html_image_pattern = re.compile(r"<img\b([^>]*?)\bsrc=[\"']([^\"']+)[\"']([^>]*?)>", re.IGNORECASE)
@@ -133,23 +189,40 @@ class MarkdownDocument:
 
 
 class MarkdownLoader:
-    def __init__(self, dir_path: Path | str) -> None:
+    """Load the Markdown documents of a folder, sorted by path.
+
+    Front matters are read one file after another by default. With `workers` greater than 1 they are
+    read by a pool of threads, or parsed by a pool of processes with `processes`, which speeds up
+    cold loads of large folders or of folders on high latency volumes.
+    """
+
+    def __init__(
+        self,
+        dir_path: Path | str,
+        cache: ParsedDocumentCache | None = None,
+        workers: int = 1,
+        processes: bool = False,
+    ) -> None:
         if isinstance(dir_path, str):
             dir_path = Path(dir_path)
         if not dir_path.is_dir():
             raise ValueError(f"Directory not found: {dir_path}")
 
         self._dir_path = dir_path
+        self._cache = cache or document_cache
+        self._workers = workers
+        self._processes = processes
 
     def load_all(self) -> list[MarkdownDocument]:
         return self.load_by_section("")
 
     def load_by_section(self, section: str) -> list[MarkdownDocument]:
+        paths = sorted(self._dir_path.glob("*.md"))
         docs: list[MarkdownDocument] = []
-        for path in sorted(self._dir_path.glob("*.md")):
-            metadata = self._parse_front_matter(path.read_text(encoding="utf-8"))
+        for parsed in self._cache.get_many(paths, workers=self._workers, processes=self._processes):
+            metadata = parsed.metadata
             if not section or metadata.get("section") == section:
-                md = MarkdownDocument.from_metadata(path, metadata)
+                md = MarkdownDocument.from_metadata(parsed.path, metadata, self._cache)
                 docs.append(md)
         return docs
 
@@ -157,39 +230,4 @@ class MarkdownLoader:
         path = self._dir_path / filename
         if not path.is_file():
             return None
-        return MarkdownDocument.from_metadata(path, self._parse_front_matter(path.read_text(encoding="utf-8")))
-
-    @staticmethod
-    def _parse_front_matter(text: str) -> dict[str, str]:
-        """Extract YAML-like front matter and return metadata."""
-
-        if not text.startswith("---"):
-            return {}
-
-        lines = text.splitlines()
-        end_index = None
-        for idx in range(1, len(lines)):
-            if lines[idx].strip() == "---":
-                end_index = idx
-                break
-
-        if end_index is None:
-            return {}
-
-        front_lines = lines[1:end_index]
-
-        yaml_content = "\n".join(front_lines)
-        metadata: dict[str, Any] = yaml.safe_load(yaml_content) or {}
-
-        return metadata
-
-
-@st.cache_data
-def load_documents(dir_path: Path | str) -> list[MarkdownDocument]:
-    return MarkdownLoader(dir_path).load_all()
-
-
-@st.cache_data
-def load_highlighted_documents(dir_path: Path | str) -> list[MarkdownDocument]:
-    docs = load_documents(dir_path)
-    return [doc for doc in docs if doc.highlighted]
+        return MarkdownDocument.from_metadata(path, self._cache.get(path).metadata, self._cache)
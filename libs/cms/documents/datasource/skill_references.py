@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from .markdown_file import MarkdownDocument
+
+
+class SkillReferences:
+    """Index of the documents using each skill (from the `skills` of their front matter).
+
+    Documents are added and removed one at a time, as their files change. Skill names are matched
+    case-insensitively, and the documents of a skill are listed by path; each list is built on first
+    use and kept until one of its documents changes.
+    """
+
+    def __init__(self) -> None:
+        self._references: dict[str, dict[Path, MarkdownDocument]] = {}
+        self._documents: dict[str, tuple[MarkdownDocument, ...]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, doc: MarkdownDocument) -> None:
+        """Index the skills of a document; the previous version of a modified document should be removed first."""
+
+        with self._lock:
+            for name in self._skill_keys(doc):
+                self._references.setdefault(name, {})[doc.path] = doc
+                self._documents.pop(name, None)
+
+    def remove(self, doc: MarkdownDocument) -> None:
+        """Remove a document from the lists of its skills, if it is still the indexed one at its path."""
+
+        with self._lock:
+            for name in self._skill_keys(doc):
+                references = self._references.get(name)
+                if references is None or references.get(doc.path) is not doc:
+                    continue
+                del references[doc.path]
+                if not references:
+                    del self._references[name]
+                self._documents.pop(name, None)
+
+    def documents(self, skill_name: str) -> tuple[MarkdownDocument, ...]:
+        """Documents using a skill, sorted by path."""
+
+        name = skill_name.lower()
+        with self._lock:
+            documents = self._documents.get(name)
+            if documents is None:
+                references = self._references.get(name)
+                if references is None:
+                    return ()
+                documents = self._documents[name] = tuple(references[path] for path in sorted(references))
+            return documents
+
+    def skill_names(self) -> set[str]:
+        """Lowercased names of the skills used by at least one document."""
+
+        with self._lock:
+            return set(self._references)
+
+    @staticmethod
+    def _skill_keys(doc: MarkdownDocument) -> set[str]:
+        return {skill.name.lower() for skill in doc.skills}
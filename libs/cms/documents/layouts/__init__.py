@@ -1,4 +1,4 @@
-from .cards_and_dialogs import cards_and_dialogs_layout
-from .tabs import tabs_layout
+from .cards_and_dialogs import cards_and_dialogs_layout, cards_and_dialogs_requirements
+from .tabs import tabs_layout, tabs_requirements
 
-__all__ = ["cards_and_dialogs_layout", "tabs_layout"]
+__all__ = ["cards_and_dialogs_layout", "cards_and_dialogs_requirements", "tabs_layout", "tabs_requirements"]
@@ -1,25 +1,36 @@
-from operator import attrgetter
+from collections.abc import Callable, Mapping
+from functools import partial
 from pathlib import Path
-from typing import Callable, TypedDict
+from typing import Any, TypedDict
 
 import streamlit as st
 
-from ...common.files import get_file_data
+from ...common.files import file_payload, get_file_data
+from ...common.pagination import load_more_button, visible_count
+from ...common.static_images import preload_static_image, static_image
+from ...metrics import metrics
 from ...navigation import Router
-from ..datasource import MarkdownDocument, load_documents
+from ...warmup import Requirement
+from ..datasource import MarkdownDocument, load_sorted_documents
 
 type SkillName = str
 
+_CARD_IMAGE_WIDTH = 250
+
 
 class RenderingHooks(TypedDict, total=False):
-    on_skill_popover: Callable[[SkillName], None]
+    resolve_skills: Callable[[MarkdownDocument], Mapping[SkillName, Any]]
+    """resolves all the skills of a document at once (e.g. to their details), keyed by their name in the document"""
+
+    on_skill_popover: Callable[[SkillName, Router, Any | None], None]
+    """renders the popover of a skill, from its name and what `resolve_skills` resolved it to, if anything"""
 
 
 @st.dialog("About this experience", width="medium")
-def _open_dialog(
-    router: Router, doc: MarkdownDocument, on_skill_popover: Callable[[SkillName, Router], None] | None = None
-) -> None:
-    st.markdown(doc.content, unsafe_allow_html=True)
+def _open_dialog(router: Router, doc: MarkdownDocument, rendering_hooks: RenderingHooks) -> None:
+    content = doc.content
+    metrics.record_payload("markdown", content)
+    st.markdown(content, unsafe_allow_html=True)
 
     if doc.downloads:
         st.divider()
@@ -28,7 +39,7 @@ def _open_dialog(
             filename = Path(download.path).name
             st.download_button(
                 label=download.title,
-                data=get_file_data(download.path),
+                data=file_payload(download.path),
                 icon=":material/download:",
                 type="tertiary",
                 file_name=filename,
@@ -36,6 +47,11 @@ def _open_dialog(
 
     if not doc.skills:
         return
+
+    on_skill_popover = rendering_hooks.get("on_skill_popover")
+    resolve_skills = rendering_hooks.get("resolve_skills")
+    resolved = resolve_skills(doc) if on_skill_popover and resolve_skills else {}
+
     st.divider()
     st.subheader("Skills used:")
     for skill in doc.skills:
@@ -47,14 +63,15 @@ def _open_dialog(
                 st.write(skill.details)
             if on_skill_popover:
                 with st.popover("About this skill", type="tertiary"):
-                    on_skill_popover(skill.name, router)
+                    on_skill_popover(skill.name, router, resolved.get(skill.name))
 
 
 @st.fragment
+@metrics.timed("cms_render_seconds", kind="fragment", name="card")
 def card(
     router: Router,
     doc: MarkdownDocument,
-    on_click: Callable[[Router, MarkdownDocument, Callable[[SkillName, Router], None]], None],
+    on_click: Callable[[Router, MarkdownDocument, RenderingHooks], None],
     rendering_hooks: RenderingHooks | None = None,
     is_clicked: bool = False,
 ) -> None:
@@ -72,7 +89,7 @@ def card(
 
         if doc.image_path:
             with st.container(horizontal_alignment="center"):
-                st.image(doc.image_path, width=250)
+                st.image(static_image(doc.image_path, _CARD_IMAGE_WIDTH).source, width=_CARD_IMAGE_WIDTH)
 
         if d := doc.description:
             st.write(d)
@@ -84,28 +101,56 @@ def card(
         with st.container(horizontal_alignment="right"):
             btn_key = f"details_open_btn_{doc.title}"
             if is_clicked or st.button("Read the full story ->", key=btn_key, type="primary"):
-                on_click(router, doc, rendering_hooks.get("on_skill_popover"))
+                on_click(router, doc, rendering_hooks or {})
 
 
 @st.fragment
+@metrics.timed("cms_render_seconds", kind="layout", name="cards_and_dialogs_layout")
 def cards_and_dialogs_layout(
     router: Router,
     title: str,
     folder_path: Path | str,
     rendering_hooks: RenderingHooks | None = None,
     opened_doc_title: str | None = None,
+    page_size: int | None = None,
 ) -> None:
+    """Cards of the documents of a folder, by decreasing weight, each opening its document in a dialog.
+
+    With `page_size`, only the first `page_size` cards are rendered, followed by a "load more" button.
+    The card of `opened_doc_title` is always rendered.
+    """
+
     rendering_hooks = rendering_hooks or {}
     st.title(title)
 
-    docs = load_documents(folder_path)
+    docs = load_sorted_documents(folder_path, "weight", reverse=True)
 
     if len(docs) == 0:
         st.write("Nothing to show here... yet...")
         return
 
-    for i, doc in enumerate(sorted(docs, key=attrgetter("weight"), reverse=True)):
+    pagination_key = f"cards_and_dialogs_layout_{folder_path}"
+    opened_position = next((i + 1 for i, doc in enumerate(docs) if doc.title == opened_doc_title), 0)
+    visible = visible_count(pagination_key, page_size, len(docs), min_count=opened_position)
+
+    for i, doc in enumerate(docs[:visible]):
         card(router, doc, _open_dialog, rendering_hooks=rendering_hooks, is_clicked=doc.title == opened_doc_title)
 
-        if i < len(docs) - 1:
+        if i < visible - 1:
             st.space("small")
+
+    load_more_button(pagination_key, page_size, len(docs))
+
+
+def cards_and_dialogs_requirements(folder_path: Path | str) -> tuple[Requirement, ...]:
+    """What `cards_and_dialogs_layout` needs to render the documents of a folder, see `libs.cms.warmup`."""
+    return (partial(_load_cards, folder_path),)
+
+
+def _load_cards(folder_path: Path | str) -> None:
+    for doc in load_sorted_documents(folder_path, "weight", reverse=True):
+        if doc.image_path:
+            preload_static_image(doc.image_path, _CARD_IMAGE_WIDTH)
+        _ = doc.content
+        for download in doc.downloads:
+            get_file_data(download.path)
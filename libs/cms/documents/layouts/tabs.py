@@ -1,10 +1,13 @@
+from functools import partial
 from operator import attrgetter
 from pathlib import Path
 from typing import Callable, TypedDict
 
 import streamlit as st
 
-from ..datasource import load_documents
+from ...metrics import metrics
+from ...warmup import Requirement
+from ..datasource import MarkdownDocument, load_documents
 
 
 class RenderingHooks(TypedDict, total=False):
@@ -12,7 +15,17 @@ class RenderingHooks(TypedDict, total=False):
     overview_after: Callable[[], None]
 
 
-def tabs_layout(title: str, folder_path: Path | str, rendering_hooks: RenderingHooks | None = None) -> None:
+@metrics.timed("cms_render_seconds", kind="layout", name="tabs_layout")
+def tabs_layout(
+    title: str, folder_path: Path | str, rendering_hooks: RenderingHooks | None = None, lazy: bool = False
+) -> None:
+    """Overview of the documents of a folder followed by one tab per document.
+
+    With `lazy`, tabs are replaced by a selector and only the selected document body is loaded and
+    sent to the browser, instead of every body up front. Bodies are read once and kept in the
+    documents body cache.
+    """
+
     st.title(title)
 
     docs = load_documents(folder_path)
@@ -21,20 +34,55 @@ def tabs_layout(title: str, folder_path: Path | str, rendering_hooks: RenderingH
         return
 
     docs = sorted(docs, key=attrgetter("weight"), reverse=True)
+    labels = [f"Overview ({len(docs)})"] + [d.title for d in docs]
+
+    if lazy:
+        selected = st.segmented_control(
+            "Document",
+            options=range(len(labels)),
+            format_func=labels.__getitem__,
+            default=0,
+            key=f"tabs_layout_{folder_path}",
+            label_visibility="collapsed",
+        )
+        if not selected:
+            _render_overview(docs, rendering_hooks)
+        else:
+            _render_content(docs[selected - 1])
+        return
 
-    nb = len(docs)
-    tabs = st.tabs([f"Overview ({nb})"] + [d.title for d in docs])
+    tabs = st.tabs(labels)
     with tabs[0]:
-        if rendering_hooks and rendering_hooks.get("overview_before"):
-            rendering_hooks["overview_before"]()
-        for doc in docs:
-            with st.container(border=True):
-                st.write(f":material/check_small: **{doc.title}**")
-                if doc.description:
-                    st.write(doc.description)
-        if rendering_hooks and rendering_hooks.get("overview_after"):
-            rendering_hooks["overview_after"]()
-
-    for i in range(1, nb + 1):
+        _render_overview(docs, rendering_hooks)
+
+    for i in range(1, len(labels)):
         with tabs[i]:
-            st.markdown(docs[i - 1].content, unsafe_allow_html=True)
+            _render_content(docs[i - 1])
+
+
+def _render_content(doc: MarkdownDocument) -> None:
+    content = doc.content
+    metrics.record_payload("markdown", content)
+    st.markdown(content, unsafe_allow_html=True)
+
+
+def _render_overview(docs: list[MarkdownDocument], rendering_hooks: RenderingHooks | None) -> None:
+    if rendering_hooks and rendering_hooks.get("overview_before"):
+        rendering_hooks["overview_before"]()
+    for doc in docs:
+        with st.container(border=True):
+            st.write(f":material/check_small: **{doc.title}**")
+            if doc.description:
+                st.write(doc.description)
+    if rendering_hooks and rendering_hooks.get("overview_after"):
+        rendering_hooks["overview_after"]()
+
+
+def tabs_requirements(folder_path: Path | str) -> tuple[Requirement, ...]:
+    """What `tabs_layout` needs to render the documents of a folder, see `libs.cms.warmup`."""
+    return (partial(_load_tabs, folder_path),)
+
+
+def _load_tabs(folder_path: Path | str) -> None:
+    for doc in load_documents(folder_path):
+        _ = doc.content
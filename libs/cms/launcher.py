@@ -0,0 +1,98 @@
+"""Start a Streamlit app once its content caches are warm.
+
+The app module is imported and the requirements of its router are loaded (see `libs.cms.warmup`),
+then the Streamlit server is started in the same process, so that it serves from the warm caches.
+Traffic is only admitted once the warm-up is done: the server only listens from then on, and
+`readiness` is marked ready (writing `CMS_READY_FILE`, and answering 200 on the `/ready` endpoint of
+the metrics server when `CMS_METRICS_PORT` is set) once it answers its health checks::
+
+    python -m libs.cms.launcher main.py --server.port=8501
+
+Options other than `--router` are passed to `streamlit run`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import logging
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Sequence
+from pathlib import Path
+
+from .metrics import start_metrics_server
+from .navigation import Router
+from .warmup import readiness
+
+_logger = logging.getLogger(__name__)
+
+
+def load_router(target: str) -> Router:
+    """Router of an app, from a "package.module:attribute" target."""
+
+    module_name, _, attribute = target.partition(":")
+    router = getattr(importlib.import_module(module_name), attribute or "router", None)
+    if not isinstance(router, Router):
+        raise TypeError(f"No router found at {target!r}")
+    return router
+
+
+def _skip_warnings(record: logging.LogRecord) -> bool:
+    return record.levelno > logging.WARNING
+
+
+def _mark_ready_when_serving(poll_interval: float = 0.1) -> None:
+    from streamlit import config
+
+    while True:
+        address = config.get_option("server.address") or "127.0.0.1"
+        if address == "0.0.0.0":
+            address = "127.0.0.1"
+        base_path = (config.get_option("server.baseUrlPath") or "").strip("/")
+        prefix = f"/{base_path}" if base_path else ""
+        url = f"http://{address}:{config.get_option('server.port')}{prefix}/_stcore/health"
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    readiness.mark_ready()
+                    return
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(poll_interval)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Warm up the content caches of a Streamlit app, then run it.")
+    parser.add_argument("script", type=Path, help="app script, e.g. main.py")
+    parser.add_argument("--router", default=None, help='router of the app, "<script module>:router" by default')
+    args, streamlit_args = parser.parse_known_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    readiness.reset()
+
+    sys.path.insert(0, str(args.script.resolve().parent))
+    # Streamlit warns about the missing script run context when its caches are used outside of a session
+    streamlit_logger = logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context")
+    streamlit_logger.addFilter(_skip_warnings)
+    try:
+        router = load_router(args.router or f"{args.script.stem}:router")
+        start_metrics_server()  # `/ready` answers 503 during the warm-up
+        report = router.warm_up()
+    finally:
+        streamlit_logger.removeFilter(_skip_warnings)
+    _logger.info("Warmed up %d requirement(s) in %.2fs, %d failed", report.loaded, report.seconds, len(report.failed))
+
+    threading.Thread(target=_mark_ready_when_serving, name="cms-readiness", daemon=True).start()
+
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", str(args.script), *streamlit_args]
+    cli.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Opt-in instrumentation of the app: render durations, loader timings, cache events and payload sizes.
+
+Metrics are recorded in the process-wide `metrics` registry when it is enabled, by setting the
+`CMS_METRICS` environment variable (to "1" or "true"); disabled, recording them costs an attribute
+check. They can be dumped in the Prometheus text format or as JSON, and served over HTTP from a
+background thread when `CMS_METRICS_PORT` is set too (see `start_metrics_server`):
+
+- `cms_render_seconds{kind, name}`: render durations of pages, layouts and fragments
+- `cms_loader_seconds{loader}`: durations of content loads (cache misses of content loaders,
+  refreshes of document folders)
+- `cms_cache_events_total{cache, event}`: hits, misses and evictions of the content caches
+- `cms_payload_bytes_total{kind}` and `cms_payloads_total{kind}`: content sent to the browser
+  (document bodies, images, downloads)
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Literal
+
+from .warmup import readiness
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+type CacheEvent = Literal["hit", "miss", "eviction"]
+type _Labels = tuple[tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""upper bounds (in seconds) of the buckets of duration histograms"""
+
+
+class _Histogram:
+    __slots__ = ("count", "counts", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.count = 0
+        self.sum = 0.0
+
+
+class MetricsRegistry:
+    """In-process registry of counters and duration histograms, identified by a name and labels."""
+
+    def __init__(self, enabled: bool | None = None, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.enabled = enabled if enabled is not None else os.environ.get("CMS_METRICS", "") in ("1", "true")
+        self._buckets = tuple(sorted(buckets))
+        self._counters: dict[str, dict[_Labels, float]] = {}
+        self._histograms: dict[str, dict[_Labels, _Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: float = 1, /, **labels: object) -> None:
+        if not self.enabled:
+            return
+
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, seconds: float, /, **labels: object) -> None:
+        """Record a duration in the histogram `name`."""
+
+        if not self.enabled:
+            return
+
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(len(self._buckets))
+            for i, bound in enumerate(self._buckets):
+                if seconds <= bound:
+                    histogram.counts[i] += 1
+            histogram.count += 1
+            histogram.sum += seconds
+
+    @contextmanager
+    def timer(self, name: str, /, **labels: object) -> Iterator[None]:
+        """Record the duration of a block in the histogram `name`."""
+
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed[**P, R](self, name: str, /, **labels: object) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        """Decorator recording the duration of each call of a function in the histogram `name`."""
+
+        def decorator(func: Callable[P, R]) -> Callable[P, R]:
+            @functools.wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start, **labels)
+
+            return wrapper
+
+        return decorator
+
+    def record_cache(self, cache: str, event: CacheEvent) -> None:
+        self.increment("cms_cache_events_total", cache=cache, event=event)
+
+    def record_payload(self, kind: str, payload: str | bytes) -> None:
+        """Record content sent to the browser; text is counted in UTF-8 bytes."""
+
+        if not self.enabled:
+            return
+
+        size = len(payload.encode()) if isinstance(payload, str) else len(payload)
+        self.increment("cms_payload_bytes_total", size, kind=kind)
+        self.increment("cms_payloads_total", kind=kind)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "counters": {
+                    name: [{"labels": dict(labels), "value": value} for labels, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+                "histograms": {
+                    name: [
+                        {
+                            "labels": dict(labels),
+                            "count": histogram.count,
+                            "sum": histogram.sum,
+                            "buckets": dict(zip(map(str, self._buckets), histogram.counts, strict=True)),
+                        }
+                        for labels, histogram in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    def to_prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format."""
+
+        lines: list[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                lines.extend(
+                    f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in series.items()
+                )
+
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in series.items():
+                    for bound, count in zip(self._buckets, histogram.counts, strict=True):
+                        bucket_labels = _format_labels((*labels, ("le", _format_value(bound))))
+                        lines.append(f"{name}_bucket{bucket_labels} {count}")
+                    lines.append(f"{name}_bucket{_format_labels((*labels, ('le', '+Inf')))} {histogram.count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _labels(labels: dict[str, object]) -> _Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(labels: _Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+metrics = MetricsRegistry()
+
+_server: ThreadingHTTPServer | None = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(
+    port: int | None = None, registry: MetricsRegistry = metrics, host: str = "0.0.0.0"
+) -> ThreadingHTTPServer | None:
+    """Serve the metrics from a daemon thread, once per process: `/metrics` (Prometheus) and `/metrics.json`.
+
+    `/ready` also tells whether the app is warmed up (200) or not yet (503), see `libs.cms.warmup`.
+    The port is `CMS_METRICS_PORT` by default; nothing is served when there is none.
+    """
+
+    global _server
+
+    if port is None:
+        if not (env_port := os.environ.get("CMS_METRICS_PORT")):
+            return None
+        port = int(env_port)
+
+    with _server_lock:
+        if _server is None:
+            from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+            class _MetricsHandler(BaseHTTPRequestHandler):
+                def do_GET(self) -> None:
+                    path = self.path.partition("?")[0]
+                    if path == "/metrics":
+                        self._reply(registry.to_prometheus(), "text/plain; version=0.0.4; charset=utf-8")
+                    elif path == "/metrics.json":
+                        self._reply(registry.to_json(), "application/json")
+                    elif path == "/ready":
+                        if readiness.is_ready:
+                            self._reply("ready\n", "text/plain; charset=utf-8")
+                        else:
+                            self._reply("warming up\n", "text/plain; charset=utf-8", status=503)
+                    else:
+                        self.send_error(404)
+
+                def _reply(self, body: str, content_type: str, status: int = 200) -> None:
+                    data = body.encode()
+                    self.send_response(status)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+
+                def log_message(self, format: str, *args: Any) -> None:
+                    pass
+
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="cms-metrics", daemon=True).start()
+
+    return _server
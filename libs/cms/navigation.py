@@ -1,58 +1,78 @@
+import importlib
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Sequence, TypedDict
 
 import streamlit as st
 from streamlit.navigation.page import StreamlitPage
 
+from .metrics import metrics
+from .warmup import Requirement, WarmUpReport, unique_requirements, warm_up
+
 type SectionName = str
 
 
 DEFAULT_SECTION: SectionName = ""
 
+# Sections of the sidebar, in order, with their links
+type _Sidebar = tuple[tuple[SectionName, tuple[StreamlitPage, ...]], ...]
+
 
 class _PageConfig(TypedDict):
     key: str
     renderer: Callable[[], None]
     original_page: StreamlitPage
     show_in_nav: bool
+    requirements: Callable[[], Iterable[Requirement]] | None
 
 
 class Router:
+    """Registry of the pages of the app, by section.
+
+    The navigation model (pages of each section, links of the sidebar) is maintained as pages are
+    registered, and pages are indexed by key: rendering and looking pages up don't scan the registry.
+    Pages with a custom label (see `get_page`) are created once per key and label.
+
+    Pages declare what they need to render (see `page` and `lazy_page`), and the app chrome with
+    `require`: `warm_up` loads all of it ahead of the first visit.
+    """
+
     def __init__(self) -> None:
-        self._pages: dict[SectionName, list[_PageConfig]] = defaultdict(list)
+        self._pages_by_key: dict[str, _PageConfig] = {}
+        self._navigation: dict[SectionName, list[StreamlitPage]] = {}
+        self._nav_links: dict[SectionName, list[StreamlitPage]] = defaultdict(list)
+        self._sidebars: dict[tuple[SectionName, ...] | None, _Sidebar] = {}
+        self._labelled_pages: dict[tuple[str, str], StreamlitPage] = {}
+        self._requirements: list[Requirement] = []
 
     def render(self, sections_order: Sequence[SectionName] | None = None) -> None:
-        pg = st.navigation(
-            {sec: [p["original_page"] for p in pages] for sec, pages in self._pages.items()}, position="hidden"
-        )
-        pg.run()
+        pg = st.navigation(self._navigation, position="hidden")
+        with metrics.timer("cms_render_seconds", kind="page", name=pg.title):
+            pg.run()
 
-        if sections_order:
-            if DEFAULT_SECTION not in sections_order:
-                sections_order = [DEFAULT_SECTION] + list(sections_order)
-        else:
-            sections_order = self._pages.keys()
+        sidebar = self._sidebar(tuple(sections_order) if sections_order else None)
 
         with st.sidebar:
-            for i, section in enumerate(sections_order):
+            for i, (section, links) in enumerate(sidebar):
                 st.subheader(section)
-                for p in self._pages[section]:
-                    if p["show_in_nav"]:
-                        st.page_link(p["original_page"])
+                for page in links:
+                    st.page_link(page)
 
-                if i < len(sections_order) - 1:
+                if i < len(sidebar) - 1:
                     st.divider()
 
     def get_page(self, key: str, display_label: str | None = None) -> StreamlitPage:
-        for sec, pages in self._pages.items():
-            for p in pages:
-                if p["key"] == key:
-                    if not display_label:
-                        return p["original_page"]
-                    return st.Page(p["renderer"], title=display_label)
+        config = self._pages_by_key.get(key)
+        if config is None:
+            raise RuntimeError(f"Page not found: {key}")
+
+        if not display_label:
+            return config["original_page"]
 
-        raise RuntimeError(f"Page not found: {key}")
+        page = self._labelled_pages.get((key, display_label))
+        if page is None:
+            page = self._labelled_pages[(key, display_label)] = st.Page(config["renderer"], title=display_label)
+        return page
 
     def page(
         self,
@@ -62,17 +82,109 @@ class Router:
         show_in_nav: bool = True,
         icon: str | None = None,
         default: bool = False,
+        requires: Callable[[], Iterable[Requirement]] | None = None,
     ):
+        """Register the decorated function as a page; `requires` lists what the page needs to render."""
+
         def decorator(func: Callable):
             nonlocal key
             key = key or func.__name__
             page = st.Page(func, title=title or key.title(), icon=icon, default=default)
-            self._pages[section] += [{"key": key, "original_page": page, "show_in_nav": show_in_nav, "renderer": func}]
+            config: _PageConfig = {
+                "key": key,
+                "original_page": page,
+                "show_in_nav": show_in_nav,
+                "renderer": func,
+                "requirements": requires,
+            }
+            self._pages_by_key.setdefault(key, config)
+            self._navigation.setdefault(section, []).append(page)
+            if show_in_nav:
+                self._nav_links[section].append(page)
+            self._sidebars.clear()
 
             return func
 
         return decorator
 
+    def lazy_page(
+        self,
+        section: SectionName,
+        target: str,
+        key: str | None = None,
+        title: str | None = None,
+        show_in_nav: bool = True,
+        icon: str | None = None,
+        default: bool = False,
+    ) -> None:
+        """Register a page rendered by `target` ("package.module:function"), see `page`.
+
+        The module is only imported when the page is rendered for the first time, so that the
+        dependencies of the page don't slow down the start of the app, or when the app is warmed up:
+        the `requirements` function of the module, if any, lists what the page needs to render.
+        """
+
+        module_name, _, function_name = target.partition(":")
+        if not module_name or not function_name:
+            raise ValueError(f"Invalid page target: {target!r}, expected 'package.module:function'")
+
+        def renderer() -> None:
+            getattr(importlib.import_module(module_name), function_name)()
+
+        def requirements() -> Iterable[Requirement]:
+            declared = getattr(importlib.import_module(module_name), "requirements", None)
+            return declared() if declared is not None else ()
+
+        # Streamlit derives the URL of a page from the name of its function
+        renderer.__name__ = renderer.__qualname__ = key or function_name
+        self.page(
+            section,
+            key=key or function_name,
+            title=title,
+            show_in_nav=show_in_nav,
+            icon=icon,
+            default=default,
+            requires=requirements,
+        )(renderer)
+
+    def require(self, *requirements: Requirement) -> None:
+        """Declare what the app needs besides its pages, e.g. the images of its chrome.
+
+        Requirements are deduplicated (see `unique_requirements`), so the app script can declare them on
+        every run.
+        """
+
+        self._requirements = unique_requirements([*self._requirements, *requirements])
+
+    def requirements(self) -> list[Requirement]:
+        """What the app and its pages need to render, without duplicates; lazy pages are imported."""
+
+        requirements = list(self._requirements)
+        for config in self._pages_by_key.values():
+            if (declared := config["requirements"]) is not None:
+                requirements.extend(declared())
+        return unique_requirements(requirements)
+
+    def warm_up(self) -> WarmUpReport:
+        """Load everything the app and its pages need to render, see `libs.cms.warmup`."""
+        return warm_up(self.requirements())
+
+    def _sidebar(self, sections_order: tuple[SectionName, ...] | None) -> _Sidebar:
+        """Sidebar for an order of the sections, computed once per order."""
+
+        sidebar = self._sidebars.get(sections_order)
+        if sidebar is None:
+            if sections_order is None:
+                sections: Sequence[SectionName] = list(self._navigation)
+            elif DEFAULT_SECTION not in sections_order:
+                sections = [DEFAULT_SECTION, *sections_order]
+            else:
+                sections = sections_order
+            sidebar = self._sidebars[sections_order] = tuple(
+                (section, tuple(self._nav_links.get(section, ()))) for section in sections
+            )
+        return sidebar
+
     def back_nav_link(self) -> None:
         if "from_page" in st.query_params:
             page_name = st.query_params.from_page
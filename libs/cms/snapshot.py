@@ -0,0 +1,271 @@
+"""Precompiled snapshot of the content tree, memory-mapped at runtime.
+
+The snapshot holds the parsed front matters and bodies of every Markdown document, the parsed
+YAML data files, the CSV tables (as Arrow IPC) and the digests of the asset files. Every entry
+records the modification time and size of its source file: an entry whose source changed since
+the compilation is ignored and the source is parsed instead.
+
+Compile it, e.g. at build time, with::
+
+    python -m libs.cms.snapshot content
+
+The snapshot is a trusted build artifact: entries are stored with pickle.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+from collections.abc import Sequence
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from .common import fast_yaml
+from .common.assets import asset_store
+from .common.front_matter import ParsedDocument, document_cache, read_front_matter
+
+if TYPE_CHECKING:
+    import polars as pl
+
+FORMAT_VERSION = 1
+"""bump it whenever the layout of the snapshot or of the pickled entries changes"""
+
+DEFAULT_SNAPSHOT_PATH = Path(".cache/content.snapshot")
+
+_MAGIC = b"CMSSNAP\0"
+_PREAMBLE = struct.Struct("<8sHQ")
+
+_DATA_SUFFIXES = (".yaml", ".yml")
+_TABLE_SUFFIXES = (".csv",)
+_ASSET_SUFFIXES = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg")
+
+type _Stamp = tuple[int, int]
+type _Span = tuple[int, int]
+
+
+def _key(path: Path | str) -> str:
+    return Path(path).as_posix()
+
+
+def _stamp(path: Path) -> _Stamp:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _Index(TypedDict):
+    documents: dict[str, list[tuple[str, _Stamp, ParsedDocument, _Span]]]
+    data: dict[str, tuple[_Stamp, _Span]]
+    tables: dict[str, tuple[_Stamp, _Span]]
+    assets: dict[str, tuple[_Stamp, str]]
+
+
+class SnapshotWriter:
+    def __init__(self) -> None:
+        self._index: _Index = {"documents": {}, "data": {}, "tables": {}, "assets": {}}
+        self._payload = io.BytesIO()
+
+    def add_documents(self, dir_path: Path) -> None:
+        entries = []
+        for path in sorted(dir_path.glob("*.md")):
+            if not path.is_file():
+                continue
+            stamp = _stamp(path)
+            parsed = read_front_matter(path)
+            with open(path, "rb") as f:
+                f.seek(parsed.body_offset)
+                span = self._append(f.read())
+            entries.append((path.name, stamp, parsed, span))
+        self._index["documents"][_key(dir_path)] = entries
+
+    def add_data(self, path: Path) -> None:
+        stamp = _stamp(path)
+        data = fast_yaml.safe_load(path.read_text(encoding="utf-8"))
+        self._index["data"][_key(path)] = (stamp, self._append(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    def add_table(self, path: Path) -> None:
+        import polars as pl
+
+        stamp = _stamp(path)
+        buffer = io.BytesIO()
+        pl.read_csv(path, has_header=True).write_ipc(buffer)
+        self._index["tables"][_key(path)] = (stamp, self._append(buffer.getvalue()))
+
+    def add_asset(self, path: Path) -> None:
+        self._index["assets"][_key(path)] = (_stamp(path), asset_store.digest(path))
+
+    def add_tree(self, root: Path) -> None:
+        """Add every document folder, data file, table and asset found under `root`."""
+
+        for dir_path, _, filenames in sorted(os.walk(root)):
+            dir_path = Path(dir_path)
+            if any(name.endswith(".md") for name in filenames):
+                self.add_documents(dir_path)
+            for name in sorted(filenames):
+                path = dir_path / name
+                suffix = path.suffix.lower()
+                if suffix in _DATA_SUFFIXES:
+                    self.add_data(path)
+                elif suffix in _TABLE_SUFFIXES:
+                    self.add_table(path)
+                elif suffix in _ASSET_SUFFIXES:
+                    self.add_asset(path)
+
+    def write(self, path: Path) -> None:
+        index = pickle.dumps(self._index, protocol=pickle.HIGHEST_PROTOCOL)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(_PREAMBLE.pack(_MAGIC, FORMAT_VERSION, len(index)))
+            f.write(index)
+            f.write(self._payload.getbuffer())
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+
+    def _append(self, data: bytes) -> _Span:
+        start = self._payload.tell()
+        self._payload.write(data)
+        return start, len(data)
+
+
+class Snapshot:
+    """Read-only, memory-mapped view over a compiled snapshot."""
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, index_length = _PREAMBLE.unpack_from(self._mm)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"Unsupported snapshot format: {path}")
+
+        self._payload_start = _PREAMBLE.size + index_length
+        self._index: _Index = pickle.loads(self._mm[_PREAMBLE.size : self._payload_start])
+
+    def seed_caches(self) -> None:
+        """Register the snapshot documents and asset digests into the process-wide caches."""
+
+        for dir_key, entries in self._index["documents"].items():
+            for name, stamp, parsed, span in entries:
+                path = Path(dir_key) / name
+                document_cache.put(
+                    ParsedDocument(
+                        path=path,
+                        metadata=parsed.metadata,
+                        body_offset=parsed.body_offset,
+                        has_front_matter=parsed.has_front_matter,
+                        is_closed=parsed.is_closed,
+                        body_loader=partial(self._read, span),
+                    ),
+                    stamp,
+                )
+
+        for key, (stamp, digest) in self._index["assets"].items():
+            asset_store.put_digest(Path(key), stamp, digest)
+            asset_store.put_digest(Path(key).resolve(), stamp, digest)
+
+    def data(self, path: Path | str) -> Any | None:
+        """Parsed content of a YAML file, None when it isn't in the snapshot or changed since."""
+
+        entry = self._index["data"].get(_key(path))
+        if entry is None or not _is_fresh(path, entry[0]):
+            return None
+        return pickle.loads(self._read(entry[1]))
+
+    def table(self, path: Path | str) -> pl.DataFrame | None:
+        """Content of a CSV file, None when it isn't in the snapshot or changed since."""
+
+        entry = self._index["tables"].get(_key(path))
+        if entry is None or not _is_fresh(path, entry[0]):
+            return None
+
+        import polars as pl
+        import pyarrow as pa
+
+        start, length = entry[1]
+        view = memoryview(self._mm)[self._payload_start + start : self._payload_start + start + length]
+        return pl.from_arrow(pa.ipc.open_file(pa.py_buffer(view)).read_all())
+
+    def _read(self, span: _Span) -> bytes:
+        start, length = span
+        return self._mm[self._payload_start + start : self._payload_start + start + length]
+
+
+def _is_fresh(path: Path | str, stamp: _Stamp) -> bool:
+    try:
+        return _stamp(Path(path)) == stamp
+    except OSError:
+        return False
+
+
+_snapshot: Snapshot | None = None
+_snapshot_loaded = False
+_snapshot_lock = threading.Lock()
+
+
+def load_snapshot() -> Snapshot | None:
+    """Open the snapshot (`CMS_SNAPSHOT_PATH`, `.cache/content.snapshot` by default) once per process.
+
+    Returns None when there is no usable snapshot, in which case source files are parsed.
+    """
+
+    global _snapshot, _snapshot_loaded
+
+    if _snapshot_loaded:
+        return _snapshot
+
+    with _snapshot_lock:
+        if not _snapshot_loaded:
+            path = Path(os.environ.get("CMS_SNAPSHOT_PATH", DEFAULT_SNAPSHOT_PATH))
+            try:
+                _snapshot = Snapshot(path)
+                _snapshot.seed_caches()
+            except (OSError, ValueError, EOFError, AttributeError, ImportError, pickle.UnpicklingError, struct.error):
+                _snapshot = None
+            _snapshot_loaded = True
+
+    return _snapshot
+
+
+def read_yaml(path: Path | str) -> Any:
+    """Parsed content of a YAML file, from the snapshot when it is up to date."""
+
+    if (snapshot := load_snapshot()) is not None and (data := snapshot.data(path)) is not None:
+        return data
+    with open(path, encoding="utf-8") as f:
+        return fast_yaml.safe_load(f.read())
+
+
+def read_csv(path: Path | str) -> pl.DataFrame:
+    """Content of a CSV file with a header, from the snapshot when it is up to date."""
+
+    if (snapshot := load_snapshot()) is not None and (table := snapshot.table(path)) is not None:
+        return table
+
+    import polars as pl
+
+    return pl.read_csv(path, has_header=True)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile a content tree into a snapshot.")
+    parser.add_argument("root", type=Path)
+    parser.add_argument("-o", "--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    output = args.output or Path(os.environ.get("CMS_SNAPSHOT_PATH", DEFAULT_SNAPSHOT_PATH))
+    writer = SnapshotWriter()
+    writer.add_tree(args.root)
+    writer.write(output)
+    print(f"Snapshot of {args.root} written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Warm-up of the content caches before the app admits traffic, and readiness signal.
+
+Pages and layouts declare what they need to render as requirements: callables loading content into
+the process-wide caches (e.g. `partial(load_documents, "content/experiences")`). `Router.warm_up`
+runs the requirements of every registered page once, so that the first visitors don't pay for cold
+loads. Then `readiness` is marked ready, which writes the `CMS_READY_FILE` (when set) and makes the
+`/ready` endpoint of the metrics server answer 200. See `libs.cms.launcher` to warm up an app before
+starting the Streamlit server.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+type Requirement = Callable[[], object]
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class WarmUpReport:
+    loaded: int
+    failed: tuple[tuple[str, str], ...]
+    """(requirement, error) pairs"""
+    seconds: float
+
+
+def unique_requirements(requirements: Iterable[Requirement]) -> list[Requirement]:
+    """Requirements without duplicates, in order; partials of the same function and arguments are duplicates."""
+
+    unique: dict[object, Requirement] = {}
+    for requirement in requirements:
+        unique.setdefault(_requirement_key(requirement), requirement)
+    return list(unique.values())
+
+
+def warm_up(requirements: Iterable[Requirement]) -> WarmUpReport:
+    """Load every requirement once; failures are logged and reported, they don't stop the warm-up."""
+
+    start = time.perf_counter()
+    loaded = 0
+    failed: list[tuple[str, str]] = []
+    for requirement in unique_requirements(requirements):
+        try:
+            requirement()
+        except Exception as e:  # noqa: BLE001 - a page failing to load must not keep the app from starting
+            _logger.warning("Warm-up of %s failed: %s", _describe(requirement), e)
+            failed.append((_describe(requirement), repr(e)))
+        else:
+            loaded += 1
+
+    return WarmUpReport(loaded=loaded, failed=tuple(failed), seconds=time.perf_counter() - start)
+
+
+def _requirement_key(requirement: Requirement) -> object:
+    if isinstance(requirement, functools.partial):
+        try:
+            key = (requirement.func, requirement.args, tuple(sorted(requirement.keywords.items())))
+            hash(key)
+            return key
+        except TypeError:
+            pass
+    return requirement
+
+
+def _describe(requirement: Requirement) -> str:
+    if isinstance(requirement, functools.partial):
+        arguments = [repr(arg) for arg in requirement.args]
+        arguments += [f"{name}={value!r}" for name, value in requirement.keywords.items()]
+        return f"{_describe(requirement.func)}({', '.join(arguments)})"
+    return getattr(requirement, "__qualname__", repr(requirement))
+
+
+class Readiness:
+    """Whether the app is ready to admit traffic, i.e. warmed up.
+
+    Being ready is also signaled by the presence of `ready_file` (`CMS_READY_FILE` by default), for
+    orchestrators probing files.
+    """
+
+    def __init__(self, ready_file: Path | str | None = None) -> None:
+        if ready_file is None and (env_file := os.environ.get("CMS_READY_FILE")):
+            ready_file = env_file
+        self._ready_file = Path(ready_file) if ready_file else None
+        self._ready = threading.Event()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def mark_ready(self) -> None:
+        if self._ready_file is not None:
+            self._ready_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self._ready_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as tmp:
+                tmp.write(f"{os.getpid()}\n")
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, self._ready_file)
+        self._ready.set()
+
+    def reset(self) -> None:
+        """Not ready anymore, e.g. at the start of a new warm-up."""
+
+        self._ready.clear()
+        if self._ready_file is not None:
+            self._ready_file.unlink(missing_ok=True)
+
+
+readiness = Readiness()
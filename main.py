@@ -1,13 +1,23 @@
+from functools import partial
+
 import streamlit as st
 
+from libs.cms import start_metrics_server
+from libs.cms.common.static_images import preload_static_image, static_image
 from src.pages import ORDERED_SECTIONS, router
 
+_LOGO_PATH = "content/assets/images/site-logo-tr.png"
+_LOGO_WIDTH = 48
+
+router.require(partial(preload_static_image, _LOGO_PATH, _LOGO_WIDTH))
+
 
 def main() -> None:
-    with open("content/assets/images/site-logo-tr.png", "rb") as f:
-        logo_image = f.read()
-    st.set_page_config(page_title="Thomas Marquis | MLOps & AI Engineer", page_icon=logo_image)
-    st.logo(logo_image, size="large")
+    start_metrics_server()
+
+    logo = static_image(_LOGO_PATH, _LOGO_WIDTH)
+    st.set_page_config(page_title="Thomas Marquis | MLOps & AI Engineer", page_icon=logo.source)
+    st.logo(logo.source, size="large")
 
     st.session_state.setdefault("first_time", True)
 
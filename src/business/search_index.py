@@ -0,0 +1,208 @@
+"""Full-text search over documents made of several text fields, with an in-memory inverted index."""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Words of a text, case folded and without accents (e.g. "Déployé" gives "deploye")."""
+
+    text = unicodedata.normalize("NFKD", text.casefold())
+    if not text.isascii():
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    return _TOKEN.findall(text)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    doc_id: str
+    score: float
+
+
+class SearchIndex:
+    """Inverted index of documents made of named text fields, ranked with BM25.
+
+    Each field counts `field_weights[field]` times (1 by default) in the term frequencies and the
+    length of a document, so that e.g. a match in a title ranks higher than one in a body. Documents
+    can be added, replaced and removed at any time, only the postings of their terms are updated.
+
+    A query matches the documents containing every one of its words, each word matching the indexed
+    terms it is a prefix of (from `min_prefix_length` characters, at most `max_expansions` terms);
+    matches on longer terms count for `prefix_weight` of an exact match.
+    """
+
+    def __init__(
+        self,
+        field_weights: Mapping[str, float] | None = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        min_prefix_length: int = 2,
+        max_expansions: int = 50,
+        prefix_weight: float = 0.5,
+    ) -> None:
+        self._field_weights = dict(field_weights or {})
+        self._k1 = k1
+        self._b = b
+        self._min_prefix_length = min_prefix_length
+        self._max_expansions = max_expansions
+        self._prefix_weight = prefix_weight
+
+        # term -> document -> weighted term frequency
+        self._postings: dict[str, dict[str, float]] = {}
+        self._doc_terms: dict[str, tuple[str, ...]] = {}
+        self._doc_lengths: dict[str, float] = {}
+        self._total_length = 0.0
+        # Sorted vocabulary and BM25 length normalizations of the documents, rebuilt on the first query
+        # after a change
+        self._sorted_terms: list[str] | None = []
+        self._norms: dict[str, float] | None = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._doc_lengths
+
+    def add(self, doc_id: str, fields: Mapping[str, str]) -> None:
+        """Index a document, replacing the previous version of `doc_id`."""
+
+        frequencies: Counter[str] = Counter()
+        length = 0.0
+        for name, text in fields.items():
+            if not text:
+                continue
+            weight = self._field_weights.get(name, 1.0)
+            tokens = tokenize(text)
+            length += weight * len(tokens)
+            for token, count in Counter(tokens).items():
+                frequencies[token] += weight * count
+
+        with self._lock:
+            self._remove(doc_id)
+            for term, frequency in frequencies.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._sorted_terms = None
+                postings[doc_id] = frequency
+            self._doc_terms[doc_id] = tuple(frequencies)
+            self._doc_lengths[doc_id] = length
+            self._total_length += length
+            self._norms = None
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document from the index, if it is indexed."""
+
+        with self._lock:
+            self._remove(doc_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings.clear()
+            self._doc_terms.clear()
+            self._doc_lengths.clear()
+            self._total_length = 0.0
+            self._sorted_terms = []
+            self._norms = {}
+
+    def search(self, query: str, limit: int | None = 20) -> list[SearchHit]:
+        """Best matches of a query, best first (then by document id)."""
+
+        words = list(dict.fromkeys(tokenize(query)))
+        if not words:
+            return []
+
+        with self._lock:
+            scores: dict[str, float] | None = None
+            for word in words:
+                # Documents must match every word: only the ones matching the previous words are scored
+                word_scores = self._score_word(word, scores)
+                if scores is not None:
+                    word_scores = {doc_id: scores[doc_id] + score for doc_id, score in word_scores.items()}
+                scores = word_scores
+                if not scores:
+                    return []
+
+        hits = (SearchHit(doc_id, score) for doc_id, score in scores.items())
+        if limit is None:
+            return sorted(hits, key=_rank)
+        return heapq.nsmallest(limit, hits, key=_rank)
+
+    def _remove(self, doc_id: str) -> None:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+        self._total_length -= self._doc_lengths.pop(doc_id)
+        self._norms = None
+
+    def _score_word(self, word: str, candidates: Mapping[str, float] | None) -> dict[str, float]:
+        """BM25 scores of the documents (among `candidates`) matching a word exactly or as a prefix."""
+
+        scores: dict[str, float] = {}
+        count = len(self._doc_lengths)
+        norms = self._length_norms()
+        k1 = self._k1
+
+        for term in self._expand(word):
+            postings = self._postings[term]
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            if term != word:
+                idf *= self._prefix_weight
+            if candidates is not None and len(candidates) < len(postings):
+                matches = [(doc_id, postings[doc_id]) for doc_id in candidates if doc_id in postings]
+            else:
+                matches = postings.items()
+            for doc_id, frequency in matches:
+                if candidates is not None and doc_id not in candidates:
+                    continue
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (k1 + 1) / (frequency + norms[doc_id])
+        return scores
+
+    def _length_norms(self) -> dict[str, float]:
+        if self._norms is None:
+            count = len(self._doc_lengths)
+            average_length = self._total_length / count if count and self._total_length else 1.0
+            self._norms = {
+                doc_id: self._k1 * (1 - self._b + self._b * length / average_length)
+                for doc_id, length in self._doc_lengths.items()
+            }
+        return self._norms
+
+    def _expand(self, word: str) -> list[str]:
+        """Indexed terms matched by a word: itself, and the terms it is a prefix of."""
+
+        terms = [word] if word in self._postings else []
+        if len(word) < self._min_prefix_length:
+            return terms
+
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        start = bisect.bisect_right(self._sorted_terms, word)
+        for term in self._sorted_terms[start : start + self._max_expansions]:
+            if not term.startswith(word):
+                break
+            terms.append(term)
+        return terms
+
+
+def _rank(hit: SearchHit) -> tuple[float, str]:
+    return -hit.score, hit.doc_id
@@ -0,0 +1,86 @@
+"""Skills put forward on the overview page, computed once from the skills table."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import polars as pl
+
+_DEFAULT_CATEGORY_ICON = "📌"
+
+
+@dataclass(frozen=True, slots=True)
+class HighlightedSkill:
+    name: str
+    level_label: str
+    last_used_year: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class CategoryHighlights:
+    category: str
+    icon: str
+    skills: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SkillHighlights:
+    """Ready to render lists of the overview page.
+
+    - `top_skills`: skills flagged as highlighted, best level first
+    - `categories`: for each category (in the order of the configuration), its best skills used
+      recently, best level first
+    """
+
+    top_skills: tuple[HighlightedSkill, ...]
+    categories: tuple[CategoryHighlights, ...]
+
+    @classmethod
+    def from_table(
+        cls,
+        skills: pl.DataFrame,
+        categories: Mapping[str, Mapping[str, str]],
+        level_labels: Mapping[int, str],
+        year: int,
+        min_level: int = 4,
+        recent_years: int = 4,
+        per_category: int = 10,
+    ) -> SkillHighlights:
+        """Highlights of a skills table, for the calendar `year`.
+
+        Skills of a category are the ones of level `min_level` or more, used during the last
+        `recent_years` years, at most `per_category` of them.
+        """
+
+        top_skills = tuple(
+            HighlightedSkill(
+                name=row["name"], level_label=level_labels[row["level"]], last_used_year=row["last_used_year"]
+            )
+            for row in skills.filter(pl.col("highlighted"))
+            .sort("level", descending=True, maintain_order=True)
+            .iter_rows(named=True)
+        )
+
+        recent = (
+            skills.lazy()
+            .filter((pl.col("level") >= min_level) & (pl.col("last_used_year") >= year - recent_years))
+            .sort("level", descending=True, maintain_order=True)
+            .group_by("category", maintain_order=True)
+            .agg(pl.col("name").head(per_category))
+            .collect()
+        )
+        names_by_category: dict[str, list[str]] = dict(recent.iter_rows())
+
+        return cls(
+            top_skills=top_skills,
+            categories=tuple(
+                CategoryHighlights(
+                    category=category,
+                    icon=config.get("icon", _DEFAULT_CATEGORY_ICON),
+                    skills=tuple(names_by_category[category]),
+                )
+                for category, config in categories.items()
+                if names_by_category.get(category)
+            ),
+        )
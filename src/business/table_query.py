@@ -0,0 +1,90 @@
+"""Filtering of tables (e.g. the skills table) compiled into single lazy polars queries."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import polars as pl
+
+type FilterType = Literal["is_equal", "is_match_str", "is_greater_or_equal"]
+
+
+@dataclass(frozen=True, slots=True)
+class Filter:
+    """Condition on a column: rows are kept when it holds.
+
+    - `is_equal`: the column equals `value`
+    - `is_match_str`: the column contains `value`, ignoring ASCII case
+    - `is_greater_or_equal`: the column is greater than or equal to `value`
+    """
+
+    type: FilterType
+    column: str
+    value: Any
+
+    def to_expr(self) -> pl.Expr:
+        match self.type:
+            case "is_equal":
+                return pl.col(self.column) == self.value
+            case "is_match_str":
+                return pl.col(self.column).str.contains_any([self.value], ascii_case_insensitive=True)
+            case "is_greater_or_equal":
+                return pl.col(self.column) >= self.value
+            case _:
+                raise RuntimeError(f"Unknown filter type: {self.type}")
+
+    def normalized(self) -> Filter:
+        """Equivalent filter, e.g. with substring searches lowercased (for ASCII case insensitivity)."""
+
+        if self.type == "is_match_str" and isinstance(self.value, str) and self.value.isascii():
+            return Filter(self.type, self.column, self.value.lower())
+        return self
+
+
+class TableQuery:
+    """Apply combinations of filters to a table.
+
+    Filters are combined with a logical AND, compiled into a single predicate and run as one lazy
+    query, so that no intermediate table is built. Results are memoised (LRU of `maxsize` entries) by
+    the normalized set of filters: the same filters in another order, repeated filters or searches
+    only differing by ASCII case share the same result.
+    """
+
+    def __init__(self, data: pl.DataFrame, maxsize: int = 64) -> None:
+        self._data = data
+        self._maxsize = maxsize
+        self._results: OrderedDict[frozenset[Filter], pl.DataFrame] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def data(self) -> pl.DataFrame:
+        return self._data
+
+    def run(self, filters: Iterable[Filter]) -> pl.DataFrame:
+        key = frozenset(f.normalized() for f in filters)
+
+        with self._lock:
+            if (result := self._results.get(key)) is not None:
+                self._results.move_to_end(key)
+                return result.clone()
+
+        result = self._data.lazy().filter(self.compile(key)).collect() if key else self._data
+
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+
+        return result.clone()
+
+    @staticmethod
+    def compile(filters: Iterable[Filter]) -> pl.Expr:
+        """Single predicate holding when every filter holds (always true without filters)."""
+
+        exprs = [f.to_expr() for f in filters]
+        return pl.all_horizontal(exprs) if exprs else pl.lit(True)
@@ -0,0 +1,33 @@
+"""Pages of the site, by section.
+
+Each page is rendered by a function of its own module, imported on the first render of the page
+(see `Router.lazy_page`): the dependencies of a page, e.g. polars for the skills table, are not
+loaded before a page needs them.
+"""
+
+from libs.cms import DEFAULT_SECTION, Router, SectionName
+
+_SECTION_CV: SectionName = "CV"
+_SECTION_CONTRIBUTIONS: SectionName = "Contributions"
+_SECTION_INFO: SectionName = "Information"
+
+ORDERED_SECTIONS = [_SECTION_CV, _SECTION_CONTRIBUTIONS, _SECTION_INFO]
+
+CARDS_PAGE_SIZE = 10
+
+router = Router()
+
+router.lazy_page(DEFAULT_SECTION, "src.pages.overview:overview", title="Thomas Marquis", icon=":material/home:")
+router.lazy_page(
+    _SECTION_CV, "src.pages.experiences:experiences", title="Experiences", icon=":material/business_center:"
+)
+router.lazy_page(_SECTION_CV, "src.pages.skills:skills", title="Skills", icon=":material/handyman:")
+router.lazy_page(_SECTION_CV, "src.pages.education:education", title="Education", icon=":material/school:")
+router.lazy_page(
+    _SECTION_CONTRIBUTIONS, "src.pages.side_projects:side_projects", title="Side Projects", icon=":material/code:"
+)
+router.lazy_page(
+    _SECTION_CONTRIBUTIONS, "src.pages.publications:publications", title="Publications", icon=":material/book:"
+)
+router.lazy_page(_SECTION_INFO, "src.pages.contact:contact", title="Contact", icon=":material/email:")
+router.lazy_page(_SECTION_INFO, "src.pages.search:search", title="Search", icon=":material/search:")
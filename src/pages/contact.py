@@ -0,0 +1,73 @@
+from functools import partial
+
+import streamlit as st
+
+from libs.cms.common.static_images import preload_static_image, static_image
+from libs.cms.warmup import Requirement
+from src.pages import router
+
+_CONTACT_LOGO_WIDTH = 50
+_LINKEDIN_LOGO = "content/assets/images/linkedin-logo.png"
+_GITHUB_LOGO = "content/assets/images/github-logo.png"
+_MEDIUM_LOGO = "content/assets/images/medium-logo.png"
+
+
+def requirements() -> tuple[Requirement, ...]:
+    return tuple(
+        partial(preload_static_image, logo, _CONTACT_LOGO_WIDTH)
+        for logo in (_LINKEDIN_LOGO, _GITHUB_LOGO, _MEDIUM_LOGO)
+    )
+
+
+@st.fragment
+def contact() -> None:
+    router.back_nav_link()
+    st.title(":mailbox: Contact")
+
+    st.space("medium")
+
+    with st.container(horizontal_alignment="center"):
+        st.subheader("Find me on...")
+        cols = st.columns(3)
+        with cols[0]:
+            with st.container(horizontal=False, horizontal_alignment="center"):
+                st.image(
+                    static_image(_LINKEDIN_LOGO, _CONTACT_LOGO_WIDTH).source,
+                    caption="",
+                    width=_CONTACT_LOGO_WIDTH,
+                )
+                st.link_button(
+                    "LinkedIn",
+                    "https://www.linkedin.com/in/thomas-marquis-contact/?locale=en",
+                    type="tertiary",
+                    icon=":material/open_in_new:",
+                )
+        with cols[1]:
+            with st.container(horizontal=False, horizontal_alignment="center"):
+                st.image(
+                    static_image(_GITHUB_LOGO, _CONTACT_LOGO_WIDTH).source,
+                    caption="",
+                    width=_CONTACT_LOGO_WIDTH,
+                )
+                st.link_button(
+                    "GitHub", "https://github.com/thomas-marquis", type="tertiary", icon=":material/open_in_new:"
+                )
+        with cols[2]:
+            with st.container(horizontal=False, horizontal_alignment="center"):
+                st.image(
+                    static_image(_MEDIUM_LOGO, _CONTACT_LOGO_WIDTH).source,
+                    caption="",
+                    width=_CONTACT_LOGO_WIDTH,
+                )
+                st.link_button(
+                    "Medium", "https://medium.com/@thomas.marquis314", type="tertiary", icon=":material/open_in_new:"
+                )
+
+        st.space("medium")
+        st.success(
+            "Feel free to reach out to me for any questions or collaboration opportunities, preferably via **LinkedIn**."
+        )
+
+        st.space("medium")
+
+        st.info("References available on request")
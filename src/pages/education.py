@@ -0,0 +1,25 @@
+import streamlit as st
+
+from libs.cms.documents.layouts import cards_and_dialogs_layout, cards_and_dialogs_requirements
+from libs.cms.warmup import Requirement
+from src.pages import CARDS_PAGE_SIZE, router
+
+_FOLDER_PATH = "content/education"
+
+
+def requirements() -> tuple[Requirement, ...]:
+    return cards_and_dialogs_requirements(_FOLDER_PATH)
+
+
+@st.fragment
+def education() -> None:
+    router.back_nav_link()
+
+    cards_and_dialogs_layout(router, ":man_student: Education", _FOLDER_PATH, page_size=CARDS_PAGE_SIZE)
+
+    st.divider()
+    with st.container(horizontal_alignment="right"):
+        st.page_link(
+            router.get_page("experiences", "See experiences ->"),
+            query_params={"from_page": "education"},
+        )
@@ -0,0 +1,33 @@
+import streamlit as st
+
+from libs.cms.documents.layouts import cards_and_dialogs_layout, cards_and_dialogs_requirements
+from libs.cms.warmup import Requirement
+from src.pages import CARDS_PAGE_SIZE, router
+from src.skills import render_skill_popover, resolve_document_skills, skill_popover_requirements
+
+_FOLDER_PATH = "content/experiences"
+
+
+def requirements() -> tuple[Requirement, ...]:
+    return (*cards_and_dialogs_requirements(_FOLDER_PATH), *skill_popover_requirements())
+
+
+@st.fragment
+def experiences() -> None:
+    router.back_nav_link()
+
+    cards_and_dialogs_layout(
+        router,
+        ":briefcase: Professional Experiences",
+        _FOLDER_PATH,
+        {"resolve_skills": resolve_document_skills, "on_skill_popover": render_skill_popover},
+        opened_doc_title=st.query_params.get("open_experience"),
+        page_size=CARDS_PAGE_SIZE,
+    )
+
+    st.divider()
+    with st.container(horizontal_alignment="right"):
+        st.page_link(
+            router.get_page("education", "See education ->"),
+            query_params={"from_page": "experiences"},
+        )
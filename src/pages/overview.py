@@ -0,0 +1,179 @@
+import datetime as dt
+from functools import partial
+
+import streamlit as st
+
+from libs.cms import file_payload, get_file_data
+from libs.cms.documents import load_highlighted_documents
+from libs.cms.warmup import Requirement
+from src.pages import router
+from src.skills import get_skill_highlights
+
+_RESUME_PATH = "content/documents/resume.pdf"
+
+
+def requirements() -> tuple[Requirement, ...]:
+    return (
+        partial(get_skill_highlights, dt.date.today().year),
+        partial(load_highlighted_documents, "content/experiences"),
+        partial(get_file_data, _RESUME_PATH),
+    )
+
+
+@st.fragment
+def overview() -> None:
+    if st.session_state.first_time:
+        st.title("👋 Welcome!")
+        st.session_state.first_time = False
+    else:
+        st.title("☕️ Thomas Marquis")
+
+    st.subheader("MLOps Engineer | Scaling AI from Research to Production")
+
+    cols = st.columns(2)
+    with cols[0]:
+        st.write(":material/check: 8 years of experience")
+    with cols[1]:
+        st.write(":material/check: Software engineering")
+        st.write(":material/check: MLOps")
+    st.space("small")
+
+    # Quick action buttons for recruiters
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        st.page_link(
+            router.get_page("experiences", "View Experience →"),
+            use_container_width=True,
+            query_params={"from_page": "overview"},
+        )
+    with col2:
+        st.page_link(
+            router.get_page("skills", "Browse Skills →"),
+            use_container_width=True,
+            query_params={"from_page": "overview"},
+        )
+
+    with col3:
+        with st.container(horizontal_alignment="right", vertical_alignment="top"):
+            st.download_button(
+                "Download my CV",
+                data=file_payload(_RESUME_PATH),
+                file_name="thomas_marquis_resume.pdf",
+                type="tertiary",
+                icon=":material/download:",
+            )
+
+    st.divider()
+
+    st.markdown("#### :hammer_and_wrench: Core Competencies")
+
+    highlights = get_skill_highlights(dt.date.today().year)
+
+    if len(highlights.top_skills) > 0:
+        cols = st.columns(4)
+        for idx, skill in enumerate(highlights.top_skills):
+            with cols[idx % 4]:
+                with st.container(border=True):
+                    st.markdown(f"**{skill.name}**")
+                    st.caption(f"⭐ {skill.level_label} | Last: {skill.last_used_year}")
+
+    st.divider()
+
+    st.markdown("#### :briefcase: Recent Experience Highlights")
+
+    highlighted_experiences = load_highlighted_documents("content/experiences")
+
+    if (nb := len(highlighted_experiences)) > 0:
+        cols = st.columns(nb)
+        for i, hexpe in enumerate(highlighted_experiences):
+            with cols[i]:
+                with st.container(border=True):
+                    st.markdown(f"**🚀 {hexpe.title}**")
+                    if p := hexpe.period:
+                        per_label = f"📅 From {p.start.strftime('%b %Y')}"
+                        if p.end:
+                            per_label += f" to {p.end.strftime('%b %Y')}"
+                        st.caption(per_label)
+                    st.markdown(hexpe.description)
+                    st.page_link(
+                        router.get_page("experiences", "Read full details →"),
+                        query_params={"from_page": "overview", "open_experience": hexpe.title},
+                    )
+    st.page_link(
+        router.get_page("experiences", "View all experiences →"),
+        query_params={"from_page": "overview"},
+    )
+    st.divider()
+
+    st.markdown("#### :rocket: Technical Highlights")
+
+    tech_col1, tech_col2 = st.columns(2)
+
+    for idx, category in enumerate(highlights.categories):
+        column = tech_col1 if idx % 2 == 0 else tech_col2
+        with column, st.expander(f"**{category.icon} {category.category}**", expanded=False):
+            for skill in category.skills:
+                st.markdown(f"- {skill}")
+
+            st.page_link(
+                router.get_page("skills", f"View all {category.category} skills →"),
+                query_params={"category": category.category, "from_page": "overview"},
+            )
+    st.divider()
+
+    st.markdown("#### :loudspeaker: Recent Publications & Talks")
+
+    pub_col1, pub_col2 = st.columns(2)
+
+    with pub_col1:
+        with st.container(border=True):
+            st.markdown("**When Go Meets AI: Building a RAG Application with Genkit**")
+            st.caption("Medium Article | September 2025")
+            st.markdown(
+                "Tutorial introducing Genkit fundamentals with practical examples for building RAG applications."
+            )
+            st.link_button(
+                "Read article →",
+                "https://medium.com/@thomas.marquis314/when-go-meets-ai-building-a-rag-application-with-genkit-3f0a2734eca7",
+                use_container_width=True,
+            )
+
+    with pub_col2:
+        with st.container(border=True):
+            st.markdown("**Mini-Conf MLOps Paris**")
+            st.caption("Conference Talk | December 2024")
+            st.markdown("Presented on MLOps implementation strategies in complex enterprise environments.")
+            st.link_button(
+                "View details →",
+                "https://www.linkedin.com/posts/florentpietot_premi%C3%A8re-%C3%A9dition-des-mini-conf-mlops-le-activity-7270806733076189184-ZA65/?originalSubdomain=fr",
+                use_container_width=True,
+            )
+
+    st.page_link(router.get_page("publications", "View all publications →"))
+
+    st.divider()
+
+    st.markdown("#### :mailbox: Let's Connect")
+
+    cta_col1, cta_col2, cta_col3 = st.columns(3)
+
+    with cta_col1:
+        st.page_link(
+            router.get_page("experiences", ":briefcase: Full Experience"),
+            use_container_width=True,
+            query_params={"from_page": "overview"},
+        )
+
+    with cta_col2:
+        st.page_link(
+            router.get_page("side_projects", ":rocket: Side Projects"),
+            use_container_width=True,
+            query_params={"from_page": "overview"},
+        )
+
+    with cta_col3:
+        st.page_link(
+            router.get_page("contact", ":email: Contact Me"),
+            use_container_width=True,
+            query_params={"from_page": "overview"},
+        )
@@ -0,0 +1,17 @@
+import streamlit as st
+
+from libs.cms.data.layouts import cards_layout, cards_requirements
+from libs.cms.warmup import Requirement
+from src.pages import CARDS_PAGE_SIZE, router
+
+_PUBLICATIONS_PATH = "content/publications.yaml"
+
+
+def requirements() -> tuple[Requirement, ...]:
+    return cards_requirements(_PUBLICATIONS_PATH)
+
+
+@st.fragment
+def publications() -> None:
+    router.back_nav_link()
+    cards_layout(":loudspeaker: Articles and Talks", _PUBLICATIONS_PATH, page_size=CARDS_PAGE_SIZE)
@@ -0,0 +1,50 @@
+from functools import partial
+
+import streamlit as st
+
+from libs.cms.warmup import Requirement
+from src.pages import router
+from src.search import search_site
+
+_SEARCH_LIMIT = 20
+
+
+def requirements() -> tuple[Requirement, ...]:
+    # Searching for nothing synchronizes the index with the content
+    return (partial(search_site, ""),)
+
+
+@st.fragment
+def search() -> None:
+    router.back_nav_link()
+    st.title(":mag: Search")
+
+    query = st.text_input(
+        "Search",
+        placeholder="Search experiences, projects, publications and skills...",
+        key="search_query",
+        label_visibility="collapsed",
+    )
+    if not query:
+        return
+
+    results = search_site(query, limit=_SEARCH_LIMIT)
+    if not results:
+        st.write("No results...")
+        return
+
+    for entry in results:
+        with st.container(border=True):
+            st.markdown(f"**{entry.title}**")
+            st.caption(entry.kind)
+            if entry.summary:
+                st.write(entry.summary)
+
+            with st.container(horizontal_alignment="right"):
+                if entry.page:
+                    st.page_link(
+                        router.get_page(entry.page, "View →"),
+                        query_params={"from_page": "search", **dict(entry.query_params)},
+                    )
+                elif entry.url:
+                    st.link_button("View :material/open_in_new:", entry.url, type="tertiary")
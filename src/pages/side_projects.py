@@ -0,0 +1,36 @@
+import textwrap
+
+import streamlit as st
+
+from libs.cms.documents.layouts import tabs_layout, tabs_requirements
+from libs.cms.documents.layouts.tabs import RenderingHooks
+from libs.cms.warmup import Requirement
+from src.pages import router
+
+_FOLDER_PATH = "content/side-projects"
+
+
+def requirements() -> tuple[Requirement, ...]:
+    return tabs_requirements(_FOLDER_PATH)
+
+
+@st.fragment
+def side_projects() -> None:
+    router.back_nav_link()
+
+    hooks: RenderingHooks = {
+        "overview_before": lambda: st.write(
+            textwrap.dedent("""
+            Alongside my professional work, I enjoy developing and experimenting with my own ideas.\n
+            Some of these are purely personal projects, but over time, I’ve begun open-sourcing several of them.\n
+            This list will continue to grow as I work on new projects.
+            """)
+        ),
+    }
+
+    tabs_layout(
+        ":rocket: Side projects",
+        _FOLDER_PATH,
+        rendering_hooks=hooks,
+        lazy=True,
+    )
@@ -0,0 +1,117 @@
+import datetime as dt
+
+import streamlit as st
+
+from libs.cms.warmup import Requirement
+from src.business.table_query import Filter
+from src.pages import router
+from src.skills import SkillLevelEnum, get_skills_query
+
+
+def requirements() -> tuple[Requirement, ...]:
+    return (get_skills_query,)
+
+
+@st.fragment
+def skills() -> None:
+    router.back_nav_link()
+
+    st.title(":hammer_and_wrench: Skills")
+
+    query = get_skills_query()
+    filters: list[Filter] = []
+
+    with st.expander("Filters...", expanded=False):
+        cols = st.columns(3)
+        with cols[0]:
+            prod_only = st.radio(
+                "Show only skills used in production?",
+                (None, True, False),
+                format_func=lambda x: {True: "Yes", False: "No", None: "View All"}[x],
+                key="prod_filter",
+            )
+            if prod_only is not None:
+                filters.append(Filter("is_equal", "in_industrial_context", prod_only))
+
+        with cols[1]:
+            # Category filter
+            categories = sorted(query.data["category"].unique().to_list())
+            selected_category = st.selectbox(
+                "Filter by category",
+                options=["All"] + categories,
+                key="category_filter",
+            )
+            if selected_category != "All":
+                filters.append(Filter("is_equal", "category", selected_category))
+
+        with cols[2]:
+            max_age = st.slider("Show skills used after...", 2017, dt.date.today().year, 2017, step=1, key="max_age")
+            filters.append(Filter("is_greater_or_equal", "last_used_year", max_age))
+
+        skill_name = st.text_input("Filter by skill name", key="skill_name")
+        if skill_name:
+            filters.append(Filter("is_match_str", "name", skill_name))
+
+    # Handle query parameters
+    if "skill_name" in st.query_params:
+        filters.append(Filter("is_match_str", "name", st.query_params.skill_name))
+        st.query_params.pop("skill_name", None)
+
+    if "category" in st.query_params:
+        filters.append(Filter("is_equal", "category", st.query_params.category))
+        st.query_params.pop("category", None)
+
+    if st.button("Reset filters", key="reset_filters"):
+        filters = []
+
+    st.dataframe(
+        query.run(filters),
+        height="content",
+        column_order=["name", "level", "last_used_year", "in_industrial_context", "category", "link"],
+        column_config={
+            "name": st.column_config.TextColumn(
+                "Skill",
+                pinned=True,
+                width=180,
+            ),
+            "level": st.column_config.ProgressColumn(
+                "Level",
+                help="Self-evaluated level for the skill. "
+                "It correspond to the level reached the last time I used the skill. "
+                'So, you need to consider this value regarding to the value of the column "Last used". '
+                "See bellow for details about skill levels",
+                min_value=0,
+                max_value=5,
+                format="%d/5",
+            ),
+            "last_used_year": st.column_config.NumberColumn(
+                "Last used",
+                help="Year when I last used this skill",
+            ),
+            "in_industrial_context": st.column_config.CheckboxColumn(
+                "Used in production?",
+                help="Whether I used this skill in real production context or not",
+            ),
+            "category": st.column_config.TextColumn(
+                "Category",
+                help="Skill category for classification",
+            ),
+            "link": st.column_config.LinkColumn(
+                "More info...",
+                help="Link to the skill documentation",
+                default="",
+                display_text=r"https?://(.*?)\/.*",
+            ),
+        },
+    )
+
+    with st.expander("About skill levels...", expanded=False):
+        for level in SkillLevelEnum:
+            label_col, desc_col, ex_col = st.columns(3)
+            with label_col:
+                st.write(f"**{level.value.level}-{level.value.label}**")
+            with desc_col:
+                st.write(f"{level.value.description}")
+            with ex_col:
+                with st.expander("Examples...", expanded=False):
+                    st.write(level.examples_formatted)
@@ -0,0 +1,160 @@
+"""Site-wide search over the documents, publications and skills."""
+
+import re
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import partial
+
+import streamlit as st
+
+from libs.cms.data.datasource import Item
+from libs.cms.data.layouts.cards import load_items
+from libs.cms.documents import load_documents
+from libs.cms.documents.datasource import MarkdownDocument
+from src.business.search_index import SearchIndex
+from src.skills import SkillInfo, get_skill_index
+
+PUBLICATIONS_FILEPATH = "content/publications.yaml"
+
+# Page displaying the documents of each folder, with the kind of its documents
+_DOCUMENT_FOLDERS = {
+    "experiences": ("Experience", "content/experiences"),
+    "education": ("Education", "content/education"),
+    "side_projects": ("Side project", "content/side-projects"),
+}
+_FIELD_WEIGHTS = {"title": 3.0, "skills": 2.0, "description": 1.5, "category": 1.5, "body": 1.0}
+
+# Markup of Markdown bodies which isn't displayed as text: image and link targets, HTML tags
+_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_LINK_DEFINITION = re.compile(r"^ {0,3}\[[^\]]+\]:.*$", re.MULTILINE)
+_HTML_TAG = re.compile(r"<[^>]*>")
+
+
+@dataclass(frozen=True, slots=True)
+class SearchEntry:
+    """Something of the site found by a search, and where to see it: a page or an external link."""
+
+    kind: str
+    title: str
+    summary: str | None = None
+    page: str | None = None
+    query_params: tuple[tuple[str, str], ...] = ()
+    url: str | None = None
+
+
+type _Describe[T] = Callable[[T], tuple[SearchEntry, Mapping[str, str]]]
+
+
+class SiteSearch:
+    """Search index of the site content, kept in sync with the sources of that content.
+
+    A source is a sequence of items returned as the same object until its content changes, with its
+    unchanged items keeping their identity (as `DirectoryIndex` and content caches do). Syncing an
+    unchanged source costs nothing, and only the new or modified items of a changed source are
+    indexed again, so documents are never read on a search.
+    """
+
+    def __init__(self, index: SearchIndex | None = None) -> None:
+        self._index = index or SearchIndex(field_weights=_FIELD_WEIGHTS)
+        self._sources: dict[str, tuple[Sequence[object], dict[str, object]]] = {}
+        self._entries: dict[str, SearchEntry] = {}
+        self._lock = threading.Lock()
+
+    def sync[T](self, source: str, items: Sequence[T], key: Callable[[T], str], describe: _Describe[T]) -> bool:
+        """Index the items of a source, `key` identifying each one of them; tell whether anything changed."""
+
+        with self._lock:
+            state = self._sources.get(source)
+            if state is not None and state[0] is items:
+                return False
+            previous = state[1] if state is not None else {}
+
+            current: dict[str, object] = {}
+            for item in items:
+                doc_id = f"{source}:{key(item)}"
+                current[doc_id] = item
+                if previous.get(doc_id) is item:
+                    continue
+                entry, fields = describe(item)
+                self._index.add(doc_id, fields)
+                self._entries[doc_id] = entry
+
+            for doc_id in previous.keys() - current.keys():
+                self._index.remove(doc_id)
+                del self._entries[doc_id]
+
+            self._sources[source] = (items, current)
+            return True
+
+    def search(self, query: str, limit: int | None = 20) -> list[SearchEntry]:
+        """Entries best matching a query, best first."""
+
+        hits = self._index.search(query, limit=limit)
+        with self._lock:
+            return [entry for hit in hits if (entry := self._entries.get(hit.doc_id)) is not None]
+
+
+@st.cache_resource(show_spinner=False)
+def get_site_search() -> SiteSearch:
+    return SiteSearch()
+
+
+def search_site(query: str, limit: int | None = 20) -> list[SearchEntry]:
+    """Search the documents, publications and skills, synchronizing the index with them first."""
+
+    site_search = get_site_search()
+
+    for page, (kind, folder) in _DOCUMENT_FOLDERS.items():
+        site_search.sync(page, load_documents(folder), _document_key, partial(_describe_document, kind, page))
+    site_search.sync("publications", load_items(PUBLICATIONS_FILEPATH), _publication_key, _describe_publication)
+    site_search.sync("skills", get_skill_index().skills(), _skill_key, _describe_skill)
+
+    return site_search.search(query, limit=limit)
+
+
+def _document_key(doc: MarkdownDocument) -> str:
+    return str(doc.path)
+
+
+def _describe_document(kind: str, page: str, doc: MarkdownDocument) -> tuple[SearchEntry, Mapping[str, str]]:
+    query_params = (("open_experience", doc.title),) if page == "experiences" else ()
+    entry = SearchEntry(kind=kind, title=doc.title, summary=doc.description, page=page, query_params=query_params)
+    fields = {
+        "title": doc.title,
+        "description": doc.description or "",
+        "skills": " ".join(skill.name for skill in doc.skills),
+        "body": _displayed_text(doc.read_body()),
+    }
+    return entry, fields
+
+
+def _displayed_text(markdown: str) -> str:
+    """Text of a Markdown body without the targets of its images and links, nor HTML tags."""
+
+    text = _LINK.sub(r"\1", _IMAGE.sub(r"\1", markdown))  # images first, as they may be linked
+    text = _LINK_DEFINITION.sub("", text)
+    return _HTML_TAG.sub(" ", text)
+
+
+def _publication_key(item: Item) -> str:
+    return item.link
+
+
+def _describe_publication(item: Item) -> tuple[SearchEntry, Mapping[str, str]]:
+    entry = SearchEntry(kind=item.category or "Publication", title=item.title, summary=item.description, url=item.link)
+    fields = {"title": item.title, "description": item.description or "", "category": item.category or ""}
+    return entry, fields
+
+
+def _skill_key(skill: SkillInfo) -> str:
+    return skill.name.lower()
+
+
+def _describe_skill(skill: SkillInfo) -> tuple[SearchEntry, Mapping[str, str]]:
+    summary = f"{skill.level.label} | {skill.category}" if skill.level else skill.category
+    entry = SearchEntry(
+        kind="Skill", title=skill.name, summary=summary, page="skills", query_params=(("skill_name", skill.name),)
+    )
+    return entry, {"title": skill.name, "category": skill.category}
@@ -1,15 +1,25 @@
 from collections import namedtuple
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 
 import polars as pl
 import streamlit as st
-import yaml
 
 from libs.cms import Router
+from libs.cms.common.content_cache import content_cache
+from libs.cms.data.datasource import CsvTableLoader
+from libs.cms.documents.datasource import MarkdownDocument, load_documents, load_documents_with_skill
+from libs.cms.snapshot import read_yaml
+from libs.cms.warmup import Requirement
+from src.business.skill_highlights import SkillHighlights
+from src.business.table_query import TableQuery
 
 SKILLS_FILEPATH = "content/skills.csv"
 CATEGORIES_FILEPATH = "content/skill_categories.yaml"
+# Folders of the documents listed in the "used in" section of skill popovers
+_SKILL_DOCUMENT_FOLDERS = ("content/experiences", "content/side-projects")
 
 SkillLevel = namedtuple("SkillLevel", ["level", "label", "description", "examples"])
 
@@ -88,7 +98,7 @@ class SkillLevelEnum(Enum):
         return res[0]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SkillInfo:
     name: str
     level: SkillLevel
@@ -98,54 +108,106 @@ class SkillInfo:
     link: str | None = None
 
 
-@st.cache_data
-def load_skill_categories() -> dict[str, dict[str, str]]:
-    with open(CATEGORIES_FILEPATH, "r") as f:
-        config = yaml.safe_load(f)
+@content_cache()
+def load_skill_categories() -> Mapping[str, Mapping[str, str]]:
+    config = read_yaml(CATEGORIES_FILEPATH)
     return config.get("categories", {})
 
 
-@st.cache_data()
+@content_cache()
 def load_skills_data() -> pl.DataFrame:
-    return (
-        pl.read_csv(SKILLS_FILEPATH, has_header=True)
-        .cast(
-            {
-                "level": pl.Int64,
-                "last_used_year": pl.Int64,
-                "in_industrial_context": pl.Boolean,
-                "highlighted": pl.Boolean,
-            }
-        )
-        .sort("level", descending=True)
+    return CsvTableLoader(
+        SKILLS_FILEPATH,
+        dtypes={
+            "level": pl.Int64,
+            "last_used_year": pl.Int64,
+            "in_industrial_context": pl.Boolean,
+            "highlighted": pl.Boolean,
+        },
+        sort_by="level",
+        descending=True,
+    ).load()
+
+
+@content_cache()
+def get_skills_query() -> TableQuery:
+    """Filters of the skills table, as displayed on the Skills page."""
+    return TableQuery(load_skills_data().select(pl.exclude("highlighted")).with_columns(pl.col("link").fill_null("")))
+
+
+@content_cache(maxsize=4)
+def get_skill_highlights(year: int) -> SkillHighlights:
+    """Skills put forward on the overview page, computed once per content version and calendar year."""
+    return SkillHighlights.from_table(
+        load_skills_data(),
+        load_skill_categories(),
+        level_labels={it.value.level: it.value.label for it in reversed(SkillLevelEnum)},
+        year=year,
     )
 
 
-@st.cache_data()
+class SkillIndex:
+    """Case-insensitive index of the skills table by skill name.
+
+    When several rows share a name, the first one (i.e. the highest level) is kept.
+    """
+
+    def __init__(self, skills: pl.DataFrame) -> None:
+        levels: dict[int, SkillLevel] = {}
+        for it in SkillLevelEnum:
+            levels.setdefault(it.value.level, it.value)
+
+        self._skills: dict[str, SkillInfo] = {}
+        for row in skills.iter_rows(named=True):
+            self._skills.setdefault(
+                row["name"].lower(),
+                SkillInfo(
+                    name=row["name"],
+                    last_used_year=row["last_used_year"],
+                    level=levels.get(row["level"]),
+                    in_industrial_context=row["in_industrial_context"],
+                    link=row["link"],
+                    category=row["category"],
+                ),
+            )
+
+        self._all = tuple(self._skills.values())
+
+    def skills(self) -> tuple[SkillInfo, ...]:
+        """Indexed skills, in the order of the table; the same tuple on every call."""
+        return self._all
+
+    def get(self, skill_name: str) -> SkillInfo | None:
+        return self._skills.get(skill_name.lower())
+
+    def for_document(self, doc: MarkdownDocument) -> dict[str, SkillInfo]:
+        """Known skills of a document, keyed by their name in the document."""
+        return {skill.name: info for skill in doc.skills if (info := self._skills.get(skill.name.lower())) is not None}
+
+
+@content_cache()
+def get_skill_index() -> SkillIndex:
+    """Index of the current skills table, rebuilt when the content caches are cleared."""
+    return SkillIndex(load_skills_data())
+
+
 def get_skill_info(skill_name: str) -> SkillInfo | None:
-    all_skills = load_skills_data()
-    skill_row = all_skills.filter(pl.col("name").str.to_lowercase() == skill_name.lower())
-    if len(skill_row) == 0:
-        return None
-    if len(skill_row) > 1:
-        skill_row = skill_row.head(1)
-
-    level = (
-        tmp[0] if (tmp := [it.value for it in SkillLevelEnum if it.value.level == skill_row["level"].item()]) else None
-    )
+    return get_skill_index().get(skill_name)
 
-    return SkillInfo(
-        name=skill_row["name"].item(),
-        last_used_year=skill_row["last_used_year"].item(),
-        level=level,
-        in_industrial_context=skill_row["in_industrial_context"].item(),
-        link=skill_row["link"].item(),
-        category=skill_row["category"].item(),
-    )
+
+def resolve_document_skills(doc: MarkdownDocument) -> dict[str, SkillInfo]:
+    """Known skills of a document, resolved at once, e.g. for the `resolve_skills` rendering hook."""
+    return get_skill_index().for_document(doc)
 
 
-def render_skill_popover(skill_name: str, router: Router) -> None:
-    skill = get_skill_info(skill_name)
+def skill_popover_requirements() -> tuple[Requirement, ...]:
+    """What `render_skill_popover` needs to render, see `libs.cms.warmup`."""
+    return (get_skill_index, *(partial(load_documents, folder) for folder in _SKILL_DOCUMENT_FOLDERS))
+
+
+def render_skill_popover(skill_name: str, router: Router, skill: SkillInfo | None) -> None:
+    """Details of a skill, as resolved by `resolve_document_skills`; nothing for an unknown skill."""
+
     if skill is None:
         return
 
@@ -173,6 +235,10 @@ def render_skill_popover(skill_name: str, router: Router) -> None:
             msg += " (never in production)"
         st.caption(msg)
 
+    used_in = [doc.title for folder in _SKILL_DOCUMENT_FOLDERS for doc in load_documents_with_skill(folder, skill_name)]
+    if used_in:
+        st.caption("Used in: " + " · ".join(used_in))
+
     with st.container(horizontal_alignment="right"):
         st.page_link(
             router.get_page("skills", "View all related skills ->"),
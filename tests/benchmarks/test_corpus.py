@@ -0,0 +1,37 @@
+import polars as pl
+import pytest
+
+from benchmarks.corpus import generate_corpus
+from libs.cms.data.datasource import YamlDocumentLoader
+from libs.cms.documents.datasource import MarkdownLoader
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory):
+    return generate_corpus(tmp_path_factory.mktemp("corpus"), 12)
+
+
+class TestGenerateCorpus:
+    def test_writes_documents_with_front_matter(self, corpus):
+        documents = MarkdownLoader(corpus.root / corpus.illustrated_dir).load_all()
+
+        assert len(documents) == 12
+        assert all(doc.title.startswith("Document ") and doc.skills for doc in documents)
+
+    def test_references_existing_images_in_illustrated_documents_only(self, corpus):
+        illustrated = MarkdownLoader(corpus.root / corpus.illustrated_dir).load_all()[0]
+        plain = MarkdownLoader(corpus.root / corpus.plain_dir).load_all()[0]
+
+        image = illustrated.path.read_text().split("![Illustration 0](", 1)[1].split(")", 1)[0]
+        assert (illustrated.path.parent / image).is_file()
+        assert "![" not in plain.path.read_text()
+
+    def test_writes_publications_and_skills(self, corpus):
+        assert len(YamlDocumentLoader(corpus.root / corpus.publications_path).load()) == 12
+        skills = pl.read_csv(corpus.root / corpus.skills_path)
+        assert skills["name"].to_list() == corpus.skill_names
+
+    def test_is_reproducible(self, corpus, tmp_path):
+        other = generate_corpus(tmp_path, 12)
+
+        assert (other.root / other.skills_path).read_bytes() == (corpus.root / corpus.skills_path).read_bytes()
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from benchmarks.runner import Comparison, Measure, compare, read_results, write_results
+
+
+def _measure(benchmark: str, scale: int, median: float) -> Measure:
+    return Measure(benchmark=benchmark, scale=scale, repeat=3, min=median, median=median, mean=median)
+
+
+class TestComparison:
+    class TestIsRegression:
+        def test_slower_beyond_tolerance(self):
+            assert Comparison("a[10]", baseline=0.1, current=0.2).is_regression(tolerance=0.25, min_delta=1e-3)
+
+        def test_slower_within_tolerance(self):
+            assert not Comparison("a[10]", baseline=0.1, current=0.12).is_regression(tolerance=0.25, min_delta=1e-3)
+
+        def test_ignores_slowdowns_under_min_delta(self):
+            assert not Comparison("a[10]", baseline=1e-5, current=1e-4).is_regression(tolerance=0.25, min_delta=1e-3)
+
+
+class TestCompare:
+    def test_compares_medians_of_measures_having_a_baseline(self):
+        measures = [_measure("a", 10, 0.2), _measure("b", 10, 0.1)]
+
+        assert compare({"a[10]": 0.1, "a[100]": 1.0}, measures) == [Comparison("a[10]", baseline=0.1, current=0.2)]
+
+
+class TestResults:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "results" / "results.json"
+
+        write_results(path, [_measure("a", 10, 0.2), _measure("a", 100, 2.0)])
+
+        assert read_results(path) == {"a[10]": 0.2, "a[100]": 2.0}
+
+    def test_rejects_unknown_format(self, tmp_path):
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps({"format": 0, "results": {}}))
+
+        with pytest.raises(ValueError, match="Unsupported benchmark results format"):
+            read_results(path)
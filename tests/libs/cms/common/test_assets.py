@@ -0,0 +1,61 @@
+import shutil
+
+import pytest
+
+from libs.cms.common.assets import AssetStore
+
+
+class TestAssetStore:
+    @pytest.fixture
+    def store(self, tmp_path) -> AssetStore:
+        return AssetStore(tmp_path / "static" / "assets", url_prefix="app/static/assets", inline=False)
+
+    @pytest.fixture(autouse=True)
+    def static_serving(self, mocker):
+        return mocker.patch("streamlit.get_option", return_value=True)
+
+    @pytest.fixture
+    def image(self, tmp_path):
+        path = tmp_path / "logo.PNG"
+        path.write_bytes(b"\x89PNG\r\n\x1a\nlogo")
+        return path
+
+    class TestUrlFor:
+        def test_returns_content_addressed_url(self, store, image):
+            url = store.url_for(image)
+
+            digest = store.digest(image)
+            assert url == f"app/static/assets/{digest}.png?v={digest}"
+
+        def test_same_content_gives_same_url(self, store, image, tmp_path):
+            copy = tmp_path / "copy.png"
+            copy.write_bytes(image.read_bytes())
+
+            assert store.url_for(copy) == store.url_for(image)
+
+        def test_changed_content_gives_new_url(self, store, image):
+            first = store.url_for(image)
+
+            image.write_bytes(b"\x89PNG\r\n\x1a\nnew logo")
+
+            assert store.url_for(image) != first
+
+        def test_inlines_when_static_serving_is_disabled(self, store, image, static_serving):
+            static_serving.return_value = False
+
+            assert store.url_for(image).startswith("data:image/png;base64,")
+
+        def test_inlines_files_that_cannot_be_served(self, store, tmp_path):
+            svg = tmp_path / "logo.svg"
+            svg.write_text("<svg></svg>")
+
+            assert store.url_for(svg).startswith("data:image/svg+xml;base64,")
+
+    class TestPublish:
+        def test_copies_file_once(self, store, image, tmp_path, mocker):
+            digest = store.publish(image)
+            copy_spy = mocker.spy(shutil, "copyfileobj")
+
+            assert store.publish(image) == digest
+            assert copy_spy.call_count == 0
+            assert (tmp_path / "static" / "assets" / f"{digest}.png").read_bytes() == image.read_bytes()
@@ -0,0 +1,75 @@
+from types import MappingProxyType
+
+import polars as pl
+import pytest
+
+from libs.cms.common import content_cache as content_cache_module
+from libs.cms.common.content_cache import clear_content_caches, content_cache
+from libs.cms.metrics import MetricsRegistry
+
+
+class TestContentCache:
+    @pytest.fixture
+    def loader(self, mocker):
+        return mocker.Mock(side_effect=lambda name: {"name": name, "tags": ["a", "b"], "nested": {"key": [1]}})
+
+    @pytest.fixture
+    def cached(self, loader):
+        return content_cache()(loader)
+
+    class TestCall:
+        def test_returns_the_same_instance_for_the_same_arguments(self, cached, loader):
+            first = cached("doc")
+            second = cached("doc")
+
+            assert first is second
+            assert cached("other")["name"] == "other"
+            assert loader.call_count == 2
+
+        def test_freezes_dicts_and_lists(self, cached):
+            result = cached("doc")
+
+            assert isinstance(result, MappingProxyType)
+            assert result["tags"] == ("a", "b")
+            assert result["nested"]["key"] == (1,)
+            with pytest.raises(TypeError):
+                result["name"] = "changed"
+
+        def test_returns_polars_frames_as_clones(self):
+            frame = pl.DataFrame({"name": ["a", "b"]})
+            cached = content_cache()(lambda: frame)
+
+            first = cached()
+            first.insert_column(1, pl.Series("extra", [1, 2]))
+
+            assert cached().columns == ["name"]
+
+        def test_records_cache_events_and_load_durations(self, loader, mocker):
+            registry = MetricsRegistry(enabled=True)
+            mocker.patch.object(content_cache_module, "metrics", registry)
+            cached = content_cache(maxsize=1)(loader)
+
+            cached("doc")
+            cached("doc")
+            cached("other")
+
+            counters = registry.to_dict()["counters"]["cms_cache_events_total"]
+            assert {(c["labels"]["event"], c["value"]) for c in counters} == {("hit", 1), ("miss", 2), ("eviction", 1)}
+            assert registry.to_dict()["histograms"]["cms_loader_seconds"][0]["count"] == 2
+
+    class TestClear:
+        def test_loads_again_after_clear(self, cached, loader):
+            first = cached("doc")
+
+            cached.clear()
+
+            assert cached("doc") is not first
+            assert loader.call_count == 2
+
+        def test_clear_content_caches_invalidates_every_loader(self, cached, loader):
+            cached("doc")
+
+            clear_content_caches()
+            cached("doc")
+
+            assert loader.call_count == 2
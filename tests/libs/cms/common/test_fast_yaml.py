@@ -0,0 +1,207 @@
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from libs.cms.common.fast_yaml import UnsupportedYamlError, load_simple, safe_load
+
+CONTENT_DIR = Path(__file__).parents[4] / "content"
+
+
+def _content_documents() -> list[Any]:
+    documents = [pytest.param(path.read_text(encoding="utf-8"), id=path.name) for path in CONTENT_DIR.glob("*.yaml")]
+    for path in sorted(CONTENT_DIR.glob("*/*.md")):
+        _, header, _ = path.read_text(encoding="utf-8").split("---\n", 2)
+        documents.append(pytest.param(header.removesuffix("\n"), id=path.name))
+    return documents
+
+
+def _assert_identical(actual: Any, expected: Any) -> None:
+    """Equality which also checks types, as `True == 1` and `1 == 1.0`."""
+
+    assert type(actual) is type(expected), f"{actual!r} != {expected!r}"
+    if isinstance(expected, dict):
+        assert list(actual) == list(expected)
+        for key in expected:
+            _assert_identical(actual[key], expected[key])
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for actual_item, expected_item in zip(actual, expected, strict=True):
+            _assert_identical(actual_item, expected_item)
+    else:
+        assert actual == expected
+
+
+# Scalars handled by the restricted parser, and scalars which should make it hand over to PyYAML
+_SIMPLE_SCALARS = [
+    "text",
+    "Some text with spaces",
+    "C#",
+    "http://example.com/a:b",
+    "Master's",
+    "[link](http://x.y)",
+    "yes",
+    "No",
+    "on",
+    "OFF",
+    "true",
+    "False",
+    "null",
+    "~",
+    "",
+    "0",
+    "12",
+    "-3",
+    "+4",
+    "2024-01",
+    "2024-1",
+    '"double"',
+    '""',
+    "'single'",
+    "'it''s'",
+    "emoji 💻",
+    "ends with space ",
+]
+_OTHER_SCALARS = [
+    "a #b",
+    "a: b",
+    "trailing:",
+    "007",
+    "0x1F",
+    "1_000",
+    "1.5",
+    ".inf",
+    "-.5",
+    "1e3",
+    "2024-01-01",
+    "12024-01",
+    "1:30",
+    "<<",
+    "=",
+    "- item",
+    "*alias",
+    "&anchor value",
+    "!tag value",
+    "%percent",
+    "@at",
+    "`tick`",
+    "|",
+    ">",
+    "{a: 1}",
+    "[1, 2]",
+    '"double \\" escaped"',
+    '"with \\n escape"',
+    "'broken",
+    '"broken',
+    "tab\there",
+]
+_KEYS = ["title", "description", "Data & AI", "weight", "a_b", "it's", "on", "null", "1", "'quoted'"]
+
+
+def _scalar(rng: random.Random) -> str:
+    return rng.choice(_SIMPLE_SCALARS if rng.random() < 0.9 else _OTHER_SCALARS)
+
+
+def _key(rng: random.Random) -> str:
+    return rng.choice(_KEYS[:6] if rng.random() < 0.95 else _KEYS[6:])
+
+
+def _random_document(rng: random.Random, indent: int = 0, depth: int = 0) -> str:
+    pad = " " * indent
+    lines = []
+    if rng.random() < 0.3:
+        lines.append(f"{pad}# comment")
+
+    if depth > 0 and rng.random() < 0.3:
+        for _ in range(rng.randint(1, 3)):
+            if rng.random() < 0.5:
+                lines.append(f"{pad}- {_scalar(rng)}")
+            else:
+                lines.append(f"{pad}- {_key(rng)}: {_scalar(rng)}")
+                lines.append(f"{pad}  {_key(rng)}: {_scalar(rng)}")
+        return "\n".join(lines)
+
+    for _ in range(rng.randint(1, 4)):
+        kind = rng.random()
+        if depth < 2 and kind < 0.25:
+            lines.append(f"{pad}{_key(rng)}:")
+            lines.append(_random_document(rng, indent + rng.choice((0, 2, 2, 4)), depth + 1))
+        elif kind < 0.45:
+            lines.append(f"{pad}{_key(rng)}: {rng.choice(('|', '|', '|-', '|+', '>'))}")
+            body_pad = " " * (indent + 2)
+            for _ in range(rng.randint(0, 4)):
+                lines.append(rng.choice(("", f"{body_pad}line", f"{body_pad}  more indented", f"{body_pad}- item")))
+        else:
+            lines.append(f"{pad}{_key(rng)}: {_scalar(rng)}")
+        if rng.random() < 0.2:
+            lines.append("")
+    return "\n".join(lines)
+
+
+def _assert_same_as_pyyaml(text: str) -> None:
+    try:
+        expected = yaml.safe_load(text)
+    except yaml.YAMLError:
+        with pytest.raises(yaml.YAMLError):
+            safe_load(text)
+    else:
+        _assert_identical(safe_load(text), expected)
+
+
+class TestSafeLoad:
+    @pytest.mark.parametrize("text", _content_documents())
+    def test_matches_pyyaml_on_content_files(self, text):
+        _assert_identical(safe_load(text), yaml.safe_load(text))
+
+    @pytest.mark.parametrize("seed", range(300))
+    def test_matches_pyyaml_on_generated_documents(self, seed):
+        _assert_same_as_pyyaml(_random_document(random.Random(seed)))
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "# only a comment\n",
+            "key:\n",
+            "key:\nother: 1\n",
+            "list:\n- a\n- b\nnext: c\n",
+            "list:\n  - a\n  -   b\n",
+            "items:\n  - name: a\n    value: 1\n  - name: b\n",
+            "text: |\n  line\n\n  after blank\n\n\nnext: 1\n",
+            "text: |-\n  line\n    indented\n",
+            "text: |\n  no trailing newline",
+            "text: |\n\n  leading blank\n",
+            "text: |\nnext: 1\n",
+            "text: |\n  # not a comment\n",
+            "key: value # comment\n",
+            "key: plain\n  continued\n",
+            "key: 'single' # comment\n",
+            "- top\n- level\n",
+            "anchors: &a\n  x: 1\ncopy: *a\n",
+            "---\nkey: value\n",
+            "key: value\r\nother: 1\r\n",
+            "key:\tvalue\n",
+            "\ufeffkey: value\n",
+            "date: 2024-01-02\n",
+            "float: 1.0\n",
+            "dup: 1\ndup: 2\n",
+        ],
+    )
+    def test_matches_pyyaml_on_edge_cases(self, text):
+        _assert_same_as_pyyaml(text)
+
+
+class TestLoadSimple:
+    @pytest.mark.parametrize("text", _content_documents())
+    def test_handles_content_files_without_fallback(self, text):
+        _assert_identical(load_simple(text), yaml.safe_load(text))
+
+    @pytest.mark.parametrize(
+        "text",
+        ["key: 1.5", "key: [a, b]", "key: >\n  folded", "key: plain\n  continued", "key: *alias", 'key: "a\\nb"'],
+    )
+    def test_rejects_unsupported_documents(self, text):
+        with pytest.raises(UnsupportedYamlError):
+            load_simple(text)
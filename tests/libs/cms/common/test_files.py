@@ -0,0 +1,115 @@
+import os
+
+import pytest
+
+from libs.cms.common import files
+from libs.cms.common.files import FilePayloadCache
+from libs.cms.metrics import MetricsRegistry
+
+
+class TestFilePayloadCache:
+    @pytest.fixture
+    def read(self, mocker):
+        return mocker.patch.object(files, "open", create=True, wraps=open)
+
+    @pytest.fixture
+    def registry(self, mocker) -> MetricsRegistry:
+        return mocker.patch.object(files, "metrics", MetricsRegistry(enabled=True))
+
+    @pytest.fixture
+    def cache(self) -> FilePayloadCache:
+        return FilePayloadCache(max_bytes=10)
+
+    @pytest.fixture
+    def small_file(self, tmp_path):
+        path = tmp_path / "small.txt"
+        path.write_bytes(b"12345")
+        return path
+
+    class TestGet:
+        def test_reads_file_once(self, cache, small_file, read):
+            assert cache.get(small_file) == b"12345"
+            assert cache.get(str(small_file)) == b"12345"
+            assert read.call_count == 1
+
+        def test_reads_modified_file_again(self, cache, small_file):
+            cache.get(small_file)
+
+            small_file.write_bytes(b"123456")
+
+            assert cache.get(small_file) == b"123456"
+            assert cache.size == 6
+
+        def test_evicts_least_recently_used_files_beyond_budget(self, cache, small_file, tmp_path, read):
+            other = tmp_path / "other.txt"
+            other.write_bytes(b"abcde")
+            last = tmp_path / "last.txt"
+            last.write_bytes(b"xyz")
+            cache.get(small_file)
+            cache.get(other)
+            cache.get(small_file)
+
+            cache.get(last)
+
+            assert cache.size == 8
+            read.reset_mock()
+            cache.get(small_file)
+            cache.get(last)
+            cache.get(other)
+            assert [call.args[0] for call in read.call_args_list] == [other]
+
+        def test_does_not_cache_files_over_budget(self, cache, tmp_path):
+            path = tmp_path / "big.txt"
+            path.write_bytes(b"0123456789ab")
+
+            assert cache.get(path) == b"0123456789ab"
+            assert cache.size == 0
+
+        def test_reads_large_files_on_each_call(self, tmp_path, read):
+            cache = FilePayloadCache(max_bytes=1000, max_entry_bytes=10)
+            path = tmp_path / "large.bin"
+            path.write_bytes(os.urandom(64))
+
+            assert cache.get(path) == path.read_bytes()
+            assert cache.get(path) == path.read_bytes()
+            assert read.call_count == 2
+            assert cache.size == 0
+
+        def test_reads_empty_files(self, tmp_path):
+            path = tmp_path / "empty.txt"
+            path.write_bytes(b"")
+
+            assert FilePayloadCache(max_entry_bytes=0).get(path) == b""
+
+        def test_raises_for_missing_file(self, cache, tmp_path):
+            with pytest.raises(FileNotFoundError):
+                cache.get(tmp_path / "missing.txt")
+
+        def test_does_not_count_reads_as_downloads(self, cache, small_file, registry):
+            cache.get(small_file)
+
+            assert "cms_payloads_total" not in registry.to_dict()["counters"]
+
+    class TestPayload:
+        def test_reads_file_only_when_called(self, cache, small_file, read):
+            payload = cache.payload(small_file)
+
+            assert read.call_count == 0
+            assert payload() == b"12345"
+
+        def test_counts_calls_as_downloads(self, cache, small_file, registry):
+            payload = cache.payload(small_file)
+
+            payload()
+
+            assert registry.to_dict()["counters"]["cms_payload_bytes_total"] == [
+                {"labels": {"kind": "download"}, "value": 5}
+            ]
+
+    class TestClear:
+        def test_empties_cache(self, cache, small_file):
+            cache.get(small_file)
+
+            cache.clear()
+
+            assert cache.size == 0
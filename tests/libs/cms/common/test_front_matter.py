@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import pytest
+
+from libs.cms.common import front_matter
+from libs.cms.common.front_matter import ParsedDocumentCache, read_front_matter
+
+
+class TestReadFrontMatter:
+    @pytest.fixture
+    def write(self, tmp_path):
+        def _write(content: str) -> Path:
+            path = tmp_path / "doc.md"
+            path.write_bytes(content.encode("utf-8"))
+            return path
+
+        return _write
+
+    def test_returns_text_as_body_when_no_front_matter(self, write):
+        parsed = read_front_matter(write("Plain content\n"))
+
+        assert parsed.metadata == {}
+        assert not parsed.has_front_matter
+        assert parsed.read_body() == "Plain content\n"
+
+    def test_splits_metadata_and_body(self, write):
+        parsed = read_front_matter(write("---\ntitle: Demo\ntags:\n  - a\n---\n\nBody text\n"))
+
+        assert parsed.metadata == {"title": "Demo", "tags": ["a"]}
+        assert parsed.is_closed
+        assert parsed.read_body() == "Body text"
+
+    def test_keeps_block_scalar_chomping_of_last_header_line(self, write):
+        parsed = read_front_matter(write("---\ndescription: |\n  multi\n  line\n---\nBody"))
+
+        assert parsed.metadata == {"description": "multi\nline"}
+
+    def test_empty_front_matter_gives_empty_metadata(self, write):
+        parsed = read_front_matter(write("---\n---\nBody"))
+
+        assert parsed.metadata == {}
+        assert parsed.read_body() == "Body"
+
+    def test_missing_closing_marker_gives_empty_metadata(self, write):
+        parsed = read_front_matter(write("---\ntitle: Draft\nBody without closing marker"))
+
+        assert parsed.metadata == {}
+        assert not parsed.is_closed
+        assert parsed.read_body() == "title: Draft\nBody without closing marker"
+
+    def test_normalizes_windows_line_endings(self, write):
+        parsed = read_front_matter(write("---\r\ntitle: Demo\r\n---\r\nLine 1\r\nLine 2\r\n"))
+
+        assert parsed.metadata == {"title": "Demo"}
+        assert parsed.read_body() == "Line 1\nLine 2"
+
+    def test_records_body_offset_in_bytes(self, write):
+        path = write("---\ntitle: Démo\n---\nBody")
+
+        parsed = read_front_matter(path)
+
+        assert path.read_bytes()[parsed.body_offset :] == b"Body"
+
+    def test_stops_reading_at_header_size_limit(self, write):
+        path = write("---\ntitle: Demo\n" + "padding: value\n" * 100 + "---\nBody")
+
+        parsed = read_front_matter(path, max_header_bytes=256)
+
+        assert parsed.metadata == {}
+        assert not parsed.is_closed
+
+
+class TestParsedDocumentCache:
+    @pytest.fixture
+    def cache(self) -> ParsedDocumentCache:
+        return ParsedDocumentCache()
+
+    class TestGet:
+        def test_parses_each_file_once(self, cache, tmp_path, mocker):
+            path = tmp_path / "doc.md"
+            path.write_text("---\ntitle: Demo\n---\nBody", encoding="utf-8")
+            open_spy = mocker.patch.object(front_matter, "open", side_effect=open, create=True)
+
+            first = cache.get(path)
+            second = cache.get(path)
+
+            assert first is second
+            assert open_spy.call_count == 1
+
+        def test_reparses_when_file_changes(self, cache, tmp_path):
+            path = tmp_path / "doc.md"
+            path.write_text("---\ntitle: Demo\n---\nBody", encoding="utf-8")
+            cache.get(path)
+
+            path.write_text("---\ntitle: Updated demo\n---\nNew body", encoding="utf-8")
+
+            assert cache.get(path).metadata == {"title": "Updated demo"}
+
+        def test_raises_for_missing_file(self, cache, tmp_path):
+            with pytest.raises(FileNotFoundError):
+                cache.get(tmp_path / "missing.md")
+
+    class TestGetMany:
+        @pytest.fixture
+        def paths(self, tmp_path) -> list[Path]:
+            paths = []
+            for i in range(10):
+                path = tmp_path / f"doc-{i}.md"
+                path.write_text(f"---\ntitle: Doc {i}\n---\nBody {i}", encoding="utf-8")
+                paths.append(path)
+            return paths
+
+        @pytest.mark.parametrize(("workers", "processes"), [(1, False), (4, False), (4, True)])
+        def test_returns_documents_in_given_order(self, cache, paths, workers, processes):
+            parsed = cache.get_many(paths[::-1], workers=workers, processes=processes)
+
+            assert [doc.metadata["title"] for doc in parsed] == [f"Doc {i}" for i in reversed(range(10))]
+            assert [doc.read_body() for doc in parsed] == [f"Body {i}" for i in reversed(range(10))]
+
+        @pytest.mark.parametrize("processes", [False, True])
+        def test_reuses_and_fills_the_cache(self, cache, paths, processes):
+            first = cache.get(paths[0])
+
+            parsed = cache.get_many(paths, workers=4, processes=processes)
+
+            assert parsed[0] is first
+            assert all(cache.get(path) is doc for path, doc in zip(paths, parsed, strict=True))
@@ -0,0 +1,63 @@
+import pytest
+from PIL import Image
+
+from libs.cms.common.images import ImageVariants
+
+
+class TestImageVariants:
+    @pytest.fixture
+    def variants(self, tmp_path) -> ImageVariants:
+        return ImageVariants(cache_dir=tmp_path / "cache", density=2)
+
+    @pytest.fixture
+    def make_image(self, tmp_path):
+        def _make_image(width: int, height: int, name: str = "image.png", mode: str = "RGBA"):
+            path = tmp_path / name
+            Image.effect_noise((width, height), 64).convert(mode).save(path)
+            return path
+
+        return _make_image
+
+    class TestGet:
+        def test_resizes_to_display_width_times_density(self, variants, make_image):
+            path = make_image(800, 400)
+
+            variant = variants.get(path, 100)
+
+            assert variant != path
+            assert variant.suffix == ".webp"
+            with Image.open(variant) as image:
+                assert image.size == (200, 100)
+
+        def test_reuses_cached_variant(self, variants, make_image, mocker):
+            path = make_image(800, 400)
+            first = variants.get(path, 100)
+            open_spy = mocker.spy(Image, "open")
+
+            assert variants.get(path, 100) == first
+            assert open_spy.call_count == 0
+
+        def test_keeps_original_when_already_small_enough(self, variants, make_image):
+            path = make_image(150, 150)
+
+            assert variants.get(path, 100) == path
+
+        def test_keeps_original_for_unsupported_files(self, variants, tmp_path):
+            path = tmp_path / "logo.svg"
+            path.write_text("<svg></svg>")
+
+            assert variants.get(path, 100) == path
+
+        def test_keeps_original_for_unreadable_images(self, variants, tmp_path):
+            path = tmp_path / "broken.png"
+            path.write_bytes(b"not an image")
+
+            assert variants.get(path, 100) == path
+
+        def test_new_content_gives_new_variant(self, variants, make_image):
+            path = make_image(800, 400)
+            first = variants.get(path, 100)
+
+            make_image(600, 600)
+
+            assert variants.get(path, 100) != first
@@ -0,0 +1,31 @@
+import pytest
+
+from libs.cms.common import pagination
+from libs.cms.common.pagination import visible_count
+
+
+class TestVisibleCount:
+    @pytest.fixture(autouse=True)
+    def session_state(self, mocker) -> dict:
+        return mocker.patch.object(pagination.st, "session_state", {})
+
+    def test_shows_everything_without_page_size(self):
+        assert visible_count("list", None, total=42) == 42
+
+    def test_shows_first_page_by_default(self, session_state):
+        assert visible_count("list", 10, total=42) == 10
+        assert session_state["list"] == 10
+
+    def test_shows_pages_revealed_in_session(self, session_state):
+        session_state["list"] = 20
+
+        assert visible_count("list", 10, total=42) == 20
+
+    def test_never_exceeds_total(self, session_state):
+        session_state["list"] = 50
+
+        assert visible_count("list", 10, total=42) == 42
+
+    def test_extends_window_to_minimum_count(self, session_state):
+        assert visible_count("list", 10, total=42, min_count=15) == 15
+        assert session_state["list"] == 15
@@ -0,0 +1,107 @@
+import base64
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from libs.cms.common import static_images
+from libs.cms.common.images import ImageVariants
+from libs.cms.common.static_images import StaticImages
+from libs.cms.metrics import MetricsRegistry
+
+
+class TestStaticImages:
+    @pytest.fixture
+    def images(self, tmp_path) -> StaticImages:
+        return StaticImages(variants=ImageVariants(cache_dir=tmp_path / "cache", density=1), inline_max_bytes=100_000)
+
+    @pytest.fixture
+    def logo(self, tmp_path) -> Path:
+        path = tmp_path / "logo.png"
+        Image.effect_noise((400, 200), 64).convert("RGBA").save(path)
+        return path
+
+    class TestGet:
+        def test_loads_variant_for_display_width(self, images, logo):
+            image = images.get(logo, 100)
+
+            assert image.path.suffix == ".webp"
+            assert image.mime_type == "image/webp"
+            assert image.data == image.path.read_bytes()
+
+        def test_references_small_images_with_data_uri(self, images, logo):
+            image = images.get(logo, 100)
+
+            prefix, encoded = image.source.split(",", 1)
+            assert prefix == "data:image/webp;base64"
+            assert base64.b64decode(encoded) == image.data
+
+        def test_hands_out_big_images_as_bytes(self, tmp_path, logo):
+            images = StaticImages(variants=ImageVariants(cache_dir=tmp_path / "cache"), inline_max_bytes=10)
+
+            image = images.get(logo)
+
+            assert image.path == logo
+            assert image.source == logo.read_bytes()
+
+        def test_hands_out_big_images_at_display_width(self, tmp_path, logo):
+            images = StaticImages(variants=ImageVariants(cache_dir=tmp_path / "cache"), inline_max_bytes=10)
+
+            image = images.get(logo, 100)
+
+            assert image.mime_type == "image/png"
+            with Image.open(io.BytesIO(image.source)) as served:
+                assert (served.format, served.mode, served.size) == ("PNG", "RGBA", (100, 50))
+
+        def test_hands_out_opaque_images_as_jpeg(self, tmp_path):
+            path = tmp_path / "photo.webp"
+            Image.effect_noise((400, 200), 64).convert("RGB").save(path)
+            images = StaticImages(variants=ImageVariants(cache_dir=tmp_path / "cache"), inline_max_bytes=10)
+
+            image = images.get(path, 100)
+
+            assert image.mime_type == "image/jpeg"
+            with Image.open(io.BytesIO(image.source)) as served:
+                assert (served.format, served.size) == ("JPEG", (100, 50))
+
+        def test_does_not_access_files_once_loaded(self, images, logo, mocker):
+            first = images.get(logo, 100)
+            stat = mocker.spy(Path, "stat")
+            read = mocker.spy(Path, "read_bytes")
+
+            assert images.get(str(logo), 100) is first
+            assert stat.call_count == 0
+            assert read.call_count == 0
+
+        def test_loads_each_display_width(self, images, logo):
+            assert images.get(logo, 100).digest != images.get(logo, 50).digest
+            assert len(images) == 2
+
+        def test_raises_for_missing_image(self, images, tmp_path):
+            with pytest.raises(FileNotFoundError):
+                images.get(tmp_path / "missing.png")
+
+    class TestPreload:
+        def test_loads_images_ahead(self, images, logo):
+            images.preload([(logo, 100), (logo, None)])
+
+            assert len(images) == 2
+
+        def test_does_not_count_images_as_payloads(self, images, logo, mocker):
+            registry = mocker.patch.object(static_images, "metrics", MetricsRegistry(enabled=True))
+
+            images.preload([(logo, 100)])
+            images.get(logo, 100)
+
+            assert registry.to_dict()["counters"]["cms_payloads_total"] == [{"labels": {"kind": "image"}, "value": 1}]
+
+    class TestClear:
+        def test_reloads_images_after_clear(self, images, logo):
+            first = images.get(logo)
+            logo.write_bytes(b"new")
+
+            images.clear()
+
+            assert images.get(logo) is not first
+            assert images.get(logo).data == b"new"
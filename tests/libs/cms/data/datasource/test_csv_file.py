@@ -0,0 +1,105 @@
+import os
+
+import polars as pl
+import pytest
+
+from libs.cms.data.datasource import csv_file
+from libs.cms.data.datasource.csv_file import CsvTableLoader
+
+CSV = "name,level,used\nPython,3,true\nRust,5,false\nGo,4,true\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "skills.csv"
+    path.write_text(CSV, encoding="utf-8")
+    return path
+
+
+def _loader(path) -> CsvTableLoader:
+    return CsvTableLoader(path, dtypes={"level": pl.Int64, "used": pl.Boolean}, sort_by="level", descending=True)
+
+
+def _sidecars(path) -> list:
+    return sorted(path.parent.glob(f".{path.name}.*.arrow"))
+
+
+class TestCsvTableLoader:
+    class TestInit:
+        def test_raises_error_if_file_not_found(self, tmp_path):
+            with pytest.raises(ValueError, match="File not found"):
+                CsvTableLoader(tmp_path / "missing.csv")
+
+    class TestLoad:
+        def test_returns_typed_and_sorted_table(self, csv_path):
+            table = _loader(csv_path).load()
+
+            assert table.schema == pl.Schema({"name": pl.String, "level": pl.Int64, "used": pl.Boolean})
+            assert table["name"].to_list() == ["Rust", "Go", "Python"]
+
+        def test_writes_sidecar_next_to_file(self, csv_path):
+            table = _loader(csv_path).load()
+
+            [sidecar] = _sidecars(csv_path)
+            assert pl.read_ipc(sidecar).equals(table)
+
+        def test_reuses_sidecar_without_parsing_file(self, csv_path, mocker):
+            expected = _loader(csv_path).load()
+            read_csv = mocker.spy(csv_file, "read_csv")
+
+            table = _loader(csv_path).load()
+
+            read_csv.assert_not_called()
+            assert table.equals(expected)
+            assert table.schema == expected.schema
+
+        def test_regenerates_sidecar_when_file_changes(self, csv_path):
+            _loader(csv_path).load()
+            [stale] = _sidecars(csv_path)
+
+            csv_path.write_text(CSV + "C,1,false\n", encoding="utf-8")
+            table = _loader(csv_path).load()
+
+            assert table["name"].to_list() == ["Rust", "Go", "Python", "C"]
+            [sidecar] = _sidecars(csv_path)
+            assert sidecar != stale
+
+        def test_names_sidecar_after_file_stamp(self, csv_path):
+            _loader(csv_path).load()
+
+            [sidecar] = _sidecars(csv_path)
+            stat = csv_path.stat()
+            assert sidecar.name.endswith(f".{stat.st_mtime_ns}-{stat.st_size}.arrow")
+
+        def test_regenerates_sidecar_when_file_is_touched(self, csv_path):
+            _loader(csv_path).load()
+            [stale] = _sidecars(csv_path)
+
+            stat = csv_path.stat()
+            os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            _loader(csv_path).load()
+
+            [sidecar] = _sidecars(csv_path)
+            assert sidecar != stale
+
+        def test_uses_distinct_sidecar_for_other_options(self, csv_path):
+            _loader(csv_path).load()
+
+            table = CsvTableLoader(csv_path).load()
+
+            assert table["name"].to_list() == ["Python", "Rust", "Go"]
+            assert len(_sidecars(csv_path)) == 2
+
+        def test_falls_back_to_file_when_sidecar_cannot_be_written(self, csv_path, mocker):
+            mocker.patch.object(csv_file.os, "replace", side_effect=PermissionError)
+
+            table = _loader(csv_path).load()
+
+            assert table["name"].to_list() == ["Rust", "Go", "Python"]
+            assert not list(csv_path.parent.glob(".*"))
+
+        def test_sidecar_is_readable_by_everyone(self, csv_path):
+            _loader(csv_path).load()
+
+            [sidecar] = _sidecars(csv_path)
+            assert os.stat(sidecar).st_mode & 0o777 == 0o644
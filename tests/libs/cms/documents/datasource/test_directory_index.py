@@ -0,0 +1,151 @@
+import pytest
+
+from libs.cms.common.front_matter import ParsedDocumentCache
+from libs.cms.documents.datasource import DirectoryIndex
+
+
+class TestDirectoryIndex:
+    @pytest.fixture
+    def markdown_dir(self, tmp_path):
+        dir_path = tmp_path / "markdown"
+        dir_path.mkdir()
+        (dir_path / "b-work.md").write_text("---\ntitle: Work\n---\nWork body", encoding="utf-8")
+        (dir_path / "a-about.md").write_text("---\ntitle: About\n---\nAbout body", encoding="utf-8")
+        (dir_path / "notes.txt").write_text("Not a document", encoding="utf-8")
+        return dir_path
+
+    @pytest.fixture
+    def cache(self) -> ParsedDocumentCache:
+        return ParsedDocumentCache()
+
+    @pytest.fixture
+    def index(self, markdown_dir, cache) -> DirectoryIndex:
+        return DirectoryIndex(markdown_dir, cache=cache, refresh_interval=0)
+
+    class TestInit:
+        def test_raises_for_missing_directory(self, tmp_path):
+            with pytest.raises(ValueError, match="Directory not found"):
+                DirectoryIndex(tmp_path / "missing")
+
+    class TestDocuments:
+        def test_lists_markdown_documents_sorted_by_path(self, index):
+            assert [doc.title for doc in index.documents()] == ["About", "Work"]
+
+        def test_skips_hidden_files_and_folders(self, index, markdown_dir):
+            (markdown_dir / "._a-about.md").write_bytes(b"\x00\x05\x16\x07")
+            (markdown_dir / ".draft.md").write_text("---\ntitle: Draft\n---\n", encoding="utf-8")
+            (markdown_dir / "folder.md").mkdir()
+
+            assert [doc.title for doc in index.documents()] == ["About", "Work"]
+
+        def test_picks_up_new_documents(self, index, markdown_dir):
+            index.documents()
+
+            (markdown_dir / "c-new.md").write_text("---\ntitle: New\n---\n", encoding="utf-8")
+
+            assert [doc.title for doc in index.documents()] == ["About", "Work", "New"]
+
+        def test_drops_deleted_documents(self, index, markdown_dir):
+            index.documents()
+
+            (markdown_dir / "b-work.md").unlink()
+
+            assert [doc.title for doc in index.documents()] == ["About"]
+
+        def test_only_reparses_modified_documents(self, index, markdown_dir, cache, mocker):
+            about, work = index.documents()
+            get_spy = mocker.spy(cache, "get")
+
+            (markdown_dir / "b-work.md").write_text("---\ntitle: Updated work\n---\n", encoding="utf-8")
+            docs = index.documents()
+
+            assert docs[0] is about
+            assert docs[1] is not work
+            assert docs[1].title == "Updated work"
+            get_spy.assert_called_once_with(markdown_dir / "b-work.md")
+
+        def test_does_not_rescan_before_refresh_interval(self, markdown_dir, cache):
+            index = DirectoryIndex(markdown_dir, cache=cache, refresh_interval=3600)
+            index.documents()
+
+            (markdown_dir / "c-new.md").write_text("---\ntitle: New\n---\n", encoding="utf-8")
+
+            assert len(index.documents()) == 2
+
+        def test_parses_documents_with_workers(self, markdown_dir, cache):
+            index = DirectoryIndex(markdown_dir, cache=cache, refresh_interval=0, workers=4)
+
+            assert [doc.title for doc in index.documents()] == ["About", "Work"]
+
+        def test_returns_the_same_documents_until_the_folder_changes(self, index, markdown_dir):
+            first = index.documents()
+
+            assert index.documents() is first
+
+            (markdown_dir / "c-new.md").write_text("---\ntitle: New\n---\n", encoding="utf-8")
+
+            assert index.documents() is not first
+
+    class TestRefresh:
+        def test_bumps_version_only_on_changes(self, index, markdown_dir):
+            index.refresh()
+            version = index.version
+
+            assert not index.refresh()
+            assert index.version == version
+
+            (markdown_dir / "a-about.md").unlink()
+
+            assert index.refresh()
+            assert index.version == version + 1
+
+    class TestHighlightedDocuments:
+        def test_lists_highlighted_documents_only(self, index, markdown_dir):
+            (markdown_dir / "c-new.md").write_text("---\ntitle: New\nhighlighted: true\n---\n", encoding="utf-8")
+
+            assert [doc.title for doc in index.highlighted_documents()] == ["New"]
+
+    class TestDocumentsBy:
+        def test_sorts_documents_by_attribute_then_by_path(self, index, markdown_dir):
+            (markdown_dir / "c-new.md").write_text("---\ntitle: New\nweight: 10\n---\n", encoding="utf-8")
+
+            assert [doc.title for doc in index.documents_by("weight", reverse=True)] == ["New", "About", "Work"]
+
+        def test_reuses_ordering_until_the_folder_changes(self, index, markdown_dir):
+            first = index.documents_by("weight")
+
+            assert index.documents_by("weight") is first
+
+            (markdown_dir / "a-about.md").unlink()
+
+            assert [doc.title for doc in index.documents_by("weight")] == ["Work"]
+
+    class TestDocumentsWithSkill:
+        @pytest.fixture(autouse=True)
+        def skilled_documents(self, markdown_dir):
+            (markdown_dir / "c-go.md").write_text(
+                "---\ntitle: Go\nskills:\n  - name: Go\n  - name: Docker\n---\n", encoding="utf-8"
+            )
+            (markdown_dir / "d-py.md").write_text("---\ntitle: Py\nskills:\n  - name: docker\n---\n", encoding="utf-8")
+
+        def test_lists_documents_using_skill_case_insensitively(self, index):
+            assert [doc.title for doc in index.documents_with_skill("DOCKER")] == ["Go", "Py"]
+
+        def test_returns_nothing_for_unused_skill(self, index):
+            assert index.documents_with_skill("Cobol") == ()
+
+        def test_follows_modified_documents(self, index, markdown_dir):
+            index.documents_with_skill("Go")
+
+            (markdown_dir / "c-go.md").write_text("---\ntitle: Go 2\nskills:\n  - name: Rust\n---\n", encoding="utf-8")
+
+            assert index.documents_with_skill("Go") == ()
+            assert [doc.title for doc in index.documents_with_skill("docker")] == ["Py"]
+            assert [doc.title for doc in index.documents_with_skill("rust")] == ["Go 2"]
+
+        def test_drops_deleted_documents(self, index, markdown_dir):
+            index.documents_with_skill("docker")
+
+            (markdown_dir / "d-py.md").unlink()
+
+            assert [doc.title for doc in index.documents_with_skill("docker")] == ["Go"]
@@ -1,3 +1,4 @@
+import dataclasses
 import sys
 from pathlib import Path
 
@@ -6,7 +7,10 @@ import pytest
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from libs.cms.documents.datasource import MarkdownDocument, MarkdownLoader
+from libs.cms.common.assets import AssetStore
+from libs.cms.common.front_matter import ParsedDocumentCache
+from libs.cms.documents.datasource import MarkdownDocument, MarkdownLoader, markdown_file
+from libs.cms.documents.datasource.markdown_file import BodyCache
 
 
 class TestMarkdownDocument:
@@ -50,6 +54,14 @@ class TestMarkdownDocument:
             assert doc.icon == "star"
             assert doc.path == path
 
+    class TestInit:
+        def test_creates_immutable_documents_without_instance_dict(self, make_doc):
+            doc = make_doc("Body")
+
+            with pytest.raises(dataclasses.FrozenInstanceError):
+                doc.title = "Changed"
+            assert not hasattr(doc, "__dict__")
+
     class TestContent:
         def test_returns_plain_text_when_no_front_matter(self, make_doc):
             doc = make_doc("Plain content")
@@ -63,6 +75,18 @@ class TestMarkdownDocument:
 
             assert doc.content == first_read
 
+        def test_keeps_only_the_most_recently_used_bodies(self, make_doc, mocker):
+            mocker.patch.object(markdown_file, "body_cache", BodyCache(maxsize=1))
+            first = make_doc("First content", filename="first.md")
+            second = make_doc("Second content", filename="second.md")
+            assert first.content == "First content"
+            assert second.content == "Second content"
+
+            first.path.write_text("Updated first content", encoding="utf-8")
+
+            assert second.content == "Second content"
+            assert first.content == "Updated first content"
+
         def test_strips_front_matter_and_trims_body(self, make_doc):
             doc = make_doc("---\ntitle: Demo\n---\n\nBody text")
 
@@ -86,7 +110,27 @@ class TestMarkdownDocument:
 
             assert doc.content == ""
 
-        def test_embeds_local_images_with_data_uri(self, make_doc, tmp_path):
+        @pytest.fixture
+        def store(self, tmp_path, mocker) -> AssetStore:
+            store = AssetStore(tmp_path / "static" / "assets", url_prefix="app/static/assets", inline=False)
+            mocker.patch("libs.cms.documents.datasource.markdown_file.asset_store", store)
+            mocker.patch("streamlit.get_option", return_value=True)
+            return store
+
+        def test_rewrites_local_images_with_asset_url(self, make_doc, tmp_path, store):
+            image_path = tmp_path / "image.png"
+            image_path.write_bytes(b"\x89PNG\r\n\x1a\ncontent")
+            doc = make_doc(f'---\ntitle: Demo\n---\n![Alt]({image_path.name})\n<img src="{image_path.name}">')
+
+            content = doc.content
+
+            digest = store.digest(image_path)
+            assert f"![Alt](app/static/assets/{digest}.png?v={digest})" in content
+            assert f'src="app/static/assets/{digest}.png?v={digest}"' in content
+            assert (tmp_path / "static" / "assets" / f"{digest}.png").read_bytes() == image_path.read_bytes()
+
+        def test_embeds_local_images_with_data_uri(self, make_doc, tmp_path, store):
+            store.inline = True
             image_path = tmp_path / "image.png"
             image_path.write_bytes(b"\x89PNG\r\n\x1a\ncontent")
             doc = make_doc(f"---\ntitle: Demo\n---\n![Alt]({image_path.name})")
@@ -144,6 +188,16 @@ class TestMarkdownLoader:
 
             assert loaded_paths == expected_paths
 
+        def test_reads_bodies_through_injected_cache(self, markdown_dir, mocker):
+            cache = ParsedDocumentCache()
+            get = mocker.spy(cache, "get")
+            [about] = MarkdownLoader(markdown_dir, cache=cache).load_by_section("about")
+
+            body = about.read_body()
+
+            get.assert_called_with(about.path)
+            assert about.content == body
+
     class TestLoadBySection:
         def test_filters_docs_by_section(self, loader):
             docs = loader.load_by_section("about")
@@ -152,3 +206,14 @@ class TestMarkdownLoader:
 
         def test_returns_empty_list_for_unknown_section(self, loader):
             assert loader.load_by_section("unknown") == []
+
+    class TestParallelLoading:
+        @pytest.mark.parametrize("processes", [False, True])
+        def test_loads_same_documents_as_sequential_loading(self, markdown_dir, processes):
+            sequential = MarkdownLoader(markdown_dir, cache=ParsedDocumentCache()).load_all()
+
+            parallel = MarkdownLoader(
+                markdown_dir, cache=ParsedDocumentCache(), workers=4, processes=processes
+            ).load_all()
+
+            assert parallel == sequential
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import pytest
+
+from libs.cms.common import Skill
+from libs.cms.documents.datasource import MarkdownDocument, SkillReferences
+
+
+def _doc(path: str, *skills: str) -> MarkdownDocument:
+    return MarkdownDocument(path=Path(path), title=path, skills=tuple(Skill(name=name) for name in skills))
+
+
+class TestSkillReferences:
+    @pytest.fixture
+    def references(self) -> SkillReferences:
+        references = SkillReferences()
+        references.add(_doc("b.md", "Python", "Docker"))
+        references.add(_doc("a.md", "python"))
+        return references
+
+    class TestDocuments:
+        def test_lists_documents_by_path_ignoring_case(self, references):
+            assert [doc.title for doc in references.documents("PYTHON")] == ["a.md", "b.md"]
+
+        def test_returns_nothing_for_unknown_skill(self, references):
+            assert references.documents("Cobol") == ()
+            assert "cobol" not in references.skill_names()
+
+        def test_returns_same_tuple_until_skill_changes(self, references):
+            docker = references.documents("docker")
+            python = references.documents("python")
+
+            references.add(_doc("c.md", "Docker"))
+
+            assert references.documents("python") is python
+            assert [doc.title for doc in references.documents("docker")] == ["b.md", "c.md"]
+            assert docker != references.documents("docker")
+
+    class TestAdd:
+        def test_indexes_each_skill_once_per_document(self, references):
+            references.add(_doc("c.md", "Go", "go"))
+
+            assert [doc.title for doc in references.documents("go")] == ["c.md"]
+
+    class TestRemove:
+        def test_removes_document_from_its_skills(self, references):
+            doc = _doc("c.md", "Python", "Go")
+            references.add(doc)
+
+            references.remove(doc)
+
+            assert [doc.title for doc in references.documents("python")] == ["a.md", "b.md"]
+            assert references.skill_names() == {"python", "docker"}
+
+        def test_keeps_newer_document_at_same_path(self, references):
+            old = _doc("c.md", "Go")
+            new = _doc("c.md", "Go")
+            references.add(old)
+            references.add(new)
+
+            references.remove(old)
+
+            assert references.documents("go") == (new,)
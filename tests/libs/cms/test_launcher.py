@@ -0,0 +1,19 @@
+import pytest
+
+from libs.cms import navigation
+from libs.cms.launcher import load_router
+
+
+class TestLoadRouter:
+    def test_loads_router_attribute_by_default(self, mocker):
+        import_module = mocker.patch("libs.cms.launcher.importlib.import_module")
+        import_module.return_value.router = router = navigation.Router()
+
+        assert load_router("main") is router
+        import_module.assert_called_once_with("main")
+
+    def test_raises_without_router(self, mocker):
+        mocker.patch("libs.cms.launcher.importlib.import_module").return_value.app = object()
+
+        with pytest.raises(TypeError, match="No router found at 'main:app'"):
+            load_router("main:app")
@@ -0,0 +1,122 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from libs.cms.metrics import MetricsRegistry, start_metrics_server
+
+
+class TestMetricsRegistry:
+    @pytest.fixture
+    def registry(self) -> MetricsRegistry:
+        return MetricsRegistry(enabled=True, buckets=(0.1, 1.0))
+
+    class TestIncrement:
+        def test_sums_by_labels(self, registry):
+            registry.increment("requests_total", page="a")
+            registry.increment("requests_total", 2, page="a")
+            registry.increment("requests_total", page="b")
+
+            assert registry.to_dict()["counters"]["requests_total"] == [
+                {"labels": {"page": "a"}, "value": 3},
+                {"labels": {"page": "b"}, "value": 1},
+            ]
+
+        def test_records_nothing_when_disabled(self):
+            registry = MetricsRegistry(enabled=False)
+
+            registry.increment("requests_total")
+            registry.record_payload("markdown", "text")
+
+            assert registry.to_dict() == {"counters": {}, "histograms": {}}
+
+    class TestObserve:
+        def test_counts_durations_in_cumulative_buckets(self, registry):
+            for seconds in (0.05, 0.5, 5.0):
+                registry.observe("render_seconds", seconds, name="page")
+
+            (series,) = registry.to_dict()["histograms"]["render_seconds"]
+            assert series["buckets"] == {"0.1": 1, "1.0": 2}
+            assert series["count"] == 3
+            assert series["sum"] == pytest.approx(5.55)
+
+    class TestTimed:
+        def test_records_each_call(self, registry):
+            @registry.timed("render_seconds", kind="layout", name="tabs")
+            def render(value):
+                return value * 2
+
+            assert render(2) == 4
+            assert render.__name__ == "render"
+            (series,) = registry.to_dict()["histograms"]["render_seconds"]
+            assert series["labels"] == {"kind": "layout", "name": "tabs"}
+            assert series["count"] == 1
+
+        def test_records_failing_calls(self, registry):
+            with pytest.raises(ValueError), registry.timer("render_seconds"):
+                raise ValueError()
+
+            assert registry.to_dict()["histograms"]["render_seconds"][0]["count"] == 1
+
+    class TestRecordPayload:
+        def test_counts_text_in_utf8_bytes(self, registry):
+            registry.record_payload("markdown", "é")
+            registry.record_payload("markdown", b"abc")
+
+            counters = registry.to_dict()["counters"]
+            assert counters["cms_payload_bytes_total"] == [{"labels": {"kind": "markdown"}, "value": 5}]
+            assert counters["cms_payloads_total"] == [{"labels": {"kind": "markdown"}, "value": 2}]
+
+    class TestToPrometheus:
+        def test_formats_counters_and_histograms(self, registry):
+            registry.record_cache("bodies", "hit")
+            registry.observe("render_seconds", 0.5, name='say "hi"')
+
+            assert registry.to_prometheus().splitlines() == [
+                "# TYPE cms_cache_events_total counter",
+                'cms_cache_events_total{cache="bodies",event="hit"} 1',
+                "# TYPE render_seconds histogram",
+                'render_seconds_bucket{name="say \\"hi\\"",le="0.1"} 0',
+                'render_seconds_bucket{name="say \\"hi\\"",le="1"} 1',
+                'render_seconds_bucket{name="say \\"hi\\"",le="+Inf"} 1',
+                'render_seconds_sum{name="say \\"hi\\""} 0.5',
+                'render_seconds_count{name="say \\"hi\\""} 1',
+            ]
+
+        def test_is_empty_without_metrics(self, registry):
+            assert registry.to_prometheus() == ""
+
+
+class TestStartMetricsServer:
+    def test_does_nothing_without_port(self, monkeypatch):
+        monkeypatch.delenv("CMS_METRICS_PORT", raising=False)
+
+        assert start_metrics_server() is None
+
+    def test_serves_metrics(self):
+        registry = MetricsRegistry(enabled=True)
+        registry.increment("requests_total")
+
+        server = start_metrics_server(port=0, registry=registry, host="127.0.0.1")
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            assert "requests_total 1" in response.read().decode()
+        with urllib.request.urlopen(f"{url}/metrics.json") as response:
+            assert json.load(response)["counters"]["requests_total"][0]["value"] == 1
+        assert start_metrics_server(port=0, registry=registry) is server
+
+    def test_serves_readiness(self, mocker):
+        readiness = mocker.patch("libs.cms.metrics.readiness")
+        readiness.is_ready = False
+        server = start_metrics_server(port=0, registry=MetricsRegistry(enabled=True), host="127.0.0.1")
+        url = f"http://127.0.0.1:{server.server_address[1]}/ready"
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(url)
+        assert error.value.code == 503
+
+        readiness.is_ready = True
+        with urllib.request.urlopen(url) as response:
+            assert response.status == 200
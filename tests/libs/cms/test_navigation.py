@@ -0,0 +1,143 @@
+from types import SimpleNamespace
+
+import pytest
+
+from libs.cms import navigation
+from libs.cms.navigation import DEFAULT_SECTION, Router
+
+
+def home() -> None: ...
+
+
+def skills() -> None: ...
+
+
+def legal() -> None: ...
+
+
+def _links(st) -> list[str]:
+    return [call.args[0].title for call in st.page_link.call_args_list]
+
+
+def _page(func, title=None, **kwargs) -> SimpleNamespace:
+    return SimpleNamespace(func=func, title=title)
+
+
+class TestRouter:
+    @pytest.fixture
+    def st(self, mocker):
+        st = mocker.patch.object(navigation, "st")
+        st.Page.side_effect = _page
+        return st
+
+    @pytest.fixture
+    def router(self, st) -> Router:
+        router = Router()
+        router.page(DEFAULT_SECTION, title="Home")(home)
+        router.page("CV", title="Skills")(skills)
+        router.page("Info", show_in_nav=False)(legal)
+        return router
+
+    class TestGetPage:
+        def test_finds_page_by_key(self, router):
+            assert router.get_page("skills").title == "Skills"
+
+        def test_raises_for_unknown_page(self, router):
+            with pytest.raises(RuntimeError, match="Page not found: unknown"):
+                router.get_page("unknown")
+
+        def test_creates_labelled_page_once(self, router, st):
+            st.Page.reset_mock()
+
+            first = router.get_page("skills", "View skills")
+            second = router.get_page("skills", "View skills")
+
+            assert first is second
+            assert first.title == "View skills"
+            assert first.func is skills
+            st.Page.assert_called_once()
+
+        def test_keeps_labels_apart(self, router):
+            assert router.get_page("skills", "A").title == "A"
+            assert router.get_page("skills", "B").title == "B"
+
+    class TestRender:
+        def test_registers_every_page_in_navigation(self, router, st):
+            router.render()
+
+            sections = st.navigation.call_args.args[0]
+            assert {section: [page.title for page in pages] for section, pages in sections.items()} == {
+                DEFAULT_SECTION: ["Home"],
+                "CV": ["Skills"],
+                "Info": ["Legal"],
+            }
+
+        def test_links_pages_shown_in_nav_by_section_order(self, router, st):
+            router.render(sections_order=["Info", "CV"])
+
+            assert [call.args[0] for call in st.subheader.call_args_list] == [DEFAULT_SECTION, "Info", "CV"]
+            assert _links(st) == ["Home", "Skills"]
+
+        def test_includes_pages_registered_after_first_render(self, router, st):
+            router.render()
+
+            router.page("CV", title="Education")(home)
+            st.reset_mock()
+            router.render()
+
+            assert _links(st) == ["Home", "Skills", "Education"]
+
+    class TestLazyPage:
+        @pytest.fixture
+        def import_module(self, mocker):
+            return mocker.patch.object(navigation.importlib, "import_module")
+
+        def test_imports_module_on_first_render_only(self, router, import_module):
+            router.lazy_page("CV", "site.pages.contact:contact", title="Contact")
+            page = router.get_page("contact")
+
+            import_module.assert_not_called()
+
+            page.func()
+
+            import_module.assert_called_once_with("site.pages.contact")
+            import_module.return_value.contact.assert_called_once_with()
+
+        def test_names_page_after_key(self, router, import_module):
+            router.lazy_page("CV", "site.pages.contact:render", key="contact")
+
+            assert router.get_page("contact").func.__name__ == "contact"
+
+        @pytest.mark.parametrize("target", ["site.pages.contact", ":contact", "site.pages.contact:"])
+        def test_raises_for_invalid_target(self, router, target):
+            with pytest.raises(ValueError, match="Invalid page target"):
+                router.lazy_page("CV", target)
+
+    class TestRequirements:
+        def test_collects_app_and_page_requirements_once(self, router, mocker):
+            load_logo, load_page = mocker.Mock(), mocker.Mock()
+            router.require(load_logo)
+            router.require(load_logo)
+            router.page("CV", key="contact", requires=lambda: [load_page, load_logo])(home)
+
+            assert router.requirements() == [load_logo, load_page]
+
+        def test_imports_lazy_pages_for_their_requirements(self, router, mocker):
+            load_page = mocker.Mock()
+            import_module = mocker.patch.object(navigation.importlib, "import_module")
+            import_module.return_value.requirements.return_value = [load_page]
+            router.lazy_page("CV", "site.pages.contact:contact")
+
+            assert router.requirements() == [load_page]
+            import_module.assert_called_once_with("site.pages.contact")
+
+    class TestWarmUp:
+        def test_loads_every_requirement(self, router, mocker):
+            load_logo = mocker.Mock()
+            router.require(load_logo)
+
+            report = router.warm_up()
+
+            load_logo.assert_called_once_with()
+            assert report.loaded == 1
+            assert report.failed == ()
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+
+from libs.cms.common import front_matter
+from libs.cms.common.front_matter import document_cache
+from libs.cms.snapshot import Snapshot, SnapshotWriter
+
+
+class TestSnapshot:
+    @pytest.fixture
+    def content_dir(self, tmp_path):
+        root = tmp_path / "content"
+        (root / "docs").mkdir(parents=True)
+        (root / "docs" / "about.md").write_text("---\ntitle: About\n---\nAbout body", encoding="utf-8")
+        (root / "data.yaml").write_text("items:\n  - title: First\n    link: https://example.com\n", encoding="utf-8")
+        (root / "table.csv").write_text("name,level\nPython,5\nGo,4\n", encoding="utf-8")
+        return root
+
+    @pytest.fixture
+    def snapshot(self, content_dir, tmp_path) -> Snapshot:
+        writer = SnapshotWriter()
+        writer.add_tree(content_dir)
+        writer.write(tmp_path / "content.snapshot")
+        return Snapshot(tmp_path / "content.snapshot")
+
+    class TestInit:
+        def test_rejects_unknown_format(self, tmp_path):
+            path = tmp_path / "content.snapshot"
+            path.write_bytes(b"not a snapshot" * 4)
+
+            with pytest.raises(ValueError, match="Unsupported snapshot format"):
+                Snapshot(path)
+
+    class TestData:
+        def test_returns_parsed_yaml(self, snapshot, content_dir):
+            assert snapshot.data(content_dir / "data.yaml") == {
+                "items": [{"title": "First", "link": "https://example.com"}]
+            }
+
+        def test_returns_none_when_source_changed(self, snapshot, content_dir):
+            (content_dir / "data.yaml").write_text("items: []\n", encoding="utf-8")
+
+            assert snapshot.data(content_dir / "data.yaml") is None
+
+        def test_returns_none_for_unknown_file(self, snapshot, content_dir):
+            assert snapshot.data(content_dir / "missing.yaml") is None
+
+    class TestTable:
+        def test_returns_csv_content(self, snapshot, content_dir):
+            table = snapshot.table(content_dir / "table.csv")
+
+            assert table.to_dicts() == [{"name": "Python", "level": 5}, {"name": "Go", "level": 4}]
+
+        def test_returns_none_when_source_changed(self, snapshot, content_dir):
+            path = content_dir / "table.csv"
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            assert snapshot.table(path) is None
+
+    class TestSeedCaches:
+        def test_serves_documents_without_reading_sources(self, snapshot, content_dir, mocker):
+            snapshot.seed_caches()
+            path = content_dir / "docs" / "about.md"
+            open_spy = mocker.patch.object(front_matter, "open", side_effect=open, create=True)
+
+            parsed = document_cache.get(path)
+
+            assert parsed.metadata == {"title": "About"}
+            assert parsed.read_body() == "About body"
+            open_spy.assert_not_called()
@@ -0,0 +1,69 @@
+from functools import partial
+
+import pytest
+
+from libs.cms.warmup import Readiness, unique_requirements, warm_up
+
+
+def load(path: str, width: int | None = None) -> str:
+    return path
+
+
+class TestUniqueRequirements:
+    def test_drops_partials_of_same_call(self):
+        first, second = partial(load, "a", width=48), partial(load, "b")
+
+        assert unique_requirements([first, partial(load, "a", width=48), second, first]) == [first, second]
+
+    def test_keeps_partials_with_unhashable_arguments(self):
+        first, second = partial(load, ["a"]), partial(load, ["a"])
+
+        assert unique_requirements([first, second]) == [first, second]
+
+
+class TestWarmUp:
+    def test_reports_failures_and_goes_on(self, mocker):
+        failing = partial(mocker.Mock(side_effect=OSError("missing")), "content/experiences")
+        loading = mocker.Mock()
+
+        report = warm_up([failing, loading])
+
+        loading.assert_called_once_with()
+        assert report.loaded == 1
+        assert report.failed == ((f"{failing.func!r}('content/experiences')", "OSError('missing')"),)
+
+
+class TestReadiness:
+    @pytest.fixture
+    def ready_file(self, tmp_path):
+        return tmp_path / "run" / "ready"
+
+    def test_is_not_ready_at_first(self, ready_file):
+        readiness = Readiness(ready_file)
+
+        assert not readiness.is_ready
+        assert not ready_file.exists()
+
+    def test_writes_ready_file(self, ready_file):
+        readiness = Readiness(ready_file)
+
+        readiness.mark_ready()
+
+        assert readiness.is_ready
+        assert ready_file.read_text().strip().isdigit()
+
+    def test_reset_removes_ready_file(self, ready_file):
+        readiness = Readiness(ready_file)
+        readiness.mark_ready()
+
+        readiness.reset()
+
+        assert not readiness.is_ready
+        assert not ready_file.exists()
+
+    def test_reads_ready_file_from_env(self, monkeypatch, ready_file):
+        monkeypatch.setenv("CMS_READY_FILE", str(ready_file))
+
+        Readiness().mark_ready()
+
+        assert ready_file.exists()
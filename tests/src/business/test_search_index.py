@@ -0,0 +1,114 @@
+import pytest
+
+from src.business.search_index import SearchIndex, tokenize
+
+
+def _ids(index: SearchIndex, query: str) -> list[str]:
+    return [hit.doc_id for hit in index.search(query)]
+
+
+class TestTokenize:
+    def test_splits_words_case_folded_without_accents(self):
+        assert tokenize("Déployé des LLMs, en Python!") == ["deploye", "des", "llms", "en", "python"]
+
+    def test_returns_no_words_for_punctuation(self):
+        assert tokenize(" -- ! ") == []
+
+
+class TestSearchIndex:
+    @pytest.fixture
+    def index(self) -> SearchIndex:
+        index = SearchIndex(field_weights={"title": 3.0})
+        index.add("python", {"title": "Python developer", "body": "Built libraries for data scientists"})
+        index.add("golang", {"title": "Go developer", "body": "Built a RAG application with Python bindings"})
+        index.add("kube", {"title": "Kubernetes", "body": "Deployed applications on clusters"})
+        return index
+
+    class TestSearch:
+        def test_ranks_title_matches_first(self, index):
+            assert _ids(index, "python") == ["python", "golang"]
+
+        def test_requires_every_word(self, index):
+            assert _ids(index, "built rag") == ["golang"]
+
+        def test_ignores_case_and_accents(self, index):
+            assert _ids(index, "KÜBERNETES") == ["kube"]
+
+        def test_matches_prefixes(self, index):
+            assert sorted(_ids(index, "appli")) == ["golang", "kube"]
+
+        def test_ranks_exact_matches_before_prefix_matches(self):
+            index = SearchIndex()
+            index.add("prefix", {"body": "golang"})
+            index.add("exact", {"body": "go"})
+
+            assert _ids(index, "go") == ["exact", "prefix"]
+
+        def test_matches_only_exact_terms_for_short_words(self):
+            index = SearchIndex(min_prefix_length=2)
+            index.add("c", {"title": "C"})
+            index.add("cpp", {"title": "Cpp"})
+
+            assert _ids(index, "c") == ["c"]
+
+        def test_limits_number_of_hits(self, index):
+            assert len(index.search("developer", limit=1)) == 1
+
+        def test_returns_every_hit_without_limit(self, index):
+            assert len(index.search("developer", limit=None)) == 2
+
+        @pytest.mark.parametrize("query", ["", "  ", "cobol", "python cobol"])
+        def test_returns_no_hits_without_match(self, index, query):
+            assert index.search(query) == []
+
+        def test_orders_ties_by_id(self):
+            index = SearchIndex()
+            for doc_id in ("b", "c", "a"):
+                index.add(doc_id, {"body": "same"})
+
+            assert _ids(index, "same") == ["a", "b", "c"]
+
+    class TestAdd:
+        def test_replaces_previous_version(self, index):
+            index.add("kube", {"title": "Helm charts"})
+
+            assert index.search("kubernetes") == []
+            assert _ids(index, "helm") == ["kube"]
+            assert len(index) == 3
+
+        def test_indexes_new_terms_for_prefix_search_after_query(self, index):
+            index.search("pyth")
+
+            index.add("pytorch", {"title": "PyTorch"})
+
+            assert _ids(index, "pyt")[0] == "pytorch"
+
+        def test_ignores_empty_fields(self):
+            index = SearchIndex()
+            index.add("empty", {"title": "", "body": "text"})
+
+            assert "empty" in index
+
+    class TestRemove:
+        def test_removes_document(self, index):
+            index.remove("python")
+
+            assert _ids(index, "python") == ["golang"]
+            assert "python" not in index
+
+        def test_forgets_terms_of_removed_documents(self, index):
+            index.remove("kube")
+
+            assert index.search("kub") == []
+
+        def test_ignores_unknown_document(self, index):
+            index.remove("unknown")
+
+            assert len(index) == 3
+
+    class TestClear:
+        def test_removes_every_document(self, index):
+            index.clear()
+
+            assert len(index) == 0
+            assert index.search("developer") == []
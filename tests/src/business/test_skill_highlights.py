@@ -0,0 +1,57 @@
+import polars as pl
+import pytest
+
+from src.business.skill_highlights import CategoryHighlights, HighlightedSkill, SkillHighlights
+
+_LEVEL_LABELS = {1: "Beginner", 2: "Basic", 3: "Intermediate", 4: "Advanced", 5: "Expert"}
+
+
+class TestSkillHighlights:
+    @pytest.fixture
+    def skills(self) -> pl.DataFrame:
+        return pl.DataFrame(
+            {
+                "name": ["Go", "Python", "Docker", "Helm", "Cobol", "Rust"],
+                "level": [4, 5, 4, 5, 5, 3],
+                "last_used_year": [2025, 2026, 2024, 2019, 2026, 2026],
+                "highlighted": [False, True, True, False, False, True],
+                "category": ["Languages", "Languages", "DevOps", "DevOps", "Legacy", "Languages"],
+            }
+        )
+
+    @pytest.fixture
+    def categories(self) -> dict:
+        return {"DevOps": {"icon": "🐳"}, "Languages": {}, "Unused": {"icon": "?"}}
+
+    class TestFromTable:
+        def test_lists_highlighted_skills_best_level_first(self, skills, categories):
+            highlights = SkillHighlights.from_table(skills, categories, _LEVEL_LABELS, year=2026)
+
+            assert highlights.top_skills == (
+                HighlightedSkill(name="Python", level_label="Expert", last_used_year=2026),
+                HighlightedSkill(name="Docker", level_label="Advanced", last_used_year=2024),
+                HighlightedSkill(name="Rust", level_label="Intermediate", last_used_year=2026),
+            )
+
+        def test_lists_recent_skills_by_configured_category(self, skills, categories):
+            highlights = SkillHighlights.from_table(skills, categories, _LEVEL_LABELS, year=2026)
+
+            assert highlights.categories == (
+                CategoryHighlights(category="DevOps", icon="🐳", skills=("Docker",)),
+                CategoryHighlights(category="Languages", icon="📌", skills=("Python", "Go")),
+            )
+
+        def test_follows_calendar_year(self, skills, categories):
+            highlights = SkillHighlights.from_table(skills, categories, _LEVEL_LABELS, year=2023)
+
+            assert [c.skills for c in highlights.categories] == [("Helm", "Docker"), ("Python", "Go")]
+
+        def test_limits_skills_per_category(self, skills, categories):
+            highlights = SkillHighlights.from_table(skills, categories, _LEVEL_LABELS, year=2026, per_category=1)
+
+            assert [c.skills for c in highlights.categories] == [("Docker",), ("Python",)]
+
+        def test_handles_empty_table(self, skills, categories):
+            highlights = SkillHighlights.from_table(skills.clear(), categories, _LEVEL_LABELS, year=2026)
+
+            assert highlights == SkillHighlights(top_skills=(), categories=())
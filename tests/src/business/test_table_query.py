@@ -0,0 +1,77 @@
+import itertools
+
+import polars as pl
+import pytest
+
+from src.business.table_query import Filter, TableQuery
+
+
+def _apply_sequentially(data: pl.DataFrame, filters: list[Filter]) -> pl.DataFrame:
+    for f in filters:
+        data = data.filter(f.to_expr())
+    return data
+
+
+_FILTERS = [
+    Filter("is_equal", "in_industrial_context", True),
+    Filter("is_equal", "in_industrial_context", False),
+    Filter("is_equal", "category", "Languages"),
+    Filter("is_equal", "category", "Unknown"),
+    Filter("is_greater_or_equal", "last_used_year", 2022),
+    Filter("is_match_str", "name", "PY"),
+    Filter("is_match_str", "name", "ops"),
+]
+
+
+class TestTableQuery:
+    @pytest.fixture
+    def data(self) -> pl.DataFrame:
+        return pl.DataFrame(
+            {
+                "name": ["Python", "Docker", "PySpark", "MLOps", "Go", "Ansible", "python-dotenv"],
+                "level": [5, 4, 4, 3, 3, 2, 1],
+                "last_used_year": [2026, 2024, 2021, 2025, 2022, 2019, 2023],
+                "in_industrial_context": [True, True, False, None, True, False, None],
+                "link": ["", "https://www.docker.com", "", "", "https://go.dev", "", ""],
+                "category": ["Languages", "DevOps", "Data", "DevOps", "Languages", "DevOps", "Languages"],
+            }
+        )
+
+    @pytest.fixture
+    def query(self, data) -> TableQuery:
+        return TableQuery(data)
+
+    class TestRun:
+        @pytest.mark.parametrize(
+            "filters",
+            [list(combination) for size in range(4) for combination in itertools.combinations(_FILTERS, size)],
+        )
+        def test_matches_sequential_filtering(self, query, data, filters):
+            assert query.run(filters).equals(_apply_sequentially(data, filters))
+
+        def test_memoizes_equivalent_filters(self, query, data, mocker):
+            lazy_spy = mocker.spy(pl.DataFrame, "lazy")
+            first = query.run([_FILTERS[2], Filter("is_match_str", "name", "Py")])
+
+            second = query.run([Filter("is_match_str", "name", "pY"), _FILTERS[2], _FILTERS[2]])
+
+            assert second.equals(first)
+            assert lazy_spy.call_count == 1
+
+        def test_evicts_least_recently_used_results(self, data, mocker):
+            query = TableQuery(data, maxsize=1)
+            lazy_spy = mocker.spy(pl.DataFrame, "lazy")
+
+            query.run([_FILTERS[0]])
+            query.run([_FILTERS[1]])
+            query.run([_FILTERS[0]])
+
+            assert lazy_spy.call_count == 3
+
+        def test_returns_whole_table_without_filters(self, query, data):
+            assert query.run([]).equals(data)
+
+    class TestCompile:
+        def test_raises_for_unknown_filter_type(self):
+            with pytest.raises(RuntimeError, match="Unknown filter type"):
+                TableQuery.compile([Filter("is_between", "level", 3)])
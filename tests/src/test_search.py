@@ -0,0 +1,108 @@
+import pytest
+
+from libs.cms.documents.datasource import MarkdownDocument
+from src import search
+from src.business.search_index import SearchIndex
+from src.search import SearchEntry, SiteSearch, search_site
+
+
+def _describe(item: tuple[str, str]) -> tuple[SearchEntry, dict[str, str]]:
+    name, text = item
+    return SearchEntry(kind="Note", title=name), {"title": name, "body": text}
+
+
+def _key(item: tuple[str, str]) -> str:
+    return item[0]
+
+
+class TestSiteSearch:
+    @pytest.fixture
+    def index(self, mocker) -> SearchIndex:
+        return mocker.Mock(wraps=SearchIndex())
+
+    @pytest.fixture
+    def site_search(self, index) -> SiteSearch:
+        return SiteSearch(index)
+
+    class TestSync:
+        def test_indexes_items_of_source(self, site_search):
+            changed = site_search.sync("notes", (("a", "python"), ("b", "golang")), _key, _describe)
+
+            assert changed
+            assert site_search.search("python") == [SearchEntry(kind="Note", title="a")]
+
+        def test_skips_unchanged_source(self, site_search, index):
+            items = (("a", "python"),)
+            site_search.sync("notes", items, _key, _describe)
+            index.reset_mock()
+
+            changed = site_search.sync("notes", items, _key, _describe)
+
+            assert not changed
+            index.add.assert_not_called()
+
+        def test_indexes_only_new_or_modified_items(self, site_search, index):
+            unchanged = ("a", "python")
+            site_search.sync("notes", (unchanged, ("b", "golang")), _key, _describe)
+            index.reset_mock()
+
+            site_search.sync("notes", (unchanged, ("b", "rust"), ("c", "java")), _key, _describe)
+
+            assert [call.args[0] for call in index.add.call_args_list] == ["notes:b", "notes:c"]
+            assert site_search.search("golang") == []
+            assert site_search.search("rust") == [SearchEntry(kind="Note", title="b")]
+
+        def test_removes_deleted_items(self, site_search):
+            site_search.sync("notes", (("a", "python"), ("b", "golang")), _key, _describe)
+
+            site_search.sync("notes", (("a", "python"),), _key, _describe)
+
+            assert site_search.search("golang") == []
+
+        def test_keeps_sources_apart(self, site_search):
+            site_search.sync("notes", (("a", "python"),), _key, _describe)
+            site_search.sync("drafts", (("a", "python"),), _key, _describe)
+
+            site_search.sync("drafts", (), _key, _describe)
+
+            assert site_search.search("python") == [SearchEntry(kind="Note", title="a")]
+
+    class TestSearch:
+        def test_returns_nothing_before_sync(self, site_search):
+            assert site_search.search("python") == []
+
+        def test_limits_number_of_entries(self, site_search):
+            site_search.sync("notes", (("a", "python"), ("b", "python")), _key, _describe)
+
+            assert len(site_search.search("python", limit=1)) == 1
+
+
+class TestSearchSite:
+    @pytest.fixture
+    def illustrated_doc(self, tmp_path) -> MarkdownDocument:
+        path = tmp_path / "s3-box.md"
+        path.write_text(
+            "---\ntitle: S3 Box\n---\n"
+            '<p align="center"><img src="../assets/images/logo.png" width="200" alt="logo"></p>\n\n'
+            "A desktop client for buckets, see [the docs](https://example.com/static/docs).\n\n"
+            "[![Explorer view](../assets/images/explorer.png)](https://example.com/assets)\n",
+            encoding="utf-8",
+        )
+        return MarkdownDocument.from_metadata(path, {"title": "S3 Box"})
+
+    @pytest.fixture(autouse=True)
+    def content(self, mocker, illustrated_doc):
+        mocker.patch.object(search, "get_site_search", return_value=SiteSearch())
+        mocker.patch.object(
+            search, "load_documents", side_effect=lambda folder: [illustrated_doc] if "experiences" in folder else []
+        )
+        mocker.patch.object(search, "load_items", return_value=[])
+        mocker.patch.object(search, "get_skill_index").return_value.skills.return_value = []
+
+    def test_finds_documents_by_displayed_text(self):
+        assert [entry.title for entry in search_site("buckets")] == ["S3 Box"]
+        assert [entry.title for entry in search_site("explorer")] == ["S3 Box"]
+
+    @pytest.mark.parametrize("query", ["png", "static", "assets", "width", "align", "example"])
+    def test_ignores_image_link_and_html_markup(self, query):
+        assert search_site(query) == []
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from libs.cms.common import Skill
+from libs.cms.documents.datasource import MarkdownDocument
+from src.skills import SkillIndex, SkillLevelEnum
+
+
+class TestSkillIndex:
+    @pytest.fixture
+    def index(self) -> SkillIndex:
+        skills = pl.DataFrame(
+            {
+                "name": ["Python", "Docker", "python"],
+                "level": [5, 3, 2],
+                "last_used_year": [2026, 2024, 2020],
+                "in_industrial_context": [True, None, False],
+                "link": [None, "https://www.docker.com", None],
+                "highlighted": [True, False, False],
+                "category": ["Languages", "DevOps", "Languages"],
+            }
+        )
+        return SkillIndex(skills)
+
+    class TestGet:
+        def test_finds_skills_case_insensitively(self, index):
+            skill = index.get("PYTHON")
+
+            assert skill is not None
+            assert skill.name == "Python"
+            assert skill.level == SkillLevelEnum.EXPERT.value
+            assert skill.category == "Languages"
+
+        def test_keeps_first_row_for_duplicated_names(self, index):
+            assert index.get("python").last_used_year == 2026
+
+        def test_returns_none_for_unknown_skill(self, index):
+            assert index.get("Cobol") is None
+
+    class TestSkills:
+        def test_lists_distinct_skills_in_table_order(self, index):
+            assert [skill.name for skill in index.skills()] == ["Python", "Docker"]
+
+        def test_returns_same_tuple(self, index):
+            assert index.skills() is index.skills()
+
+    class TestForDocument:
+        def test_resolves_known_skills_by_name_in_document(self, index):
+            doc = MarkdownDocument(
+                path=Path("doc.md"),
+                title="Doc",
+                skills=(Skill(name="docker"), Skill(name="Cobol"), Skill(name="Python")),
+            )
+
+            skills = index.for_document(doc)
+
+            assert list(skills) == ["docker", "Python"]
+            assert skills["docker"].link == "https://www.docker.com"
@@ -0,0 +1,46 @@
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).parents[1]
+
+# Time spent importing the app on top of Streamlit itself
+_IMPORT_BUDGET_SECONDS = 0.3
+# Dependencies only needed by some pages, which must not be imported on start
+_LAZY_MODULES = ("polars", "yaml", "src.skills", "src.search", "libs.cms.documents", "libs.cms.data")
+
+
+@pytest.fixture(scope="module")
+def cold_import() -> tuple[set[str], dict[str, int]]:
+    """Modules loaded by a cold import of the app, and cumulative import times (µs) by module."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import json, sys, main; print(json.dumps(list(sys.modules)))"],
+        cwd=_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {
+        match.group(2): int(match.group(1))
+        for match in re.finditer(r"^import time:\s+\d+ \|\s+(\d+) \| +(\S+)$", result.stderr, re.MULTILINE)
+    }
+    return set(json.loads(result.stdout.splitlines()[-1])), times
+
+
+class TestMain:
+    class TestImport:
+        @pytest.mark.parametrize("module", _LAZY_MODULES)
+        def test_does_not_import_page_dependencies(self, cold_import, module):
+            modules, _ = cold_import
+
+            assert module not in modules
+
+        def test_stays_within_import_budget(self, cold_import):
+            _, times = cold_import
+
+            assert (times["main"] - times["streamlit"]) / 1e6 < _IMPORT_BUDGET_SECONDS